@@ -0,0 +1,51 @@
+"""
+Pooled HTTP sessions shared by the MCP servers.
+
+A plain `requests.get` (or a default `requests.Session` under load) opens
+a fresh TCP + TLS connection per call. Mounting an `HTTPAdapter` with a
+sized pool keeps connections alive across tool calls, and a small
+urllib3 retry absorbs transient connection resets.
+"""
+
+from typing import Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def pooled_session(
+    pool_connections: int = 16,
+    pool_maxsize: int = 32,
+    retries: int = 3,
+    backoff_factor: float = 0.2,
+    status_forcelist: Iterable[int] = ()
+) -> requests.Session:
+    """
+    Create a keep-alive `requests.Session` with a sized connection pool.
+
+    Args:
+        pool_connections: Number of host pools to cache
+        pool_maxsize: Max connections kept alive per host
+        retries: Retries for failed connections (and listed statuses)
+        backoff_factor: Exponential backoff between retries, in seconds
+        status_forcelist: HTTP statuses to retry; leave empty for ccxt
+            clients, which handle rate limits and exchange errors themselves
+
+    Returns:
+        Configured session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=tuple(status_forcelist),
+            raise_on_status=False,
+        ),
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
@@ -0,0 +1,22 @@
+"""
+Optional Numba JIT support for the MCP servers.
+
+Numba is not a required dependency. When it is installed, functions
+decorated with `njit` are compiled to machine code on first call (and
+cached on disk with `cache=True`). Without it, `njit` is a no-op and
+callers should fall back to their vectorized NumPy path by checking
+`NUMBA_AVAILABLE`.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit (supports bare and called forms)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
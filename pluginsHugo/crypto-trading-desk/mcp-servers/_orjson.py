@@ -0,0 +1,41 @@
+"""
+Fast JSON rendering of tool results for the MCP servers.
+
+FastMCP turns every tool result into JSON text with pydantic_core.
+orjson (installed with ccxt) encodes the float-heavy dicts these tools
+return several times faster and serializes NumPy values natively. When
+orjson is missing, `tool_serializer` is None and FastMCP keeps its
+default; results orjson rejects fall back to that default as well.
+`ORJSONResponse` does the same for the HTTP routes (e.g. /health), and
+`json_loads` parses raw response bodies (bytes) with orjson when present.
+"""
+
+import json
+
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+
+
+def _orjson_serializer(data) -> str:
+    """Render a tool result as JSON text with orjson."""
+    return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson, or stdlib json when orjson is missing."""
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, default=str, option=_ORJSON_OPTIONS)
+
+
+tool_serializer = _orjson_serializer if orjson is not None else None
+
+json_loads = orjson.loads if orjson is not None else json.loads
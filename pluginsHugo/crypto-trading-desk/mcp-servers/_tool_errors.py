@@ -0,0 +1,61 @@
+"""
+Error envelopes for MCP tools shared by the servers.
+
+A tool that raises would surface to the agent as a protocol error with no
+context. `tool_errors` turns the exception into the server's regular error
+response instead, echoing the arguments that identify the request, and
+logs the traceback under the tool module's logger.
+"""
+
+import functools
+import inspect
+import logging
+from typing import Any, Callable, Dict, Optional
+
+ENVELOPES = ('status', 'success')
+
+
+def tool_errors(*context: str, message: Optional[str] = None, envelope: str = 'status') -> Callable:
+    """
+    Return an error response instead of raising when a tool fails.
+
+    Args:
+        context: Tool argument names echoed in the response (e.g. 'symbol', 'exchange')
+        message: Optional prefix for the error text
+        envelope: Response shape. 'status' gives the named arguments, then
+            'error' and 'status': 'error'; 'success' gives 'success': False,
+            'error' and 'error_type', then the named arguments.
+    """
+    if envelope not in ENVELOPES:
+        raise ValueError(f"Unknown envelope '{envelope}'. Supported: {list(ENVELOPES)}")
+
+    def decorate(fn):
+        signature = inspect.signature(fn)
+        logger = logging.getLogger(fn.__module__)
+
+        def error_response(args, kwargs, e) -> Dict[str, Any]:
+            logger.exception("%s failed", fn.__name__)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {name: bound.arguments[name] for name in context}
+            error = f'{message}: {str(e)}' if message else str(e)
+            if envelope == 'success':
+                return {'success': False, 'error': error, 'error_type': type(e).__name__, **arguments}
+            return {**arguments, 'error': error, 'status': 'error'}
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                try:
+                    return await fn(*args, **kwargs)
+                except Exception as e:
+                    return error_response(args, kwargs, e)
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                try:
+                    return fn(*args, **kwargs)
+                except Exception as e:
+                    return error_response(args, kwargs, e)
+        return wrapper
+    return decorate
@@ -0,0 +1,133 @@
+"""
+Thread-safe in-process TTL cache shared by the MCP servers.
+
+Agents often call several tools for the same market within a few
+seconds; caching the raw exchange responses briefly lets those calls
+share one network round trip.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Mapping whose entries expire `ttl` seconds after they were stored."""
+
+    def __init__(self, ttl: float, maxsize: int = 256):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None, ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for `key`, or `default` if missing or expired.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+            ttl: Optional max age overriding the cache-wide ttl for this lookup
+        """
+        max_age = self.ttl if ttl is None else ttl
+        with self._lock:
+            entry = self._data.get(key)
+        if entry is None or time.monotonic() - entry[0] >= max_age:
+            return default
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` under `key`, evicting expired and oldest entries."""
+        now = time.monotonic()
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (now, value)
+            if len(self._data) > self.maxsize:
+                expired = [k for k, (stored, _) in self._data.items() if now - stored >= self.ttl]
+                for k in expired:
+                    del self._data[k]
+                while len(self._data) > self.maxsize:
+                    del self._data[next(iter(self._data))]
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """
+        Return the cached value for `key`, computing it with `factory()` on a miss.
+
+        The factory runs outside the lock, so a slow network call never blocks
+        lookups for other keys.
+        """
+        value = self.get(key, _MISSING, ttl)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+_MISSING = object()
+
+
+def _freeze(value: Any) -> Hashable:
+    """Hashable form of a call argument (lists become tuples)."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+def ttl_memoize(ttl: float, maxsize: int = 256,
+                ttl_for: Optional[Callable[[Dict[str, Any]], float]] = None) -> Callable:
+    """
+    Cache a tool's results per call arguments for `ttl` seconds.
+
+    Arguments are bound to the signature with defaults applied, so
+    positional and keyword calls share one entry. Error responses
+    ({'status': 'error', ...}) are not cached. Works on sync and async
+    functions; the TTLCache is exposed as `wrapper.cache`.
+
+    Args:
+        ttl: Max age of a cached result in seconds
+        maxsize: Max number of cached argument combinations
+        ttl_for: Optional function of the bound arguments returning a
+            shorter max age for that call (e.g. based on the timeframe)
+    """
+    def decorate(fn):
+        signature = inspect.signature(fn)
+        cache = TTLCache(ttl=ttl, maxsize=maxsize)
+
+        def lookup(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple((name, _freeze(value)) for name, value in bound.arguments.items())
+            max_age = ttl_for(bound.arguments) if ttl_for is not None else None
+            return key, cache.get(key, _MISSING, max_age)
+
+        def store(key, result):
+            if not (isinstance(result, dict) and result.get('status') == 'error'):
+                cache.set(key, result)
+            return result
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key, result = lookup(args, kwargs)
+                if result is not _MISSING:
+                    return result
+                return store(key, await fn(*args, **kwargs))
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key, result = lookup(args, kwargs)
+                if result is not _MISSING:
+                    return result
+                return store(key, fn(*args, **kwargs))
+        wrapper.cache = cache
+        return wrapper
+    return decorate
@@ -4,7 +4,7 @@ Crypto Advanced Indicators MCP Server
 
 Provides advanced technical indicators beyond the basic server.
 
-8 Tools:
+9 Tools:
 1. calculate_obv - On-Balance Volume (cumulative volume)
 2. calculate_mfi - Money Flow Index (RSI with volume)
 3. calculate_adx - Average Directional Index (trend strength)
@@ -13,25 +13,31 @@ Provides advanced technical indicators beyond the basic server.
 6. calculate_pivot_points - Classic Pivots (R1, R2, S1, S2)
 7. calculate_williams_r - Williams %R (momentum)
 8. detect_divergences - Detect bullish/bearish divergences
+9. calculate_adx_batch - ADX for a basket of symbols in one call
 """
 
+import asyncio
+import functools
+import inspect
 import ccxt
+import ccxt.async_support as ccxt_async
 from fastmcp import FastMCP
-from typing import Dict, List, Any, Optional
-import pandas as pd
+from typing import Dict, List, Any, Callable
 import numpy as np
-from datetime import datetime, timedelta
+from numpy.lib.stride_tricks import sliding_window_view
 import logging
+from contextlib import asynccontextmanager
 
 from validators import validate_symbol, validate_positive_int, validate_timeframe
+from _njit import njit, prange, NUMBA_AVAILABLE
+from _ttl_cache import TTLCache
+from _http_session import pooled_session
 
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-mcp = FastMCP("crypto-advanced-indicators")
-
-# Reliable exchange
-EXCHANGE = ccxt.binance()
+# Reliable exchange, on a keep-alive connection pool so repeated fetches
+# skip the TCP/TLS handshake
+EXCHANGE = ccxt.binance({'enableRateLimit': True, 'session': pooled_session()})
 
 # Indicator thresholds
 MFI_OVERBOUGHT = 80
@@ -42,20 +48,631 @@ ADX_WEAK = 20
 WILLIAMS_OVERBOUGHT = -20
 WILLIAMS_OVERSOLD = -80
 VWAP_EXTREME_STD = 2  # Standard deviations for extreme zones
+TREND_LOOKBACK = 20  # Bars used for OBV/price trend slopes
+ICHIMOKU_TENKAN = 9
+ICHIMOKU_KIJUN = 26
+ICHIMOKU_SENKOU_B = 52
+ICHIMOKU_DISPLACEMENT = 26
+
+OHLCV_COLUMNS = ('timestamp', 'open', 'high', 'low', 'close', 'volume')
+
+# Candles are reused for a quarter of a bar, but never longer than this
+OHLCV_CACHE_MAX_TTL = 60  # seconds
+
+# Max concurrent requests when fetching several symbols at once
+OHLCV_FETCH_CONCURRENCY = 8
+# Max symbols per batch indicator call
+BATCH_MAX_SYMBOLS = 50
+
+_OHLCV_CACHE = TTLCache(ttl=OHLCV_CACHE_MAX_TTL)
+
+# Bar offsets centered on zero, so the regression slope reduces to one dot product
+_TREND_X = np.arange(TREND_LOOKBACK) - (TREND_LOOKBACK - 1) / 2
+_TREND_X_SS = float(_TREND_X @ _TREND_X)
+
+# Async client for multi-symbol fetches, created on first use so it binds
+# to the server's event loop
+_async_exchange = None
+
+
+def _get_async_exchange():
+    """Helper: Lazily create the shared async Binance client."""
+    global _async_exchange
+    if _async_exchange is None:
+        _async_exchange = ccxt_async.binance({'enableRateLimit': True})
+    return _async_exchange
+
+
+@asynccontextmanager
+async def indicators_lifespan(server):
+    """Warm the Numba kernels; close the async Binance client on shutdown, if a batch call created it."""
+    global _async_exchange
+    if NUMBA_AVAILABLE:
+        # JIT cost at startup, not on the first request. Not in asyncio.to_thread:
+        # the parallel ADX kernel would start Numba's TBB pool on a worker
+        # thread, which hangs interpreter exit
+        warm_kernels()
+    try:
+        yield
+    finally:
+        exchange, _async_exchange = _async_exchange, None
+        if exchange is not None:
+            await exchange.close()
+
+
+# Initialize MCP server
+mcp = FastMCP("crypto-advanced-indicators", lifespan=indicators_lifespan)
+
+
+def _ohlcv_ttl(timeframe: str) -> float:
+    """Helper: Cache lifetime for candles of a timeframe."""
+    return min(EXCHANGE.parse_timeframe(timeframe) / 4, OHLCV_CACHE_MAX_TTL)
+
+
+def _ohlcv_columns(ohlcv: List[list]) -> Dict[str, np.ndarray]:
+    """
+    Helper: Convert ccxt OHLCV rows into read-only contiguous columns.
+
+    Timestamps are int64 milliseconds. Prices and volumes stay float64:
+    float32 keeps only ~7 significant digits, which cannot hold prices
+    like 67123.45 to the cent that the tools report. An empty response
+    gives zero-length columns.
+    """
+    rows = np.asarray(ohlcv, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+    columns = np.ascontiguousarray(rows.T)
+    timestamps = columns[0].astype(np.int64)
+    columns.flags.writeable = False
+    timestamps.flags.writeable = False
+    return {'timestamp': timestamps, **dict(zip(OHLCV_COLUMNS[1:], columns[1:]))}
+
+
+def _fetch_ohlcv(symbol: str, timeframe: str = "1h", limit: int = 100) -> Dict[str, np.ndarray]:
+    """
+    Helper: Fetch OHLCV data as one contiguous float64 array per column.
+
+    Responses are cached briefly per (symbol, timeframe, limit), so tools
+    called back to back for the same market share one exchange request.
+    The returned arrays are read-only because they may be shared.
+    """
+    def fetch() -> Dict[str, np.ndarray]:
+        formatted_symbol = f"{symbol}/USDT"
+        return _ohlcv_columns(EXCHANGE.fetch_ohlcv(formatted_symbol, timeframe, limit=limit))
+
+    return _OHLCV_CACHE.get_or_set((symbol, timeframe, limit), fetch, ttl=_ohlcv_ttl(timeframe))
+
+
+def _derived(ohlcv: Dict[str, np.ndarray], name: str, compute: Callable[[], np.ndarray]) -> np.ndarray:
+    """
+    Helper: Memoize a parameter-free series on a fetched OHLCV set.
+
+    The OHLCV dict is shared through the cache, so per-bar series such as
+    the typical price or OBV are computed once per fetch and reused by
+    later calls (and other tools) until the candles are refreshed.
+    """
+    series = ohlcv.get(name)
+    if series is None:
+        series = compute()
+        series.flags.writeable = False
+        ohlcv[name] = series
+    return series
+
+
+def _f2(value) -> float:
+    """Helper: NumPy scalar to a Python float rounded to 2 decimals."""
+    return round(float(value), 2)
+
+
+def _typical_price(ohlcv: Dict[str, np.ndarray]) -> np.ndarray:
+    """Helper: (high + low + close) / 3 per bar."""
+    return _derived(ohlcv, 'typical_price', lambda: (ohlcv['high'] + ohlcv['low'] + ohlcv['close']) / 3)
+
+
+def _money_flow(ohlcv: Dict[str, np.ndarray]) -> np.ndarray:
+    """Helper: Typical price x volume per bar."""
+    return _derived(ohlcv, 'money_flow', lambda: _typical_price(ohlcv) * ohlcv['volume'])
+
+
+def _rolling(values: np.ndarray, window: int, reduce: Callable = np.sum) -> np.ndarray:
+    """
+    Helper: Apply `reduce` (np.sum, np.max, np.min, ...) over each trailing
+    `window`-bar window. Bars before the first full window are NaN.
+    """
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] >= window:
+        out[window - 1:] = reduce(sliding_window_view(values, window), axis=1)
+    return out
+
+
+def _vwap_stats(ohlcv: Dict[str, np.ndarray]):
+    """Helper: Volume-weighted mean and variance of the typical price."""
+    typical_price = _typical_price(ohlcv)
+    volume = ohlcv['volume']
+    if NUMBA_AVAILABLE:
+        return _weighted_welford_kernel(typical_price, volume)
+    total_volume = volume.sum()
+    vwap = _money_flow(ohlcv).sum() / total_volume
+    variance = ((typical_price - vwap) ** 2 * volume).sum() / total_volume
+    return vwap, variance
+
+
+def _rolling_max(values: np.ndarray, window: int) -> np.ndarray:
+    """Helper: Trailing `window`-bar maximum per bar (NaN until the window is full)."""
+    if NUMBA_AVAILABLE:
+        return _rolling_extreme_kernel(values, window, True)
+    return _rolling(values, window, np.max)
+
+
+def _rolling_min(values: np.ndarray, window: int) -> np.ndarray:
+    """Helper: Trailing `window`-bar minimum per bar (NaN until the window is full)."""
+    if NUMBA_AVAILABLE:
+        return _rolling_extreme_kernel(values, window, False)
+    return _rolling(values, window, np.min)
+
+
+def _trend_slope(values: np.ndarray) -> float:
+    """
+    Helper: Least-squares slope of the last TREND_LOOKBACK values.
+
+    Closed form of np.polyfit(x, y, 1)[0]: with x centered on zero,
+    slope = sum(x * y) / sum(x * x).
+    """
+    recent = values[-TREND_LOOKBACK:]
+    if recent.shape[0] == TREND_LOOKBACK:
+        return float(_TREND_X @ recent) / _TREND_X_SS
+    if recent.shape[0] < 2:
+        return 0.0
+    x = np.arange(recent.shape[0]) - (recent.shape[0] - 1) / 2
+    return float(x @ recent) / float(x @ x)
+
+
+def _rsi(close: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    Helper: RSI from simple moving averages of gains and losses (the same
+    definition as the technical analysis server). A zero average loss
+    gives 100; the first period - 1 bars are NaN.
+    """
+    delta = np.diff(close, prepend=np.nan)
+    avg_gain = _rolling(np.where(delta > 0, delta, 0.0), period) / period
+    avg_loss = _rolling(np.where(delta < 0, -delta, 0.0), period) / period
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def _two_extremes(values: np.ndarray, largest: bool = True):
+    """
+    Helper: Positions of the two largest (or smallest) values.
+
+    Same order as Series.nlargest(2) / nsmallest(2), with the earlier bar
+    winning ties, in two O(N) scans instead of a sort.
+    """
+    pick = np.argmax if largest else np.argmin
+    first = int(pick(values))
+    rest = values.copy()
+    rest[first] = -np.inf if largest else np.inf
+    return first, int(pick(rest))
+
+
+def _shift(values: np.ndarray, bars: int) -> np.ndarray:
+    """Helper: Shift a series forward by `bars`, filling the gap with NaN."""
+    out = np.full(values.shape[0], np.nan)
+    if values.shape[0] > bars:
+        out[bars:] = values[:values.shape[0] - bars]
+    return out
+
+
+async def _fetch_ohlcv_many(
+    symbols: List[str],
+    timeframe: str = "1h",
+    limit: int = 100
+) -> Dict[str, Any]:
+    """
+    Helper: Fetch OHLCV for several symbols concurrently.
+
+    Cached symbols are served immediately; the rest are requested in
+    parallel (at most OHLCV_FETCH_CONCURRENCY at a time) and stored in the
+    same cache used by _fetch_ohlcv.
+
+    Returns:
+        Mapping of symbol to its column arrays, or to the exception raised
+        while fetching it, so one bad symbol does not fail the batch
+    """
+    exchange = _get_async_exchange()
+    semaphore = asyncio.Semaphore(OHLCV_FETCH_CONCURRENCY)
+    ttl = _ohlcv_ttl(timeframe)
+
+    async def fetch_one(symbol: str) -> Dict[str, np.ndarray]:
+        key = (symbol, timeframe, limit)
+        cached = _OHLCV_CACHE.get(key, ttl=ttl)
+        if cached is not None:
+            return cached
+        async with semaphore:
+            ohlcv = await exchange.fetch_ohlcv(f"{symbol}/USDT", timeframe, limit=limit)
+        columns = _ohlcv_columns(ohlcv)
+        _OHLCV_CACHE.set(key, columns)
+        return columns
+
+    results = await asyncio.gather(*(fetch_one(s) for s in symbols), return_exceptions=True)
+    return dict(zip(symbols, results))
+
+
+@njit(cache=True)
+def _obv_kernel(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """Numba kernel: running OBV total in a single pass."""
+    obv = np.empty_like(volume)
+    obv[0] = 0.0
+    for i in range(1, close.shape[0]):
+        if close[i] > close[i - 1]:
+            obv[i] = obv[i - 1] + volume[i]
+        elif close[i] < close[i - 1]:
+            obv[i] = obv[i - 1] - volume[i]
+        else:
+            obv[i] = obv[i - 1]
+    return obv
+
 
+@njit(cache=True)
+def _money_flow_kernel(typical_price: np.ndarray, money_flow: np.ndarray):
+    """Numba kernel: split raw money flow into positive and negative flow."""
+    positive = np.zeros_like(money_flow)
+    negative = np.zeros_like(money_flow)
+    for i in range(1, typical_price.shape[0]):
+        if typical_price[i] > typical_price[i - 1]:
+            positive[i] = money_flow[i]
+        elif typical_price[i] < typical_price[i - 1]:
+            negative[i] = money_flow[i]
+    return positive, negative
 
-def _fetch_ohlcv(symbol: str, timeframe: str = "1h", limit: int = 100):
-    """Helper: Fetch OHLCV data."""
-    formatted_symbol = f"{symbol}/USDT"
-    ohlcv = EXCHANGE.fetch_ohlcv(formatted_symbol, timeframe, limit=limit)
 
-    df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-    return df
+@njit(cache=True)
+def _rolling_extreme_kernel(values: np.ndarray, window: int, find_max: bool) -> np.ndarray:
+    """
+    Numba kernel: trailing rolling max/min in O(N) with a monotonic deque.
+
+    The deque holds indices whose values are strictly better than every
+    later index still in the window, so its head is the current extreme.
+    Each index is pushed and popped at most once, whatever the window.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    deque = np.empty(n, np.int64)
+    head = 0
+    tail = 0
+    for i in range(n):
+        if head < tail and deque[head] <= i - window:
+            head += 1
+        if find_max:
+            while tail > head and values[deque[tail - 1]] <= values[i]:
+                tail -= 1
+        else:
+            while tail > head and values[deque[tail - 1]] >= values[i]:
+                tail -= 1
+        deque[tail] = i
+        tail += 1
+        if i >= window - 1:
+            out[i] = values[deque[head]]
+    return out
+
+
+@njit(cache=True)
+def _weighted_welford_kernel(values: np.ndarray, weights: np.ndarray):
+    """
+    Numba kernel: weighted mean and variance in one pass (West's update of
+    Welford's algorithm), without the cancellation of sum(w*x^2) - mean^2.
+    """
+    total_weight = 0.0
+    mean = 0.0
+    sq_dev = 0.0
+    for i in range(values.shape[0]):
+        weight = weights[i]
+        if weight == 0.0:
+            continue
+        total_weight += weight
+        delta = values[i] - mean
+        mean += delta * weight / total_weight
+        sq_dev += weight * delta * (values[i] - mean)
+    if total_weight == 0.0:
+        return np.nan, np.nan
+    return mean, sq_dev / total_weight
+
+
+@njit(cache=True, inline='always')
+def _deque_push(values, i, window, deque, slot, heads, tails, find_max):
+    """Numba helper: advance one monotonic deque (see _rolling_extreme_kernel) to bar i."""
+    head = heads[slot]
+    tail = tails[slot]
+    if head < tail and deque[slot, head] <= i - window:
+        head += 1
+    if find_max:
+        while tail > head and values[deque[slot, tail - 1]] <= values[i]:
+            tail -= 1
+    else:
+        while tail > head and values[deque[slot, tail - 1]] >= values[i]:
+            tail -= 1
+    deque[slot, tail] = i
+    heads[slot] = head
+    tails[slot] = tail + 1
+
+
+@njit(cache=True)
+def _ichimoku_9_26_52_kernel(high: np.ndarray, low: np.ndarray):
+    """
+    Numba kernel: Tenkan, Kijun and the (unshifted) Senkou B midpoint for the
+    standard 9/26/52 windows, in one pass over six monotonic deques.
+
+    The window sizes are literals so the compiler can specialize every
+    deque update instead of threading them through as runtime arguments.
+    """
+    n = high.shape[0]
+    tenkan = np.full(n, np.nan)
+    kijun = np.full(n, np.nan)
+    senkou_b = np.full(n, np.nan)
+    deque = np.empty((6, n), np.int64)
+    heads = np.zeros(6, np.int64)
+    tails = np.zeros(6, np.int64)
+    for i in range(n):
+        _deque_push(high, i, 9, deque, 0, heads, tails, True)
+        _deque_push(low, i, 9, deque, 1, heads, tails, False)
+        _deque_push(high, i, 26, deque, 2, heads, tails, True)
+        _deque_push(low, i, 26, deque, 3, heads, tails, False)
+        _deque_push(high, i, 52, deque, 4, heads, tails, True)
+        _deque_push(low, i, 52, deque, 5, heads, tails, False)
+        if i >= 8:
+            tenkan[i] = (high[deque[0, heads[0]]] + low[deque[1, heads[1]]]) / 2
+        if i >= 25:
+            kijun[i] = (high[deque[2, heads[2]]] + low[deque[3, heads[3]]]) / 2
+        if i >= 51:
+            senkou_b[i] = (high[deque[4, heads[4]]] + low[deque[5, heads[5]]]) / 2
+    return tenkan, kijun, senkou_b
+
+
+# Specialized Ichimoku kernels keyed by (tenkan, kijun, senkou B) windows
+_ICHIMOKU_KERNELS = {(9, 26, 52): _ichimoku_9_26_52_kernel}
+
+
+@njit(cache=True, parallel=True, error_model='numpy')
+def _adx_batch_kernel(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                      lengths: np.ndarray, period: int) -> np.ndarray:
+    """
+    Numba kernel: latest ADX, +DI and -DI for each row, rows in parallel.
+
+    Row s holds lengths[s] bars, left-aligned. Mirrors _adx, including
+    which bars are smoothed and when results are NaN.
+    """
+    count = high.shape[0]
+    out = np.full((count, 3), np.nan)
+    tail = 2 * period - 1
+    for s in prange(count):
+        n = lengths[s]
+        start = max(n - tail, 0)
+        m = n - start
+        if m < period:
+            continue
+        tr = np.empty(m)
+        plus_dm = np.empty(m)
+        minus_dm = np.empty(m)
+        for j in range(m):
+            i = start + j
+            if i == 0:
+                tr[j] = high[s, i] - low[s, i]
+                plus_dm[j] = 0.0
+                minus_dm[j] = 0.0
+                continue
+            prev_close = close[s, i - 1]
+            tr[j] = max(high[s, i] - low[s, i],
+                        abs(high[s, i] - prev_close),
+                        abs(low[s, i] - prev_close))
+            up_move = high[s, i] - high[s, i - 1]
+            down_move = low[s, i - 1] - low[s, i]
+            plus_dm[j] = up_move if up_move > down_move and up_move > 0 else 0.0
+            minus_dm[j] = down_move if down_move > up_move and down_move > 0 else 0.0
+
+        dx_sum = 0.0
+        for j in range(period - 1, m):
+            tr_smooth = 0.0
+            plus_smooth = 0.0
+            minus_smooth = 0.0
+            for k in range(j - period + 1, j + 1):
+                tr_smooth += tr[k]
+                plus_smooth += plus_dm[k]
+                minus_smooth += minus_dm[k]
+            dx_sum += 100 * abs(plus_smooth - minus_smooth) / (plus_smooth + minus_smooth)
+            if j == m - 1:
+                out[s, 1] = 100 * (plus_smooth / tr_smooth)
+                out[s, 2] = 100 * (minus_smooth / tr_smooth)
+        if m == tail:
+            out[s, 0] = dx_sum / period
+    return out
+
+
+def _obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """Helper: OBV series (+volume on up closes, -volume on down closes, 0 if flat)."""
+    if NUMBA_AVAILABLE:
+        return _obv_kernel(close, volume)
+    direction = np.sign(np.diff(close, prepend=close[0]))
+    return np.cumsum(direction * volume)
+
+
+def _money_flow_split(typical_price: np.ndarray, money_flow: np.ndarray):
+    """Helper: Positive/negative money flow (flat typical price counts as neither)."""
+    if NUMBA_AVAILABLE:
+        return _money_flow_kernel(typical_price, money_flow)
+    tp_change = np.diff(typical_price, prepend=np.nan)
+    return (np.where(tp_change > 0, money_flow, 0.0),
+            np.where(tp_change < 0, money_flow, 0.0))
+
+
+def _adx(high: np.ndarray, low: np.ndarray, close: np.ndarray, period: int):
+    """Helper: Latest ADX, +DI and -DI (NaN when there are too few bars)."""
+    # True Range (first bar has no previous close, so it falls back to high - low)
+    prev_close = np.concatenate(([np.nan], close[:-1]))
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+    # +DM and -DM
+    up_move = np.diff(high, prepend=np.nan)
+    down_move = -np.diff(low, prepend=np.nan)
+
+    plus_dm = np.where((up_move > down_move) & (up_move > 0), up_move, 0)
+    minus_dm = np.where((down_move > up_move) & (down_move > 0), down_move, 0)
+
+    # Smoothed TR, +DM, -DM (only the last `period` DX values feed the ADX,
+    # so only the bars behind them need smoothing)
+    tail = 2 * period - 1
+    tr_smooth = _rolling(tr[-tail:], period)
+    plus_dm_smooth = _rolling(plus_dm[-tail:], period)
+    minus_dm_smooth = _rolling(minus_dm[-tail:], period)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # DX = 100 * |+DI - -DI| / (+DI + -DI); the shared 100 / TR factor of
+        # both DIs cancels, so DX comes straight from the smoothed DMs
+        dx = 100 * np.abs(plus_dm_smooth - minus_dm_smooth) / (plus_dm_smooth + minus_dm_smooth)
+
+        # +DI and -DI (only the latest bar is reported)
+        current_plus_di = 100 * (plus_dm_smooth[-1] / tr_smooth[-1])
+        current_minus_di = 100 * (minus_dm_smooth[-1] / tr_smooth[-1])
+
+    # ADX (moving average of DX)
+    current_adx = _rolling(dx[-period:], period)[-1] / period
+    return current_adx, current_plus_di, current_minus_di
+
+
+def _adx_fields(period: int, current_adx: float, current_plus_di: float,
+                current_minus_di: float, current_price: float) -> Dict[str, Any]:
+    """Helper: ADX tool fields with the trend strength/direction reading."""
+    # Interpretation
+    if current_adx > ADX_VERY_STRONG:
+        strength = "VERY_STRONG_TREND"
+    elif current_adx > ADX_STRONG:
+        strength = "STRONG_TREND"
+    elif current_adx > ADX_WEAK:
+        strength = "WEAK_TREND"
+    else:
+        strength = "NO_TREND"
+
+    direction = "BULLISH" if current_plus_di > current_minus_di else "BEARISH"
+
+    return {
+        "period": period,
+        "current_adx": _f2(current_adx),
+        "plus_di": _f2(current_plus_di),
+        "minus_di": _f2(current_minus_di),
+        "trend_strength": strength,
+        "trend_direction": direction,
+        "interpretation": f"{strength} - {direction} trend",
+        "current_price": float(current_price),
+    }
+
+
+def _adx_many(columns: List[Dict[str, np.ndarray]], period: int) -> np.ndarray:
+    """
+    Helper: Latest ADX, +DI and -DI per OHLCV set, as an (S, 3) array.
+
+    With numba the sets are packed into padded (S, N) arrays and handled by
+    the parallel batch kernel; otherwise _adx runs once per set.
+    """
+    if not NUMBA_AVAILABLE:
+        return np.array([_adx(c['high'], c['low'], c['close'], period) for c in columns]).reshape(-1, 3)
+    lengths = np.array([c['close'].shape[0] for c in columns], dtype=np.int64)
+    width = int(lengths.max()) if columns else 0
+    packed = {name: np.zeros((len(columns), width)) for name in ('high', 'low', 'close')}
+    for row, c in enumerate(columns):
+        for name, values in packed.items():
+            values[row, :lengths[row]] = c[name]
+    return _adx_batch_kernel(packed['high'], packed['low'], packed['close'], lengths, period)
+
+
+def _ichimoku_lines(high: np.ndarray, low: np.ndarray,
+                    tenkan_period: int = ICHIMOKU_TENKAN,
+                    kijun_period: int = ICHIMOKU_KIJUN,
+                    senkou_period: int = ICHIMOKU_SENKOU_B):
+    """
+    Helper: Tenkan-sen, Kijun-sen and the unshifted Senkou B midpoint.
+
+    Uses a specialized kernel when one exists for the windows, otherwise
+    the generic rolling max/min helpers.
+    """
+    kernel = _ICHIMOKU_KERNELS.get((tenkan_period, kijun_period, senkou_period))
+    if NUMBA_AVAILABLE and kernel is not None:
+        return kernel(high, low)
+    return tuple(
+        (_rolling_max(high, window) + _rolling_min(low, window)) / 2
+        for window in (tenkan_period, kijun_period, senkou_period)
+    )
+
+
+def warm_kernels():
+    """Compile (or load from Numba's disk cache) every kernel with the array layouts the tools pass"""
+    ohlcv = _ohlcv_columns(np.ones((ICHIMOKU_SENKOU_B, len(OHLCV_COLUMNS))))  # Read-only columns
+    _obv(ohlcv['close'], ohlcv['volume'])
+    _money_flow_split(_typical_price(ohlcv), _money_flow(ohlcv))
+    _vwap_stats(ohlcv)
+    _rolling_max(ohlcv['high'], ICHIMOKU_TENKAN)
+    _rolling_min(ohlcv['low'], ICHIMOKU_TENKAN)
+    _ichimoku_lines(ohlcv['high'], ohlcv['low'])
+    _adx_many([ohlcv], 14)
+
+
+def indicator_tool(max_periods: int = 500):
+    """
+    Decorator: shared validation, data fetch and response envelope for the
+    indicator tools.
+
+    Validates `symbol`, `timeframe`, `period` (when the tool has one) and
+    `periods`, fetches OHLCV once, and calls the tool with it as `ohlcv`.
+    The tool returns only its indicator fields; they are merged into the
+    standard success envelope, and any exception becomes the standard
+    error envelope. `ohlcv` is hidden from the signature MCP exposes.
+
+    Args:
+        max_periods: Upper bound for the `periods` argument
+    """
+    def decorator(fn: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        signature = inspect.signature(fn)
+        public_signature = signature.replace(
+            parameters=[p for name, p in signature.parameters.items() if name != 'ohlcv']
+        )
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            params = public_signature.bind(*args, **kwargs)
+            params.apply_defaults()
+            params = params.arguments
+            symbol = params['symbol']
+            try:
+                params['symbol'] = symbol = validate_symbol(symbol)
+                params['timeframe'] = validate_timeframe(params['timeframe'])
+                if 'period' in params:
+                    params['period'] = validate_positive_int(params['period'], "period", max_value=100)
+                params['periods'] = validate_positive_int(params['periods'], "periods", max_value=max_periods)
+
+                ohlcv = _fetch_ohlcv(symbol, params['timeframe'], params['periods'])
+                if ohlcv['close'].shape[0] == 0:
+                    raise ValueError("No OHLCV data")
+
+                return {
+                    "success": True,
+                    "symbol": symbol,
+                    "timeframe": params['timeframe'],
+                    **fn(ohlcv, **params),
+                }
+
+            except Exception as e:
+                logger.exception("%s failed", fn.__name__)
+                return {
+                    "success": False,
+                    "error": str(e),
+                    "error_type": type(e).__name__,
+                    "symbol": symbol
+                }
+
+        wrapper.__signature__ = public_signature
+        return wrapper
+    return decorator
 
 
 @mcp.tool()
+@indicator_tool()
 def calculate_obv(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1h",
     periods: int = 100
@@ -75,70 +692,42 @@ def calculate_obv(
     Returns:
         Current OBV, trend, and divergences
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        periods = validate_positive_int(periods, "periods", max_value=500)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # Calculate OBV
-        obv = [0]
-        for i in range(1, len(df)):
-            if df['close'].iloc[i] > df['close'].iloc[i-1]:
-                obv.append(obv[-1] + df['volume'].iloc[i])
-            elif df['close'].iloc[i] < df['close'].iloc[i-1]:
-                obv.append(obv[-1] - df['volume'].iloc[i])
-            else:
-                obv.append(obv[-1])
-
-        df['obv'] = obv
-
-        # OBV trend (last 20 periods)
-        obv_recent = df['obv'].iloc[-20:]
-        obv_slope = np.polyfit(range(len(obv_recent)), obv_recent, 1)[0]
-        obv_trend = "RISING" if obv_slope > 0 else "FALLING"
-
-        # Price trend
-        price_recent = df['close'].iloc[-20:]
-        price_slope = np.polyfit(range(len(price_recent)), price_recent, 1)[0]
-        price_trend = "RISING" if price_slope > 0 else "FALLING"
-
-        # Detect divergences
-        if obv_trend == "FALLING" and price_trend == "RISING":
-            divergence = "BEARISH_DIVERGENCE"
-            interpretation = "Bearish divergence - Price rising but volume falling - Possible reversal"
-        elif obv_trend == "RISING" and price_trend == "FALLING":
-            divergence = "BULLISH_DIVERGENCE"
-            interpretation = "Bullish divergence - Price falling but volume rising - Possible bounce"
-        else:
-            divergence = "NO_DIVERGENCE"
-            interpretation = "OBV and price in sync - Trend confirmed"
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "current_obv": float(df['obv'].iloc[-1]),
-            "obv_trend": obv_trend,
-            "price_trend": price_trend,
-            "divergence": divergence,
-            "interpretation": interpretation,
-            "current_price": float(df['close'].iloc[-1]),
-        }
-
-    except Exception as e:
-        logger.exception("calculate_obv failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+    close = ohlcv['close']
+
+    # Calculate OBV
+    obv = _derived(ohlcv, 'obv', lambda: _obv(close, ohlcv['volume']))
+
+    # OBV trend (last 20 periods)
+    obv_trend = "RISING" if _trend_slope(obv) > 0 else "FALLING"
+
+    # Price trend
+    price_trend = "RISING" if _trend_slope(close) > 0 else "FALLING"
+
+    # Detect divergences
+    if obv_trend == "FALLING" and price_trend == "RISING":
+        divergence = "BEARISH_DIVERGENCE"
+        interpretation = "Bearish divergence - Price rising but volume falling - Possible reversal"
+    elif obv_trend == "RISING" and price_trend == "FALLING":
+        divergence = "BULLISH_DIVERGENCE"
+        interpretation = "Bullish divergence - Price falling but volume rising - Possible bounce"
+    else:
+        divergence = "NO_DIVERGENCE"
+        interpretation = "OBV and price in sync - Trend confirmed"
+
+    return {
+        "current_obv": float(obv[-1]),
+        "obv_trend": obv_trend,
+        "price_trend": price_trend,
+        "divergence": divergence,
+        "interpretation": interpretation,
+        "current_price": float(close[-1]),
+    }
 
 
 @mcp.tool()
+@indicator_tool()
 def calculate_mfi(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1h",
     period: int = 14,
@@ -159,90 +748,52 @@ def calculate_mfi(
     Returns:
         Current MFI with overbought/oversold signals
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        period = validate_positive_int(period, "period", max_value=100)
-        periods = validate_positive_int(periods, "periods", max_value=500)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # Typical Price
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
-
-        # Raw Money Flow
-        df['money_flow'] = df['typical_price'] * df['volume']
-
-        # Positive/Negative Money Flow
-        positive_flow = []
-        negative_flow = []
-
-        for i in range(1, len(df)):
-            if df['typical_price'].iloc[i] > df['typical_price'].iloc[i-1]:
-                positive_flow.append(df['money_flow'].iloc[i])
-                negative_flow.append(0)
-            elif df['typical_price'].iloc[i] < df['typical_price'].iloc[i-1]:
-                positive_flow.append(0)
-                negative_flow.append(df['money_flow'].iloc[i])
-            else:
-                positive_flow.append(0)
-                negative_flow.append(0)
-
-        df['positive_flow'] = [0] + positive_flow
-        df['negative_flow'] = [0] + negative_flow
-
-        # Calculate MFI
-        mfi_values = []
-        for i in range(period, len(df)):
-            pos_sum = df['positive_flow'].iloc[i-period:i].sum()
-            neg_sum = df['negative_flow'].iloc[i-period:i].sum()
-
-            if neg_sum == 0:
-                mfi_val = 100
-            else:
-                money_ratio = pos_sum / neg_sum
-                mfi_val = 100 - (100 / (1 + money_ratio))
-
-            mfi_values.append(mfi_val)
-
-        df['mfi'] = [None] * period + mfi_values
-
-        current_mfi = df['mfi'].iloc[-1]
-
-        # Signals
-        if current_mfi > MFI_OVERBOUGHT:
-            signal = "OVERBOUGHT"
-            interpretation = "Overbought - High money flow - Possible correction"
-        elif current_mfi < MFI_OVERSOLD:
-            signal = "OVERSOLD"
-            interpretation = "Oversold - Low money flow - Possible bounce"
-        else:
-            signal = "NEUTRAL"
-            interpretation = "MFI in neutral range"
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "period": period,
-            "current_mfi": round(float(current_mfi), 2),
-            "signal": signal,
-            "interpretation": interpretation,
-            "current_price": float(df['close'].iloc[-1]),
-        }
-
-    except Exception as e:
-        logger.exception("calculate_mfi failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+    close = ohlcv['close']
+
+    # Typical Price
+    typical_price = _typical_price(ohlcv)
+
+    # Raw Money Flow
+    money_flow = _money_flow(ohlcv)
+
+    # Positive/Negative Money Flow
+    positive_flow, negative_flow = _money_flow_split(typical_price, money_flow)
+
+    # Calculate MFI over the `period` bars preceding each bar
+    pos_sum = _shift(_rolling(positive_flow, period), 1)
+    neg_sum = _shift(_rolling(negative_flow, period), 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        money_ratio = pos_sum / neg_sum
+        mfi = np.where(neg_sum == 0, 100, 100 - (100 / (1 + money_ratio)))
+
+    current_mfi = mfi[-1]
+    if np.isnan(current_mfi):
+        raise ValueError(f"Insufficient data for MFI: need more than {period} bars, got {len(close)}")
+
+    # Signals
+    if current_mfi > MFI_OVERBOUGHT:
+        signal = "OVERBOUGHT"
+        interpretation = "Overbought - High money flow - Possible correction"
+    elif current_mfi < MFI_OVERSOLD:
+        signal = "OVERSOLD"
+        interpretation = "Oversold - Low money flow - Possible bounce"
+    else:
+        signal = "NEUTRAL"
+        interpretation = "MFI in neutral range"
+
+    return {
+        "period": period,
+        "current_mfi": _f2(current_mfi),
+        "signal": signal,
+        "interpretation": interpretation,
+        "current_price": float(close[-1]),
+    }
 
 
 @mcp.tool()
+@indicator_tool()
 def calculate_adx(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1h",
     period: int = 14,
@@ -263,84 +814,96 @@ def calculate_adx(
     Returns:
         ADX with +DI and -DI for trend direction
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        period = validate_positive_int(period, "period", max_value=100)
-        periods = validate_positive_int(periods, "periods", max_value=500)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # True Range
-        df['tr1'] = df['high'] - df['low']
-        df['tr2'] = abs(df['high'] - df['close'].shift())
-        df['tr3'] = abs(df['low'] - df['close'].shift())
-        df['tr'] = df[['tr1', 'tr2', 'tr3']].max(axis=1)
+    close = ohlcv['close']
+    current_adx, current_plus_di, current_minus_di = _adx(ohlcv['high'], ohlcv['low'], close, period)
+    return _adx_fields(period, current_adx, current_plus_di, current_minus_di, close[-1])
 
-        # +DM and -DM
-        df['up_move'] = df['high'] - df['high'].shift()
-        df['down_move'] = df['low'].shift() - df['low']
 
-        df['plus_dm'] = np.where((df['up_move'] > df['down_move']) & (df['up_move'] > 0), df['up_move'], 0)
-        df['minus_dm'] = np.where((df['down_move'] > df['up_move']) & (df['down_move'] > 0), df['down_move'], 0)
-
-        # Smoothed TR, +DM, -DM
-        df['tr_smooth'] = df['tr'].rolling(window=period).sum()
-        df['plus_dm_smooth'] = df['plus_dm'].rolling(window=period).sum()
-        df['minus_dm_smooth'] = df['minus_dm'].rolling(window=period).sum()
-
-        # +DI and -DI
-        df['plus_di'] = 100 * (df['plus_dm_smooth'] / df['tr_smooth'])
-        df['minus_di'] = 100 * (df['minus_dm_smooth'] / df['tr_smooth'])
-
-        # DX
-        df['dx'] = 100 * abs(df['plus_di'] - df['minus_di']) / (df['plus_di'] + df['minus_di'])
+@mcp.tool()
+async def calculate_adx_batch(
+    symbols: List[str],
+    timeframe: str = "1h",
+    period: int = 14,
+    periods: int = 100
+) -> Dict[str, Any]:
+    """
+    Calculate ADX for a basket of symbols in one call.
 
-        # ADX (moving average of DX)
-        df['adx'] = df['dx'].rolling(window=period).mean()
+    OHLCV for all symbols is fetched concurrently, then the ADX is computed
+    for every symbol together. Each entry matches calculate_adx's response.
 
-        current_adx = df['adx'].iloc[-1]
-        current_plus_di = df['plus_di'].iloc[-1]
-        current_minus_di = df['minus_di'].iloc[-1]
+    Args:
+        symbols: Symbols (e.g. ["BTC", "ETH", "SOL"], max 50)
+        timeframe: Timeframe
+        period: ADX period (default 14)
+        periods: Historical data
 
-        # Interpretation
-        if current_adx > ADX_VERY_STRONG:
-            strength = "VERY_STRONG_TREND"
-        elif current_adx > ADX_STRONG:
-            strength = "STRONG_TREND"
-        elif current_adx > ADX_WEAK:
-            strength = "WEAK_TREND"
-        else:
-            strength = "NO_TREND"
+    Returns:
+        ADX result (or error) per symbol
+    """
+    try:
+        if not isinstance(symbols, list) or not symbols:
+            raise ValueError("symbols must be a non-empty list")
+        if len(symbols) > BATCH_MAX_SYMBOLS:
+            raise ValueError(f"symbols cannot contain more than {BATCH_MAX_SYMBOLS} entries")
+        timeframe = validate_timeframe(timeframe)
+        period = validate_positive_int(period, "period", max_value=100)
+        periods = validate_positive_int(periods, "periods", max_value=500)
 
-        direction = "BULLISH" if current_plus_di > current_minus_di else "BEARISH"
+        results = {}
+        valid = []
+        for symbol in symbols:
+            try:
+                valid.append(validate_symbol(symbol))
+            except ValueError as e:
+                results[symbol] = {"success": False, "error": str(e), "error_type": type(e).__name__, "symbol": symbol}
+
+        fetched = await _fetch_ohlcv_many(list(dict.fromkeys(valid)), timeframe, periods)
+        ready = {}
+        for symbol, columns in fetched.items():
+            if isinstance(columns, Exception):
+                logger.warning("calculate_adx_batch: fetch failed for %s: %s", symbol, columns)
+                results[symbol] = {
+                    "success": False,
+                    "error": str(columns),
+                    "error_type": type(columns).__name__,
+                    "symbol": symbol
+                }
+            elif columns['close'].shape[0] == 0:
+                results[symbol] = {"success": False, "error": "No OHLCV data", "error_type": "ValueError", "symbol": symbol}
+            else:
+                ready[symbol] = columns
+
+        values = _adx_many(list(ready.values()), period)
+        for (symbol, columns), (current_adx, plus_di, minus_di) in zip(ready.items(), values):
+            results[symbol] = {
+                "success": True,
+                "symbol": symbol,
+                "timeframe": timeframe,
+                **_adx_fields(period, current_adx, plus_di, minus_di, columns['close'][-1]),
+            }
 
         return {
             "success": True,
-            "symbol": symbol,
             "timeframe": timeframe,
             "period": period,
-            "current_adx": round(float(current_adx), 2),
-            "plus_di": round(float(current_plus_di), 2),
-            "minus_di": round(float(current_minus_di), 2),
-            "trend_strength": strength,
-            "trend_direction": direction,
-            "interpretation": f"{strength} - {direction} trend",
-            "current_price": float(df['close'].iloc[-1]),
+            "count": len(results),
+            "results": results,
         }
 
     except Exception as e:
-        logger.exception("calculate_adx failed")
+        logger.exception("calculate_adx_batch failed")
         return {
             "success": False,
             "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
+            "error_type": type(e).__name__
         }
 
 
 @mcp.tool()
+@indicator_tool()
 def calculate_ichimoku(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "4h",
     periods: int = 100
@@ -363,85 +926,62 @@ def calculate_ichimoku(
     Returns:
         Complete Ichimoku with trading signals
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        periods = validate_positive_int(periods, "periods", max_value=500)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # Tenkan-sen (Conversion Line)
-        period9_high = df['high'].rolling(window=9).max()
-        period9_low = df['low'].rolling(window=9).min()
-        df['tenkan_sen'] = (period9_high + period9_low) / 2
-
-        # Kijun-sen (Base Line)
-        period26_high = df['high'].rolling(window=26).max()
-        period26_low = df['low'].rolling(window=26).min()
-        df['kijun_sen'] = (period26_high + period26_low) / 2
-
-        # Senkou Span A (Leading Span A)
-        df['senkou_span_a'] = ((df['tenkan_sen'] + df['kijun_sen']) / 2).shift(26)
-
-        # Senkou Span B (Leading Span B)
-        period52_high = df['high'].rolling(window=52).max()
-        period52_low = df['low'].rolling(window=52).min()
-        df['senkou_span_b'] = ((period52_high + period52_low) / 2).shift(26)
-
-        # Chikou Span (Lagging Span)
-        df['chikou_span'] = df['close'].shift(-26)
-
-        # Current values
-        current_price = df['close'].iloc[-1]
-        tenkan = df['tenkan_sen'].iloc[-1]
-        kijun = df['kijun_sen'].iloc[-1]
-        senkou_a = df['senkou_span_a'].iloc[-1]
-        senkou_b = df['senkou_span_b'].iloc[-1]
-
-        cloud_color = "BULLISH_CLOUD" if senkou_a > senkou_b else "BEARISH_CLOUD"
-
-        # Signals
-        signals = []
-
-        # Price vs Cloud
-        if current_price > max(senkou_a, senkou_b):
-            signals.append("Price above cloud - Bullish")
-        elif current_price < min(senkou_a, senkou_b):
-            signals.append("Price below cloud - Bearish")
-        else:
-            signals.append("Price inside cloud - Indecisive")
-
-        # TK Cross
-        if tenkan > kijun:
-            signals.append("Tenkan > Kijun - Bullish signal")
-        else:
-            signals.append("Tenkan < Kijun - Bearish signal")
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "current_price": float(current_price),
-            "tenkan_sen": round(float(tenkan), 2),
-            "kijun_sen": round(float(kijun), 2),
-            "senkou_span_a": round(float(senkou_a), 2),
-            "senkou_span_b": round(float(senkou_b), 2),
-            "cloud_color": cloud_color,
-            "signals": signals,
-        }
-
-    except Exception as e:
-        logger.exception("calculate_ichimoku failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+    high, low = ohlcv['high'], ohlcv['low']
+
+    # Tenkan-sen (Conversion Line), Kijun-sen (Base Line) and the
+    # Senkou Span B midpoint before displacement
+    tenkan_sen, kijun_sen, senkou_b_mid = _ichimoku_lines(high, low)
+
+    # Senkou Span A (Leading Span A)
+    senkou_span_a = _shift((tenkan_sen + kijun_sen) / 2, ICHIMOKU_DISPLACEMENT)
+
+    # Senkou Span B (Leading Span B)
+    senkou_span_b = _shift(senkou_b_mid, ICHIMOKU_DISPLACEMENT)
+
+    # Chikou Span (Lagging Span) is the close shifted 26 back; its latest
+    # point is always empty, so it does not feed the current signals.
+
+    # Current values
+    current_price = ohlcv['close'][-1]
+    tenkan = tenkan_sen[-1]
+    kijun = kijun_sen[-1]
+    senkou_a = senkou_span_a[-1]
+    senkou_b = senkou_span_b[-1]
+
+    cloud_color = "BULLISH_CLOUD" if senkou_a > senkou_b else "BEARISH_CLOUD"
+
+    # Signals
+    signals = []
+
+    # Price vs Cloud
+    if current_price > max(senkou_a, senkou_b):
+        signals.append("Price above cloud - Bullish")
+    elif current_price < min(senkou_a, senkou_b):
+        signals.append("Price below cloud - Bearish")
+    else:
+        signals.append("Price inside cloud - Indecisive")
+
+    # TK Cross
+    if tenkan > kijun:
+        signals.append("Tenkan > Kijun - Bullish signal")
+    else:
+        signals.append("Tenkan < Kijun - Bearish signal")
+
+    return {
+        "current_price": float(current_price),
+        "tenkan_sen": _f2(tenkan),
+        "kijun_sen": _f2(kijun),
+        "senkou_span_a": _f2(senkou_a),
+        "senkou_span_b": _f2(senkou_b),
+        "cloud_color": cloud_color,
+        "signals": signals,
+    }
 
 
 @mcp.tool()
+@indicator_tool()
 def calculate_vwap(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1h",
     periods: int = 24
@@ -462,74 +1002,49 @@ def calculate_vwap(
     Returns:
         VWAP with standard deviation bands
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        periods = validate_positive_int(periods, "periods", max_value=500)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # Typical Price
-        df['typical_price'] = (df['high'] + df['low'] + df['close']) / 3
-
-        # VWAP
-        df['tp_volume'] = df['typical_price'] * df['volume']
-        vwap = df['tp_volume'].sum() / df['volume'].sum()
-
-        # Standard deviation
-        df['vwap_dev'] = (df['typical_price'] - vwap) ** 2 * df['volume']
-        variance = df['vwap_dev'].sum() / df['volume'].sum()
-        std_dev = variance ** 0.5
-
-        # VWAP bands
-        vwap_upper_1 = vwap + std_dev
-        vwap_upper_2 = vwap + VWAP_EXTREME_STD * std_dev
-        vwap_lower_1 = vwap - std_dev
-        vwap_lower_2 = vwap - VWAP_EXTREME_STD * std_dev
-
-        current_price = df['close'].iloc[-1]
-
-        # Signals
-        if current_price > vwap_upper_2:
-            signal = "EXTREMELY_OVERBOUGHT"
-            interpretation = "Price > VWAP+2std - Extremely overbought"
-        elif current_price < vwap_lower_2:
-            signal = "EXTREMELY_OVERSOLD"
-            interpretation = "Price < VWAP-2std - Extremely oversold"
-        elif current_price > vwap:
-            signal = "BULLISH"
-            interpretation = "Price above VWAP - Buyers dominating"
-        else:
-            signal = "BEARISH"
-            interpretation = "Price below VWAP - Sellers dominating"
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "periods": periods,
-            "current_price": float(current_price),
-            "vwap": round(float(vwap), 2),
-            "vwap_upper_1": round(float(vwap_upper_1), 2),
-            "vwap_upper_2": round(float(vwap_upper_2), 2),
-            "vwap_lower_1": round(float(vwap_lower_1), 2),
-            "vwap_lower_2": round(float(vwap_lower_2), 2),
-            "signal": signal,
-            "interpretation": interpretation,
-        }
-
-    except Exception as e:
-        logger.exception("calculate_vwap failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+    # VWAP and volume-weighted standard deviation of the typical price
+    vwap, variance = _vwap_stats(ohlcv)
+    std_dev = variance ** 0.5
+
+    # VWAP bands
+    vwap_upper_1 = vwap + std_dev
+    vwap_upper_2 = vwap + VWAP_EXTREME_STD * std_dev
+    vwap_lower_1 = vwap - std_dev
+    vwap_lower_2 = vwap - VWAP_EXTREME_STD * std_dev
+
+    current_price = ohlcv['close'][-1]
+
+    # Signals
+    if current_price > vwap_upper_2:
+        signal = "EXTREMELY_OVERBOUGHT"
+        interpretation = "Price > VWAP+2std - Extremely overbought"
+    elif current_price < vwap_lower_2:
+        signal = "EXTREMELY_OVERSOLD"
+        interpretation = "Price < VWAP-2std - Extremely oversold"
+    elif current_price > vwap:
+        signal = "BULLISH"
+        interpretation = "Price above VWAP - Buyers dominating"
+    else:
+        signal = "BEARISH"
+        interpretation = "Price below VWAP - Sellers dominating"
+
+    return {
+        "periods": periods,
+        "current_price": float(current_price),
+        "vwap": _f2(vwap),
+        "vwap_upper_1": _f2(vwap_upper_1),
+        "vwap_upper_2": _f2(vwap_upper_2),
+        "vwap_lower_1": _f2(vwap_lower_1),
+        "vwap_lower_2": _f2(vwap_lower_2),
+        "signal": signal,
+        "interpretation": interpretation,
+    }
 
 
 @mcp.tool()
+@indicator_tool(max_periods=30)
 def calculate_pivot_points(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1d",
     periods: int = 2
@@ -549,77 +1064,60 @@ def calculate_pivot_points(
     Returns:
         Pivots with resistance and support levels
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        periods = validate_positive_int(periods, "periods", max_value=30)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # Use previous period data
-        high = df['high'].iloc[-2]
-        low = df['low'].iloc[-2]
-        close = df['close'].iloc[-2]
-
-        # Pivot Point
-        pivot = (high + low + close) / 3
-
-        # Resistances
-        r1 = 2 * pivot - low
-        r2 = pivot + (high - low)
-        r3 = high + 2 * (pivot - low)
-
-        # Supports
-        s1 = 2 * pivot - high
-        s2 = pivot - (high - low)
-        s3 = low - 2 * (high - pivot)
-
-        current_price = df['close'].iloc[-1]
-
-        # Find closest level
-        levels = {
-            'R3': r3, 'R2': r2, 'R1': r1,
-            'PIVOT': pivot,
-            'S1': s1, 'S2': s2, 'S3': s3
-        }
-
-        closest_level = min(levels.items(), key=lambda x: abs(x[1] - current_price))
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "current_price": float(current_price),
-            "pivot": round(float(pivot), 2),
-            "resistances": {
-                "R1": round(float(r1), 2),
-                "R2": round(float(r2), 2),
-                "R3": round(float(r3), 2),
-            },
-            "supports": {
-                "S1": round(float(s1), 2),
-                "S2": round(float(s2), 2),
-                "S3": round(float(s3), 2),
-            },
-            "closest_level": {
-                "level": closest_level[0],
-                "price": round(float(closest_level[1]), 2),
-                "distance": round(float(current_price - closest_level[1]), 2)
-            }
-        }
-
-    except Exception as e:
-        logger.exception("calculate_pivot_points failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
+    # Use previous period data
+    high = ohlcv['high'][-2]
+    low = ohlcv['low'][-2]
+    close = ohlcv['close'][-2]
+
+    # Pivot Point
+    pivot = (high + low + close) / 3
+
+    # Resistances
+    r1 = 2 * pivot - low
+    r2 = pivot + (high - low)
+    r3 = high + 2 * (pivot - low)
+
+    # Supports
+    s1 = 2 * pivot - high
+    s2 = pivot - (high - low)
+    s3 = low - 2 * (high - pivot)
+
+    current_price = ohlcv['close'][-1]
+
+    # Find closest level
+    levels = {
+        'R3': r3, 'R2': r2, 'R1': r1,
+        'PIVOT': pivot,
+        'S1': s1, 'S2': s2, 'S3': s3
+    }
+
+    closest_level = min(levels.items(), key=lambda x: abs(x[1] - current_price))
+
+    return {
+        "current_price": float(current_price),
+        "pivot": _f2(pivot),
+        "resistances": {
+            "R1": _f2(r1),
+            "R2": _f2(r2),
+            "R3": _f2(r3),
+        },
+        "supports": {
+            "S1": _f2(s1),
+            "S2": _f2(s2),
+            "S3": _f2(s3),
+        },
+        "closest_level": {
+            "level": closest_level[0],
+            "price": _f2(closest_level[1]),
+            "distance": _f2(current_price - closest_level[1])
         }
+    }
 
 
 @mcp.tool()
+@indicator_tool()
 def calculate_williams_r(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1h",
     period: int = 14,
@@ -642,56 +1140,40 @@ def calculate_williams_r(
     Returns:
         Williams %R with signals
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        period = validate_positive_int(period, "period", max_value=100)
-        periods = validate_positive_int(periods, "periods", max_value=500)
+    close = ohlcv['close']
 
-        df = _fetch_ohlcv(symbol, timeframe, periods)
+    # Calculate Williams %R
+    highest_high = _rolling_max(ohlcv['high'], period)
+    lowest_low = _rolling_min(ohlcv['low'], period)
 
-        # Calculate Williams %R
-        highest_high = df['high'].rolling(window=period).max()
-        lowest_low = df['low'].rolling(window=period).min()
+    williams_r = ((highest_high - close) / (highest_high - lowest_low)) * -100
 
-        df['williams_r'] = ((highest_high - df['close']) / (highest_high - lowest_low)) * -100
+    current_wr = williams_r[-1]
 
-        current_wr = df['williams_r'].iloc[-1]
+    # Signals
+    if current_wr > WILLIAMS_OVERBOUGHT:
+        signal = "OVERBOUGHT"
+        interpretation = "Overbought - Possible correction"
+    elif current_wr < WILLIAMS_OVERSOLD:
+        signal = "OVERSOLD"
+        interpretation = "Oversold - Possible bounce"
+    else:
+        signal = "NEUTRAL"
+        interpretation = "Williams %R in neutral range"
 
-        # Signals
-        if current_wr > WILLIAMS_OVERBOUGHT:
-            signal = "OVERBOUGHT"
-            interpretation = "Overbought - Possible correction"
-        elif current_wr < WILLIAMS_OVERSOLD:
-            signal = "OVERSOLD"
-            interpretation = "Oversold - Possible bounce"
-        else:
-            signal = "NEUTRAL"
-            interpretation = "Williams %R in neutral range"
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "period": period,
-            "current_williams_r": round(float(current_wr), 2),
-            "signal": signal,
-            "interpretation": interpretation,
-            "current_price": float(df['close'].iloc[-1]),
-        }
-
-    except Exception as e:
-        logger.exception("calculate_williams_r failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+    return {
+        "period": period,
+        "current_williams_r": _f2(current_wr),
+        "signal": signal,
+        "interpretation": interpretation,
+        "current_price": float(close[-1]),
+    }
 
 
 @mcp.tool()
+@indicator_tool()
 def detect_divergences(
+    ohlcv: Dict[str, np.ndarray],
     symbol: str = "BTC",
     timeframe: str = "1h",
     periods: int = 100
@@ -710,76 +1192,51 @@ def detect_divergences(
     Returns:
         Detected divergences with reversal signals
     """
-    try:
-        symbol = validate_symbol(symbol)
-        timeframe = validate_timeframe(timeframe)
-        periods = validate_positive_int(periods, "periods", max_value=500)
-
-        df = _fetch_ohlcv(symbol, timeframe, periods)
-
-        # Calculate RSI
-        delta = df['close'].diff()
-        gain = delta.where(delta > 0, 0).rolling(window=14).mean()
-        loss = -delta.where(delta < 0, 0).rolling(window=14).mean()
-        rs = gain / loss
-        df['rsi'] = 100 - (100 / (1 + rs))
-
-        # Find swing highs/lows (simplified - last 50 periods)
-        recent = df.iloc[-50:]
-
-        price_highs = recent['high'].nlargest(3).index.tolist()
-        price_lows = recent['low'].nsmallest(3).index.tolist()
-
-        divergences = []
-
-        # Bearish Divergence (price rising, RSI falling)
-        if len(price_highs) >= 2:
-            last_high_idx = price_highs[0]
-            prev_high_idx = price_highs[1]
-
-            if recent.loc[last_high_idx, 'high'] > recent.loc[prev_high_idx, 'high']:
-                if recent.loc[last_high_idx, 'rsi'] < recent.loc[prev_high_idx, 'rsi']:
-                    divergences.append({
-                        "type": "BEARISH_DIVERGENCE",
-                        "interpretation": "Price makes higher high, RSI makes lower high - Possible bearish reversal"
-                    })
-
-        # Bullish Divergence (price falling, RSI rising)
-        if len(price_lows) >= 2:
-            last_low_idx = price_lows[0]
-            prev_low_idx = price_lows[1]
-
-            if recent.loc[last_low_idx, 'low'] < recent.loc[prev_low_idx, 'low']:
-                if recent.loc[last_low_idx, 'rsi'] > recent.loc[prev_low_idx, 'rsi']:
-                    divergences.append({
-                        "type": "BULLISH_DIVERGENCE",
-                        "interpretation": "Price makes lower low, RSI makes higher low - Possible bullish reversal"
-                    })
-
-        if not divergences:
-            divergences.append({
-                "type": "NO_DIVERGENCE",
-                "interpretation": "No significant divergences detected"
-            })
-
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timeframe": timeframe,
-            "current_price": float(df['close'].iloc[-1]),
-            "current_rsi": round(float(df['rsi'].iloc[-1]), 2),
-            "divergences": divergences,
-        }
-
-    except Exception as e:
-        logger.exception("detect_divergences failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
-
+    close = ohlcv['close']
+
+    # Calculate RSI
+    rsi = _rsi(close, 14)
+
+    # Find swing highs/lows (simplified - last 50 periods)
+    recent_high = ohlcv['high'][-50:]
+    recent_low = ohlcv['low'][-50:]
+    recent_rsi = rsi[-50:]
+
+    divergences = []
+
+    # Bearish Divergence (price rising, RSI falling)
+    if recent_high.shape[0] >= 2:
+        last_high_idx, prev_high_idx = _two_extremes(recent_high, largest=True)
+
+        if recent_high[last_high_idx] > recent_high[prev_high_idx]:
+            if recent_rsi[last_high_idx] < recent_rsi[prev_high_idx]:
+                divergences.append({
+                    "type": "BEARISH_DIVERGENCE",
+                    "interpretation": "Price makes higher high, RSI makes lower high - Possible bearish reversal"
+                })
+
+    # Bullish Divergence (price falling, RSI rising)
+    if recent_low.shape[0] >= 2:
+        last_low_idx, prev_low_idx = _two_extremes(recent_low, largest=False)
+
+        if recent_low[last_low_idx] < recent_low[prev_low_idx]:
+            if recent_rsi[last_low_idx] > recent_rsi[prev_low_idx]:
+                divergences.append({
+                    "type": "BULLISH_DIVERGENCE",
+                    "interpretation": "Price makes lower low, RSI makes higher low - Possible bullish reversal"
+                })
+
+    if not divergences:
+        divergences.append({
+            "type": "NO_DIVERGENCE",
+            "interpretation": "No significant divergences detected"
+        })
+
+    return {
+        "current_price": float(close[-1]),
+        "current_rsi": _f2(rsi[-1]),
+        "divergences": divergences,
+    }
 
 if __name__ == "__main__":
     mcp.run()
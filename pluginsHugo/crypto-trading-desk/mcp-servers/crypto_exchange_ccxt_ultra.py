@@ -5,31 +5,49 @@ Multi-exchange data: OHLCV, orderbooks, volume analysis, liquidity, arbitrage.
 Uses CCXT with reliable exchanges only - no API keys required.
 """
 
+import asyncio
+import functools
+import heapq
+import ssl
+import aiohttp
+import certifi
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
 import ccxt
+import ccxt.async_support as ccxt_async
 import numpy as np
-import pandas as pd
-from typing import List, Dict, Optional, Union
-import json
-from datetime import datetime, timedelta
+from typing import List
+from datetime import date, datetime, timedelta
 import time
 import logging
+import threading
+from collections import Counter
+from collections.abc import Mapping
 
-from validators import validate_symbol, validate_exchange, validate_positive_int
+from _http_session import pooled_session
+from _njit import njit, NUMBA_AVAILABLE
+from _orjson import ORJSONResponse, tool_serializer
+from _tool_errors import tool_errors
+from _ttl_cache import TTLCache, ttl_memoize
 
 logger = logging.getLogger(__name__)
 
-# Initialize FastMCP server
-mcp = FastMCP("crypto-exchange-ccxt-ultra")
-
-# Initialize ONLY reliable exchanges (public APIs only)  
-EXCHANGES = {
-    'binance': ccxt.binance(),      # ⭐ EXCELLENT: 3,817 markets, 326ms
-    'kraken': ccxt.kraken(),        # ⭐ EXCELLENT: 1,156 markets, 341ms  
-    'bitfinex': ccxt.bitfinex(),    # ⭐ GOOD: 376 markets, 275ms
-    'kucoin': ccxt.kucoin(),        # ⭐ GOOD: 1,295 markets, 277ms
-    'mexc': ccxt.mexc(),            # ⭐ ACCEPTABLE: 2,994 markets, 833ms
-}
+# WebSocket frames arrive permessage-deflate compressed and aiohttp inflates
+# them; zlib-ng (installed with ccxt) does that faster than stdlib zlib
+try:
+    from zlib_ng import zlib_ng
+    aiohttp.set_zlib_backend(zlib_ng)
+except (ImportError, AttributeError):
+    pass
+
+# ONLY reliable exchanges (public APIs only)
+EXCHANGE_NAMES = [
+    'binance',      # ⭐ EXCELLENT: 3,817 markets, 326ms
+    'kraken',       # ⭐ EXCELLENT: 1,156 markets, 341ms
+    'bitfinex',     # ⭐ GOOD: 376 markets, 275ms
+    'kucoin',       # ⭐ GOOD: 1,295 markets, 277ms
+    'mexc',         # ⭐ ACCEPTABLE: 2,994 markets, 833ms
+]
 
 # REMOVED PROBLEMATIC EXCHANGES:
 # - coinbase: fetchStatus() not supported + NoneType errors
@@ -38,14 +56,221 @@ EXCHANGES = {
 # - gateio: fetchStatus() not supported
 # - okx: Too slow (49+ seconds response time)
 
-# Set all exchanges to sandbox=False and enable rate limiting
-for exchange in EXCHANGES.values():
+class LazyExchanges(Mapping):
+    """
+    Exchange clients keyed by name, each constructed on first access.
+
+    Building a ccxt client parses its whole API description, so doing it
+    for every exchange (sync, async and WebSocket) at import delayed server
+    start for exchanges a session may never touch. Iteration and `in`
+    only see the names; `loaded()` yields the clients created so far.
+    """
+
+    def __init__(self, names, factory):
+        self._names = list(names)
+        self._factory = factory
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name):
+        client = self._clients.get(name)
+        if client is None:
+            if name not in self._names:
+                raise KeyError(name)
+            # Sync clients are also reached from worker threads
+            with self._lock:
+                client = self._clients.get(name)
+                if client is None:
+                    client = self._clients[name] = self._factory(name)
+        return client
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def loaded(self):
+        """Clients constructed so far"""
+        return list(self._clients.values())
+
+# Exchanges serving the same public REST API from several hosts. The
+# fastest host is probed at startup and every ENDPOINT_PROBE_INTERVAL, then
+# used as the 'public' API URL of every client of that exchange
+PUBLIC_API_HOSTS = {
+    'binance': {
+        'hosts': ('api.binance.com', 'api1.binance.com', 'api2.binance.com', 'api3.binance.com',
+                  'api4.binance.com', 'api-gcp.binance.com', 'data-api.binance.vision'),
+        'url': 'https://{host}/api/v3',
+        'ping': 'https://{host}/api/v3/ping',
+    },
+}
+ENDPOINT_PROBE_INTERVAL = 300  # Seconds between endpoint probes
+ENDPOINT_PROBE_TIMEOUT = 2     # Seconds before a host counts as unreachable
+FASTEST_API_HOSTS = {}         # exchange name -> fastest probed host
+_PROBE_SESSION = pooled_session(pool_connections=8, pool_maxsize=2, retries=0)
+
+def use_fastest_host(exchange):
+    """Point a client's public API at the fastest probed host, if one is known"""
+    host = FASTEST_API_HOSTS.get(exchange.id)
+    if host is not None:
+        exchange.urls['api']['public'] = PUBLIC_API_HOSTS[exchange.id]['url'].format(host=host)
+
+def create_exchange(module, name):
+    """Construct a client set to sandbox=False and the shared rate limit"""
+    exchange = getattr(module, name)()
     exchange.sandbox = False
     exchange.rateLimit = 1200
+    use_fastest_host(exchange)
+    return exchange
+
+def create_sync_exchange(name):
+    """Sync client with a keep-alive connection pool, so repeated calls reuse
+    the TCP/TLS connection instead of handshaking again"""
+    exchange = create_exchange(ccxt, name)
+    exchange.session = pooled_session(pool_connections=8, pool_maxsize=16)
+    return exchange
+
+EXCHANGES = LazyExchanges(EXCHANGE_NAMES, create_sync_exchange)
+
+# One aiohttp connection pool (with a DNS cache) for every async and WebSocket
+# client. It is opened on the server's event loop by exchange_lifespan; clients
+# created without it (e.g. outside the server) fall back to their own session
+SHARED_POOL_LIMIT = 100  # Open connections across all exchanges
+DNS_CACHE_TTL = 300      # seconds
+_SHARED_SESSION = None
+
+def open_shared_session():
+    """Create the shared aiohttp session on the running event loop"""
+    global _SHARED_SESSION
+    connector = aiohttp.TCPConnector(
+        limit=SHARED_POOL_LIMIT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        ssl=ssl.create_default_context(cafile=certifi.where()),  # Same CA bundle as ccxt
+        enable_cleanup_closed=True
+    )
+    _SHARED_SESSION = aiohttp.ClientSession(connector=connector)
+
+def use_shared_session(exchange):
+    """Point an async client at the shared session; ccxt then leaves closing it to close_all()"""
+    if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+        exchange.session = _SHARED_SESSION
+        exchange.own_session = False
+    return exchange
+
+def create_async_exchange(name):
+    """Async client on the shared connection pool"""
+    return use_shared_session(create_exchange(ccxt_async, name))
+
+# Async twins of EXCHANGES, used by the tools that query every exchange at
+# once so the requests run concurrently instead of one after another
+ASYNC_EXCHANGES = LazyExchanges(EXCHANGE_NAMES, create_async_exchange)
+
+# Cap on in-flight REST requests per async exchange, so fan-out tools cannot
+# burst past per-IP limits; ccxt's own throttler still spaces the requests
+MAX_CONCURRENT_REQUESTS = 4
+EXCHANGE_SEMAPHORES = {name: asyncio.Semaphore(MAX_CONCURRENT_REQUESTS) for name in EXCHANGE_NAMES}
+
+KEEPALIVE_INTERVAL = 30  # Seconds between keep-alive pings while the server runs
+
+async def ping_exchange(exchange):
+    """Send a cheap fetch_time request so the exchange connection stays open"""
+    if not exchange.has.get('fetchTime'):
+        return
+    try:
+        if isinstance(exchange, ccxt_async.Exchange):
+            await exchange.fetch_time()
+        else:
+            await asyncio.to_thread(exchange.fetch_time)
+    except Exception as e:
+        logger.debug("Keep-alive ping to %s failed: %s", exchange.id, e)
+
+async def keepalive_loop():
+    """Ping every exchange client in use each KEEPALIVE_INTERVAL seconds"""
+    while True:
+        await asyncio.sleep(KEEPALIVE_INTERVAL)
+        await asyncio.gather(*(ping_exchange(exchange) for exchange in [*EXCHANGES.loaded(), *ASYNC_EXCHANGES.loaded()]))
+
+def create_pro_exchange(name):
+    """WebSocket client; keeps ccxt.pro's own rate limit"""
+    import ccxt.pro as ccxt_pro  # Only loaded once a book is streamed
+    exchange = getattr(ccxt_pro, name)()
+    exchange.sandbox = False
+    use_fastest_host(exchange)  # Book snapshots still come over REST
+    return use_shared_session(exchange)
+
+# WebSocket (ccxt.pro) clients, created on the first streamed request
+PRO_EXCHANGES = LazyExchanges(EXCHANGE_NAMES, create_pro_exchange)
+
+async def probe_host(ping_url):
+    """Round-trip time in seconds of a public ping request, or None if it failed"""
+    def ping():
+        start = time.perf_counter()
+        _PROBE_SESSION.get(ping_url, timeout=ENDPOINT_PROBE_TIMEOUT).raise_for_status()
+        return time.perf_counter() - start
+    try:
+        return await asyncio.to_thread(ping)
+    except Exception as e:
+        logger.debug("Endpoint probe %s failed: %s", ping_url, e)
+        return None
+
+async def select_fastest_hosts():
+    """Probe every host of PUBLIC_API_HOSTS concurrently and switch clients to the fastest"""
+    for exchange_name, endpoints in PUBLIC_API_HOSTS.items():
+        hosts = endpoints['hosts']
+        timings = await asyncio.gather(*(probe_host(endpoints['ping'].format(host=host)) for host in hosts))
+        reachable = [(timing, host) for timing, host in zip(timings, hosts) if timing is not None]
+        if not reachable:
+            continue
+        FASTEST_API_HOSTS[exchange_name] = min(reachable)[1]
+        for exchange in [*EXCHANGES.loaded(), *ASYNC_EXCHANGES.loaded(), *PRO_EXCHANGES.loaded()]:
+            if exchange.id == exchange_name:
+                use_fastest_host(exchange)
+
+async def endpoint_probe_loop():
+    """Re-select the fastest API hosts each ENDPOINT_PROBE_INTERVAL seconds"""
+    while True:
+        await select_fastest_hosts()
+        await asyncio.sleep(ENDPOINT_PROBE_INTERVAL)
+
+async def close_all():
+    """Close every exchange client and its connection pool"""
+    for stream in list(_BOOK_STREAMS.values()):
+        stream['task'].cancel()
+    await asyncio.gather(
+        *(exchange.close() for exchange in [*ASYNC_EXCHANGES.loaded(), *PRO_EXCHANGES.loaded()]),
+        return_exceptions=True
+    )
+    if _SHARED_SESSION is not None:
+        await _SHARED_SESSION.close()
+    for exchange in EXCHANGES.loaded():
+        exchange.session.close()
+    _PROBE_SESSION.close()
+
+@asynccontextmanager
+async def exchange_lifespan(server):
+    """Keep exchange connections warm and on the fastest endpoints while the server runs; close them on shutdown"""
+    open_shared_session()
+    if NUMBA_AVAILABLE:
+        await asyncio.to_thread(warm_kernels)  # JIT cost at startup, not on the first request
+    background = [asyncio.create_task(keepalive_loop()), asyncio.create_task(endpoint_probe_loop())]
+    try:
+        yield
+    finally:
+        for task in background:
+            task.cancel()
+        await close_all()
+
+# Initialize FastMCP server
+mcp = FastMCP("crypto-exchange-ccxt-ultra", lifespan=exchange_lifespan, tool_serializer=tool_serializer)
 
 # Arbitrage and liquidity thresholds
 MIN_ARBITRAGE_PROFIT_PCT = 0.1       # Minimum 0.1% profit for arbitrage
 LOW_LIQUIDITY_USD = 100_000          # Less than $100k = low liquidity warning
+MULTI_MAX_SYMBOLS = 50               # Max symbols per multi-symbol price call
 
 # Common timeframes supported by most exchanges
 TIMEFRAMES = {
@@ -66,52 +291,375 @@ TIMEFRAMES = {
     '1M': '1 month'
 }
 
-def safe_get_price_data(exchange, symbol):
-    """Safely get price data from exchange with error handling"""
+# Short-lived caches: markets change rarely and reloading them is the main
+# rate-limit burner; tickers are shared by tools called back to back
+MARKETS_CACHE_TTL = 300  # seconds
+TICKER_CACHE_TTL = 2     # seconds
+ALL_TICKERS_CACHE_TTL = 10  # seconds
+_MARKETS_CACHE = TTLCache(ttl=MARKETS_CACHE_TTL, maxsize=16)
+_TICKER_CACHE = TTLCache(ttl=TICKER_CACHE_TTL, maxsize=1024)
+_ALL_TICKERS_CACHE = TTLCache(ttl=ALL_TICKERS_CACHE_TTL, maxsize=16)
+# exchange -> (markets, summary): get_exchange_markets_info responses, valid
+# while the cached markets they were computed from are still current
+_MARKETS_INFO_CACHE = {}
+# (exchange, quote) -> (tickers, by_volume, gainers, losers): get_all_tickers
+# views of one cached tickers snapshot, shared by calls with any limit
+_QUOTE_TICKERS_CACHE = TTLCache(ttl=ALL_TICKERS_CACHE_TTL, maxsize=64)
+
+# Whole tool results for tools whose inputs are not cached above: orderbook
+# and trade analyses briefly, candle analyses for a quarter of a candle
+BOOK_RESULT_CACHE_TTL = 2    # seconds
+OHLCV_RESULT_CACHE_TTL = 60  # seconds, upper bound
+
+def ohlcv_result_ttl(arguments):
+    """Max age of a cached candle analysis: a quarter of its timeframe, capped"""
     try:
-        ticker = exchange.fetch_ticker(symbol)
-        return {
-            'price': ticker.get('last'),
-            'bid': ticker.get('bid'),
-            'ask': ticker.get('ask'),
-            'volume_24h': ticker.get('baseVolume'),
-            'change_24h': ticker.get('percentage'),
-            'timestamp': ticker.get('timestamp')
-        }
+        return min(ccxt.Exchange.parse_timeframe(arguments['timeframe']) / 4, OHLCV_RESULT_CACHE_TTL)
+    except Exception:
+        return 0  # Unknown timeframe: let the exchange report the error
+
+def cached_load_markets(exchange_name, reload=False):
+    """
+    Load markets for an exchange at most once per MARKETS_CACHE_TTL.
+
+    A fresh load is also handed to the async twin (set_markets), so it
+    never downloads the same markets itself. reload=True bypasses the cache.
+    """
+    def load():
+        exchange = EXCHANGES[exchange_name]
+        markets = exchange.load_markets(reload=True)
+        ASYNC_EXCHANGES[exchange_name].set_markets(markets, exchange.currencies)
+        return markets
+    if reload:
+        markets = load()
+        _MARKETS_CACHE.set(exchange_name, markets)
+        return markets
+    return _MARKETS_CACHE.get_or_set(exchange_name, load)
+
+def ticker_price_data(ticker):
+    """Price fields the tools report from a ccxt ticker"""
+    return {
+        'price': ticker.get('last'),
+        'bid': ticker.get('bid'),
+        'ask': ticker.get('ask'),
+        'volume_24h': ticker.get('baseVolume'),
+        'change_24h': ticker.get('percentage'),
+        'timestamp': ticker.get('timestamp')
+    }
+
+def cached_price_data(exchange_name, symbol):
+    """
+    Price data younger than TICKER_CACHE_TTL, or None.
+
+    Besides single-ticker results, a batch fetched by get_all_tickers is
+    indexed too, so cross-exchange tools called right after it need no
+    request for that exchange.
+    """
+    price_data = _TICKER_CACHE.get((exchange_name, symbol))
+    if price_data is None:
+        ticker = (_ALL_TICKERS_CACHE.get(exchange_name, ttl=TICKER_CACHE_TTL) or {}).get(symbol)
+        if ticker:
+            price_data = ticker_price_data(ticker)
+    return price_data
+
+async def safe_get_price_data(exchange, symbol):
+    """Safely get price data from an async exchange with error handling (cached for TICKER_CACHE_TTL)"""
+    key = (exchange.id, symbol)
+    price_data = cached_price_data(exchange.id, symbol)
+    if price_data is not None:
+        return price_data
+    try:
+        async with EXCHANGE_SEMAPHORES[exchange.id]:
+            ticker = await exchange.fetch_ticker(symbol)
+        price_data = ticker_price_data(ticker)
     except Exception as e:
         return {'error': str(e)}
+    _TICKER_CACHE.set(key, price_data)
+    return price_data
+
+async def safe_get_many_price_data(exchange, symbols):
+    """
+    Price data for several symbols on one async exchange, keyed by symbol.
+
+    Uncached symbols are fetched with a single fetch_tickers request when
+    the exchange supports it. If that request fails (one unknown symbol
+    rejects the whole batch) or is unsupported, each symbol is fetched on
+    its own so the valid ones still get prices.
+    """
+    results = {symbol: cached_price_data(exchange.id, symbol) for symbol in symbols}
+    missing = [symbol for symbol, price_data in results.items() if price_data is None]
+    if missing and exchange.has.get('fetchTickers'):
+        try:
+            async with EXCHANGE_SEMAPHORES[exchange.id]:
+                tickers = await exchange.fetch_tickers(missing)
+        except Exception:
+            tickers = {}
+        for symbol in missing:
+            if tickers.get(symbol):
+                results[symbol] = ticker_price_data(tickers[symbol])
+                _TICKER_CACHE.set((exchange.id, symbol), results[symbol])
+        missing = [symbol for symbol in missing if results[symbol] is None]
+    if missing:
+        fetched = await asyncio.gather(*(safe_get_price_data(exchange, symbol) for symbol in missing))
+        results.update(zip(missing, fetched))
+    return results
+
+async def gather_price_data(exchange_names, symbol):
+    """Fetch price data from several exchanges concurrently, keyed by exchange name in input order"""
+    results = await asyncio.gather(
+        *(safe_get_price_data(ASYNC_EXCHANGES[name], symbol) for name in exchange_names),
+        return_exceptions=True
+    )
+    return {
+        name: {'error': str(result)} if isinstance(result, Exception) else result
+        for name, result in zip(exchange_names, results)
+    }
+
+# Order books mirrored over WebSocket: the first request for a symbol starts
+# a watch_order_book stream, later requests read its in-memory snapshot
+BOOK_STREAM_DEPTH = 20          # Levels kept per mirrored book
+BOOK_STREAM_MAX_AGE = 10        # Seconds before a snapshot is too stale to serve
+BOOK_STREAM_IDLE_TIMEOUT = 300  # Seconds without reads before a stream is stopped
+_BOOK_STREAMS = {}              # (exchange, symbol) -> stream state
+
+# Order book depths each exchange accepts. Requests round up to the nearest
+# tier and the response is trimmed to the asked limit: the exchange never
+# sends more levels than needed, and limits outside the list are not rejected
+# (bitfinex and kucoin REST, kraken and bitfinex WebSocket raise on them).
+# Exchanges not listed take any limit.
+BOOK_LIMIT_TIERS = {
+    'binance': (5, 10, 20, 50, 100, 500, 1000, 5000),
+    'bitfinex': (1, 25, 100),
+    'kucoin': (20, 100),
+}
+BOOK_STREAM_TIERS = {
+    'kraken': (10, 25, 100, 500, 1000),
+    'bitfinex': (25, 100),
+}
+
+def book_limit_tier(tiers, exchange_name, limit):
+    """Smallest depth tier of an exchange covering `limit` (its largest tier if none does)"""
+    exchange_tiers = tiers.get(exchange_name)
+    if not exchange_tiers:
+        return limit
+    return next((tier for tier in exchange_tiers if tier >= limit), exchange_tiers[-1])
 
-def safe_get_orderbook(exchange, symbol, limit=20):
-    """Safely get orderbook data with error handling"""
+async def maintain_book(exchange_name, symbol):
+    """Mirror the top BOOK_STREAM_DEPTH levels of a book until nobody reads it"""
+    key = (exchange_name, symbol)
+    stream = _BOOK_STREAMS[key]
+    exchange = PRO_EXCHANGES[exchange_name]
     try:
-        orderbook = exchange.fetch_order_book(symbol, limit)
-        return {
-            'bids': orderbook.get('bids', [])[:limit],
-            'asks': orderbook.get('asks', [])[:limit],
-            'timestamp': orderbook.get('timestamp')
-        }
+        while time.monotonic() - stream['last_read'] < BOOK_STREAM_IDLE_TIMEOUT:
+            # ccxt.pro applies deltas to the same book object in place; keep a
+            # reference and copy only on read, so updates cost no work here
+            stream['book'] = await exchange.watch_order_book(
+                symbol, book_limit_tier(BOOK_STREAM_TIERS, exchange_name, BOOK_STREAM_DEPTH)
+            )
+            stream['received'] = time.monotonic()
+        if exchange.has.get('unWatchOrderBook'):
+            await exchange.un_watch_order_book(symbol)
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning("Order book stream %s %s stopped: %s", exchange_name, symbol, e)
+    finally:
+        if _BOOK_STREAMS.get(key) is stream:
+            del _BOOK_STREAMS[key]
+
+def streamed_orderbook(exchange_name, symbol, limit):
+    """
+    Latest mirrored snapshot of a book, or None if it is not available yet.
+
+    Starts the stream on first use, so the caller falls back to REST once
+    and subsequent calls are served from memory.
+    """
+    if limit > BOOK_STREAM_DEPTH:
+        return None
+    key = (exchange_name, symbol)
+    now = time.monotonic()
+    stream = _BOOK_STREAMS.get(key)
+    if stream is None:
+        stream = _BOOK_STREAMS[key] = {'book': None, 'received': 0.0, 'last_read': now}
+        stream['task'] = asyncio.create_task(maintain_book(exchange_name, symbol))
+        return None
+    stream['last_read'] = now
+    book = stream['book']
+    if book is None or now - stream['received'] > BOOK_STREAM_MAX_AGE:
+        return None
+    return soa_orderbook(book['bids'][:limit], book['asks'][:limit], book.get('timestamp'))
+
+async def safe_get_orderbook(exchange, symbol, limit=20):
+    """Safely get orderbook data from an async exchange, preferring the WebSocket mirror"""
+    orderbook = streamed_orderbook(exchange.id, symbol, limit)
+    if orderbook is not None:
+        return orderbook
+    try:
+        async with EXCHANGE_SEMAPHORES[exchange.id]:
+            orderbook = await exchange.fetch_order_book(symbol, book_limit_tier(BOOK_LIMIT_TIERS, exchange.id, limit))
+        return soa_orderbook(orderbook.get('bids', [])[:limit], orderbook.get('asks', [])[:limit], orderbook.get('timestamp'))
     except Exception as e:
         return {'error': str(e)}
 
-def calculate_liquidity_metrics(orderbook_data):
-    """Calculate liquidity metrics from orderbook"""
+def _utc_offset_ms(timestamp_ms):
+    """Local UTC offset in ms at an epoch-ms timestamp"""
+    local = datetime.fromtimestamp(timestamp_ms // 1000)
+    return (local - datetime(1970, 1, 1)) // timedelta(milliseconds=1) - timestamp_ms // 1000 * 1000
+
+@functools.lru_cache(maxsize=1024)
+def _quarter_hour_offset_ms(quarter_hour):
+    """Local UTC offset in ms for a quarter hour of epoch time, or None if it changes within it"""
+    start = quarter_hour * 900_000
+    offset = _utc_offset_ms(start)
+    return offset if _utc_offset_ms(start + 899_000) == offset else None
+
+@functools.lru_cache(maxsize=64)
+def _date_prefix(day):
+    """'YYYY-MM-DD' for a day counted from 1970-01-01"""
+    return (date(1970, 1, 1) + timedelta(days=day)).isoformat()
+
+def fast_iso(timestamp_ms, micros=False):
+    """
+    Local-time ISO string for an epoch-ms timestamp.
+
+    Same output as datetime.fromtimestamp(ts / 1000).strftime('%Y-%m-%dT%H:%M:%S'),
+    with '.%f' when micros is True, but built with integer math. Consecutive
+    rows share a date and UTC offset, so those lookups are cached.
+    """
+    timestamp_ms = int(timestamp_ms)
+    offset = _quarter_hour_offset_ms(timestamp_ms // 900_000)
+    if offset is None:
+        offset = _utc_offset_ms(timestamp_ms)
+    day, ms = divmod(timestamp_ms + offset, 86_400_000)
+    hours, ms = divmod(ms, 3_600_000)
+    minutes, ms = divmod(ms, 60_000)
+    seconds, ms = divmod(ms, 1000)
+    if micros:
+        return f"{_date_prefix(day)}T{hours:02d}:{minutes:02d}:{seconds:02d}.{ms * 1000:06d}"
+    return f"{_date_prefix(day)}T{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+def book_side_arrays(levels):
+    """Orderbook side as contiguous float64 (prices, amounts) arrays"""
+    count = len(levels)
+    prices = np.fromiter((level[0] for level in levels), dtype=np.float64, count=count)
+    amounts = np.fromiter((level[1] for level in levels), dtype=np.float64, count=count)
+    return prices, amounts
+
+def soa_orderbook(bids, asks, timestamp):
+    """
+    Struct-of-arrays orderbook: one price and one amount array per side.
+
+    ccxt's [[price, amount], ...] levels are converted once on arrival, so
+    every metric is a contiguous reduction; book_levels() turns a side back
+    into rows only for the JSON response.
+    """
+    bids_px, bids_qty = book_side_arrays(bids)
+    asks_px, asks_qty = book_side_arrays(asks)
+    return {
+        'bids_px': bids_px,
+        'bids_qty': bids_qty,
+        'asks_px': asks_px,
+        'asks_qty': asks_qty,
+        'timestamp': timestamp
+    }
+
+def book_levels(prices, amounts):
+    """[[price, amount], ...] rows of one orderbook side"""
+    return np.column_stack((prices, amounts)).tolist()
+
+@njit(cache=True)
+def liquidity_sums_kernel(bid_amounts, ask_amounts):
+    """Numba kernel: total and top-5 depth of both book sides in one pass each"""
+    total_bid = top5_bid = 0.0
+    for i in range(bid_amounts.shape[0]):
+        total_bid += bid_amounts[i]
+        if i < 5:
+            top5_bid += bid_amounts[i]
+    total_ask = top5_ask = 0.0
+    for i in range(ask_amounts.shape[0]):
+        total_ask += ask_amounts[i]
+        if i < 5:
+            top5_ask += ask_amounts[i]
+    return total_bid, total_ask, top5_bid, top5_ask
+
+def top_depth(prices, amounts, levels, highest_first):
+    """Amount resting at the best `levels` prices of an unsorted book side, selected in O(N)"""
+    if prices.shape[0] <= levels:
+        return float(amounts.sum())
+    best = np.argpartition(-prices if highest_first else prices, levels - 1)[:levels]
+    return float(amounts[best].sum())
+
+def market_fill_costs(prices, amounts, sizes):
+    """
+    Notional paid to fill each order size by walking a best-first book side.
+
+    Cumulative volume and notional are built once; searchsorted finds the
+    level that completes each size, which is then filled partially. Sizes
+    larger than the whole book fill only the available volume.
+    """
+    cum_qty = np.concatenate(([0.0], np.cumsum(amounts)))
+    cum_notional = np.concatenate(([0.0], np.cumsum(prices * amounts)))
+    idx = np.searchsorted(cum_qty[1:], sizes)
+    filled = idx < prices.shape[0]
+    partial = (sizes - cum_qty[idx]) * prices[np.minimum(idx, prices.shape[0] - 1)]
+    return cum_notional[idx] + np.where(filled, partial, 0.0)
+
+@njit(cache=True)
+def fill_costs_kernel(prices, amounts, sizes):
+    """Numba kernel: market_fill_costs for ascending sizes in a single walk of the book"""
+    costs = np.empty(sizes.shape[0])
+    level = 0
+    filled_qty = filled_notional = 0.0
+    for j in range(sizes.shape[0]):
+        while level < prices.shape[0] and filled_qty + amounts[level] < sizes[j]:
+            filled_qty += amounts[level]
+            filled_notional += prices[level] * amounts[level]
+            level += 1
+        if level < prices.shape[0]:
+            costs[j] = filled_notional + (sizes[j] - filled_qty) * prices[level]
+        else:
+            costs[j] = filled_notional
+    return costs
+
+def calculate_liquidity_metrics(orderbook_data, presorted=True):
+    """
+    Calculate liquidity metrics from a struct-of-arrays orderbook.
+    
+    Exchange books arrive best-price first. Pass presorted=False for sides
+    in arbitrary order (e.g. levels merged from several exchanges): the best
+    prices and top-5 depth are then selected with max/min and argpartition
+    instead of read from the front.
+    """
     if 'error' in orderbook_data:
         return {'error': orderbook_data['error']}
     
-    bids = orderbook_data.get('bids', [])
-    asks = orderbook_data.get('asks', [])
+    bid_amounts = orderbook_data['bids_qty']
+    ask_amounts = orderbook_data['asks_qty']
     
-    if not bids or not asks:
+    if not bid_amounts.size or not ask_amounts.size:
         return {'error': 'Empty orderbook'}
     
+    bid_prices = orderbook_data['bids_px']
+    ask_prices = orderbook_data['asks_px']
+    
     # Calculate metrics
-    best_bid = bids[0][0] if bids else 0
-    best_ask = asks[0][0] if asks else 0
+    best_bid = float(bid_prices[0] if presorted else bid_prices.max())
+    best_ask = float(ask_prices[0] if presorted else ask_prices.min())
     spread = best_ask - best_bid if best_bid and best_ask else 0
     spread_pct = (spread / best_ask * 100) if best_ask else 0
     
-    total_bid_volume = sum([bid[1] for bid in bids])
-    total_ask_volume = sum([ask[1] for ask in asks])
+    if not presorted:
+        total_bid_volume = float(bid_amounts.sum())
+        total_ask_volume = float(ask_amounts.sum())
+        top5_bid_depth = top_depth(bid_prices, bid_amounts, 5, highest_first=True)
+        top5_ask_depth = top_depth(ask_prices, ask_amounts, 5, highest_first=False)
+    elif NUMBA_AVAILABLE:
+        total_bid_volume, total_ask_volume, top5_bid_depth, top5_ask_depth = liquidity_sums_kernel(bid_amounts, ask_amounts)
+    else:
+        total_bid_volume = float(bid_amounts.sum())
+        total_ask_volume = float(ask_amounts.sum())
+        top5_bid_depth = float(bid_amounts[:5].sum())
+        top5_ask_depth = float(ask_amounts[:5].sum())
     
     return {
         'best_bid': best_bid,
@@ -121,13 +669,14 @@ def calculate_liquidity_metrics(orderbook_data):
         'total_bid_volume': round(total_bid_volume, 5),
         'total_ask_volume': round(total_ask_volume, 5),
         'bid_ask_ratio': round(total_bid_volume / total_ask_volume, 3) if total_ask_volume else 0,
-        'top5_bid_depth': round(sum([bid[1] for bid in bids[:5]]), 5),
-        'top5_ask_depth': round(sum([ask[1] for ask in asks[:5]]), 5),
+        'top5_bid_depth': round(top5_bid_depth, 5),
+        'top5_ask_depth': round(top5_ask_depth, 5),
         'liquidity_score': round((total_bid_volume + total_ask_volume) / 2, 2)
     }
 
 @mcp.tool()
-def get_exchange_prices(symbol: str = "BTC/USDT", exchanges: List[str] = None) -> dict:
+@tool_errors('symbol')
+async def get_exchange_prices(symbol: str = "BTC/USDT", exchanges: List[str] = None) -> dict:
     """
     Get current prices from reliable exchanges only.
     
@@ -147,16 +696,11 @@ def get_exchange_prices(symbol: str = "BTC/USDT", exchanges: List[str] = None) -
     results = {}
     errors = []
     
-    for exchange_name in exchanges:
-        exchange = EXCHANGES[exchange_name]
-        try:
-            price_data = safe_get_price_data(exchange, symbol)
-            if 'error' not in price_data:
-                results[exchange_name] = price_data
-            else:
-                errors.append(f"{exchange_name}: {price_data['error']}")
-        except Exception as e:
-            errors.append(f"{exchange_name}: {str(e)}")
+    for exchange_name, price_data in (await gather_price_data(exchanges, symbol)).items():
+        if 'error' not in price_data:
+            results[exchange_name] = price_data
+        else:
+            errors.append(f"{exchange_name}: {price_data['error']}")
     
     return {
         'symbol': symbol,
@@ -167,7 +711,60 @@ def get_exchange_prices(symbol: str = "BTC/USDT", exchanges: List[str] = None) -
     }
 
 @mcp.tool()
-def get_arbitrage_opportunities(symbol: str = "BTC/USDT") -> dict:
+@tool_errors()
+async def get_exchange_prices_multi(symbols: List[str], exchanges: List[str] = None) -> dict:
+    """
+    Get current prices for several symbols with one request per exchange.
+    
+    Args:
+        symbols: Trading pair symbols (e.g., ["BTC/USDT", "ETH/USDT"])
+        exchanges: List of exchanges to query (default: all reliable ones)
+    
+    Returns:
+        Dictionary with prices from each exchange per symbol
+    """
+    if not isinstance(symbols, list) or not symbols:
+        return {'error': 'symbols must be a non-empty list', 'status': 'error'}
+    if len(symbols) > MULTI_MAX_SYMBOLS:
+        return {'error': f'symbols cannot contain more than {MULTI_MAX_SYMBOLS} entries', 'status': 'error'}
+    
+    if exchanges is None:
+        exchanges = list(EXCHANGES.keys())
+    
+    # Filter to only available exchanges
+    exchanges = [ex for ex in exchanges if ex in EXCHANGES]
+    symbols = list(dict.fromkeys(symbols))
+    
+    per_exchange = await asyncio.gather(
+        *(safe_get_many_price_data(ASYNC_EXCHANGES[name], symbols) for name in exchanges),
+        return_exceptions=True
+    )
+    
+    results = {}
+    for symbol in symbols:
+        prices = {}
+        errors = []
+        for exchange_name, exchange_prices in zip(exchanges, per_exchange):
+            price_data = {'error': str(exchange_prices)} if isinstance(exchange_prices, Exception) else exchange_prices[symbol]
+            if 'error' not in price_data:
+                prices[exchange_name] = price_data
+            else:
+                errors.append(f"{exchange_name}: {price_data['error']}")
+        results[symbol] = {
+            'exchanges': prices,
+            'errors': errors if errors else None,
+            'total_exchanges': len(prices)
+        }
+    
+    return {
+        'symbols': results,
+        'total_symbols': len(symbols),
+        'status': 'success'
+    }
+
+@mcp.tool()
+@tool_errors('symbol', message='Arbitrage analysis failed')
+async def get_arbitrage_opportunities(symbol: str = "BTC/USDT") -> dict:
     """
     Detect arbitrage opportunities across reliable exchanges.
     
@@ -175,68 +772,60 @@ def get_arbitrage_opportunities(symbol: str = "BTC/USDT") -> dict:
         symbol: Trading pair symbol to analyze
     
     Returns:
-        Arbitrage opportunities with profit calculations
+        Every buy/sell exchange pair above MIN_ARBITRAGE_PROFIT_PCT, most profitable first
     """
-    try:
-        results = {}
-        prices = []
-        
-        for exchange_name, exchange in EXCHANGES.items():
-            try:
-                price_data = safe_get_price_data(exchange, symbol)
-                if 'error' not in price_data and price_data.get('price'):
-                    results[exchange_name] = price_data
-                    prices.append((exchange_name, price_data['price']))
-            except Exception as e:
-                continue
-        
-        if len(prices) < 2:
-            return {
-                'symbol': symbol,
-                'error': 'Not enough exchanges with valid data for arbitrage analysis',
-                'status': 'error'
-            }
-        
-        # Find arbitrage opportunities
-        prices.sort(key=lambda x: x[1])  # Sort by price
-        lowest_exchange, lowest_price = prices[0]
-        highest_exchange, highest_price = prices[-1]
-        
-        profit_usd = highest_price - lowest_price
-        profit_percentage = (profit_usd / lowest_price) * 100
-        
-        opportunities = []
-        if profit_percentage > MIN_ARBITRAGE_PROFIT_PCT:
-            opportunities.append({
-                'buy_exchange': lowest_exchange,
-                'sell_exchange': highest_exchange,
-                'buy_price': lowest_price,
-                'sell_price': highest_price,
-                'profit_usd': round(profit_usd, 2),
-                'profit_percentage': round(profit_percentage, 4)
-            })
-        
-        return {
-            'symbol': symbol,
-            'opportunities': opportunities,
-            'total_opportunities': len(opportunities),
-            'exchanges_analyzed': len(prices),
-            'price_range': {
-                'lowest': {'exchange': lowest_exchange, 'price': lowest_price},
-                'highest': {'exchange': highest_exchange, 'price': highest_price}
-            },
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    results = {}
+    prices = []
+    
+    for exchange_name, price_data in (await gather_price_data(list(EXCHANGES), symbol)).items():
+        if 'error' not in price_data and price_data.get('price'):
+            results[exchange_name] = price_data
+            prices.append((exchange_name, price_data['price']))
+    
+    if len(prices) < 2:
         return {
             'symbol': symbol,
-            'error': f'Arbitrage analysis failed: {str(e)}',
+            'error': 'Not enough exchanges with valid data for arbitrage analysis',
             'status': 'error'
         }
+    
+    prices.sort(key=lambda x: x[1])  # Sort by price
+    lowest_exchange, lowest_price = prices[0]
+    highest_exchange, highest_price = prices[-1]
+    
+    # Profit of every directed pair at once: row = buy exchange, column = sell exchange
+    px = np.fromiter((price for _, price in prices), dtype=np.float64, count=len(prices))
+    profit_pct = (px[None, :] - px[:, None]) / px[:, None] * 100
+    buy_idx, sell_idx = np.nonzero(profit_pct > MIN_ARBITRAGE_PROFIT_PCT)
+    best_first = np.argsort(-profit_pct[buy_idx, sell_idx], kind='stable')
+    
+    opportunities = []
+    for buy, sell in zip(buy_idx[best_first].tolist(), sell_idx[best_first].tolist()):
+        (buy_exchange, buy_price), (sell_exchange, sell_price) = prices[buy], prices[sell]
+        opportunities.append({
+            'buy_exchange': buy_exchange,
+            'sell_exchange': sell_exchange,
+            'buy_price': buy_price,
+            'sell_price': sell_price,
+            'profit_usd': round(sell_price - buy_price, 2),
+            'profit_percentage': round(float(profit_pct[buy, sell]), 4)
+        })
+    
+    return {
+        'symbol': symbol,
+        'opportunities': opportunities,
+        'total_opportunities': len(opportunities),
+        'exchanges_analyzed': len(prices),
+        'price_range': {
+            'lowest': {'exchange': lowest_exchange, 'price': lowest_price},
+            'highest': {'exchange': highest_exchange, 'price': highest_price}
+        },
+        'status': 'success'
+    }
 
 @mcp.tool()
-def get_orderbook_data(symbol: str = "BTC/USDT", exchange: str = "binance", limit: int = 20) -> dict:
+@tool_errors('symbol', 'exchange')
+async def get_orderbook_data(symbol: str = "BTC/USDT", exchange: str = "binance", limit: int = 20) -> dict:
     """
     Get order book data from a reliable exchange with comprehensive analysis.
     
@@ -254,39 +843,35 @@ def get_orderbook_data(symbol: str = "BTC/USDT", exchange: str = "binance", limi
             'status': 'error'
         }
     
-    exchange_obj = EXCHANGES[exchange]
+    exchange_obj = ASYNC_EXCHANGES[exchange]
     
-    try:
-        orderbook_data = safe_get_orderbook(exchange_obj, symbol, limit)
-        
-        if 'error' in orderbook_data:
-            return {
-                'symbol': symbol,
-                'exchange': exchange,
-                'error': orderbook_data['error'],
-                'status': 'error'
-            }
-        
-        analysis = calculate_liquidity_metrics(orderbook_data)
-        
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'orderbook': orderbook_data,
-            'analysis': analysis,
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    orderbook_data = await safe_get_orderbook(exchange_obj, symbol, limit)
+    
+    if 'error' in orderbook_data:
         return {
             'symbol': symbol,
             'exchange': exchange,
-            'error': str(e),
+            'error': orderbook_data['error'],
             'status': 'error'
         }
+    
+    analysis = calculate_liquidity_metrics(orderbook_data)
+    
+    return {
+        'symbol': symbol,
+        'exchange': exchange,
+        'orderbook': {
+            'bids': book_levels(orderbook_data['bids_px'], orderbook_data['bids_qty']),
+            'asks': book_levels(orderbook_data['asks_px'], orderbook_data['asks_qty']),
+            'timestamp': orderbook_data['timestamp']
+        },
+        'analysis': analysis,
+        'status': 'success'
+    }
 
 @mcp.tool()
-def get_exchange_volume(symbol: str = "BTC/USDT", exchanges: List[str] = None) -> dict:
+@tool_errors('symbol')
+async def get_exchange_volume(symbol: str = "BTC/USDT", exchanges: List[str] = None) -> dict:
     """
     Get 24h volume comparison across reliable exchanges.
     
@@ -307,30 +892,25 @@ def get_exchange_volume(symbol: str = "BTC/USDT", exchanges: List[str] = None) -
     total_volume_usd = 0
     total_volume_base = 0
     
-    for exchange_name in exchanges:
-        exchange = EXCHANGES[exchange_name]
-        try:
-            price_data = safe_get_price_data(exchange, symbol)
-            if 'error' not in price_data and price_data.get('price') and price_data.get('volume_24h'):
-                volume_base = price_data['volume_24h']
-                volume_usd = volume_base * price_data['price']
-                
-                results[exchange_name] = {
-                    'volume_base': volume_base,
-                    'volume_quote': volume_usd,
-                    'volume_usd': volume_usd,
-                    'price': price_data['price'],
-                    'trades_count': 0,  # Not available in ticker
-                    'market_share_pct': 0  # Will be calculated later
-                }
-                
-                total_volume_usd += volume_usd
-                total_volume_base += volume_base
-            else:
-                error_msg = price_data.get('error', 'No volume data available')
-                errors.append(f"{exchange_name}: {error_msg}")
-        except Exception as e:
-            errors.append(f"{exchange_name}: {str(e)}")
+    for exchange_name, price_data in (await gather_price_data(exchanges, symbol)).items():
+        if 'error' not in price_data and price_data.get('price') and price_data.get('volume_24h'):
+            volume_base = price_data['volume_24h']
+            volume_usd = volume_base * price_data['price']
+            
+            results[exchange_name] = {
+                'volume_base': volume_base,
+                'volume_quote': volume_usd,
+                'volume_usd': volume_usd,
+                'price': price_data['price'],
+                'trades_count': 0,  # Not available in ticker
+                'market_share_pct': 0  # Will be calculated later
+            }
+            
+            total_volume_usd += volume_usd
+            total_volume_base += volume_base
+        else:
+            error_msg = price_data.get('error', 'No volume data available')
+            errors.append(f"{exchange_name}: {error_msg}")
     
     # Calculate market share
     for exchange_name in results:
@@ -365,6 +945,7 @@ def get_exchange_volume(symbol: str = "BTC/USDT", exchanges: List[str] = None) -
     }
 
 @mcp.tool()
+@tool_errors('exchange')
 def get_trading_pairs(exchange: str = "binance") -> dict:
     """
     Get all available trading pairs for a reliable exchange.
@@ -381,57 +962,49 @@ def get_trading_pairs(exchange: str = "binance") -> dict:
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        markets = exchange_obj.load_markets()
-        
-        # Organize pairs by quote currency
-        pairs_by_quote = {}
-        for symbol, market in markets.items():
-            if market.get('active', True):  # Only active markets
-                quote = market.get('quote', 'OTHER')
-                if quote not in pairs_by_quote:
-                    pairs_by_quote[quote] = []
-                pairs_by_quote[quote].append(symbol)
-        
-        # Sort pairs within each quote currency
-        for quote in pairs_by_quote:
-            pairs_by_quote[quote].sort()
-        
-        # Get top base currencies
-        base_currencies = {}
-        for symbol, market in markets.items():
-            if market.get('active', True):
-                base = market.get('base', 'UNKNOWN')
-                base_currencies[base] = base_currencies.get(base, 0) + 1
-        
-        top_base_currencies = dict(sorted(base_currencies.items(), key=lambda x: x[1], reverse=True)[:20])
-        
-        # Sample major pairs
-        major_quotes = ['USDT', 'BTC', 'ETH', 'USD']
-        sample_pairs = []
-        for quote in major_quotes:
-            if quote in pairs_by_quote:
-                sample_pairs.extend(pairs_by_quote[quote][:20])
-        
-        return {
-            'exchange': exchange,
-            'total_pairs': len([m for m in markets.values() if m.get('active', True)]),
-            'pairs_by_quote': pairs_by_quote,
-            'top_base_currencies': top_base_currencies,
-            'sample_major_pairs': sample_pairs[:20],
-            'status': 'success'
-        }
-        
-    except Exception as e:
-        return {
-            'exchange': exchange,
-            'error': str(e),
-            'status': 'error'
-        }
+    markets = cached_load_markets(exchange)
+    
+    # Organize pairs by quote currency
+    pairs_by_quote = {}
+    for symbol, market in markets.items():
+        if market.get('active', True):  # Only active markets
+            quote = market.get('quote', 'OTHER')
+            if quote not in pairs_by_quote:
+                pairs_by_quote[quote] = []
+            pairs_by_quote[quote].append(symbol)
+    
+    # Sort pairs within each quote currency
+    for quote in pairs_by_quote:
+        pairs_by_quote[quote].sort()
+    
+    # Get top base currencies
+    base_currencies = {}
+    for symbol, market in markets.items():
+        if market.get('active', True):
+            base = market.get('base', 'UNKNOWN')
+            base_currencies[base] = base_currencies.get(base, 0) + 1
+    
+    top_base_currencies = dict(sorted(base_currencies.items(), key=lambda x: x[1], reverse=True)[:20])
+    
+    # Sample major pairs
+    major_quotes = ['USDT', 'BTC', 'ETH', 'USD']
+    sample_pairs = []
+    for quote in major_quotes:
+        if quote in pairs_by_quote:
+            sample_pairs.extend(pairs_by_quote[quote][:20])
+    
+    return {
+        'exchange': exchange,
+        'total_pairs': len([m for m in markets.values() if m.get('active', True)]),
+        'pairs_by_quote': pairs_by_quote,
+        'top_base_currencies': top_base_currencies,
+        'sample_major_pairs': sample_pairs[:20],
+        'status': 'success'
+    }
 
 @mcp.tool()
-def compare_exchange_prices(symbol: str = "BTC/USDT") -> dict:
+@tool_errors('symbol', message='Price comparison failed')
+async def compare_exchange_prices(symbol: str = "BTC/USDT") -> dict:
     """
     Compare prices across all reliable exchanges with detailed analysis.
     
@@ -441,95 +1014,100 @@ def compare_exchange_prices(symbol: str = "BTC/USDT") -> dict:
     Returns:
         Comprehensive price comparison and arbitrage analysis
     """
-    try:
-        results = {}
-        prices = []
-        
-        for exchange_name, exchange in EXCHANGES.items():
-            try:
-                price_data = safe_get_price_data(exchange, symbol)
-                if 'error' not in price_data and price_data.get('price'):
-                    results[exchange_name] = price_data
-                    prices.append(price_data['price'])
-            except Exception as e:
-                results[exchange_name] = {'error': str(e)}
-        
-        if len(prices) < 2:
-            return {
-                'symbol': symbol,
-                'error': 'Not enough exchanges with valid data for comparison',
-                'status': 'error'
-            }
-        
-        # Calculate statistics
-        avg_price = np.mean(prices)
-        min_price = min(prices)
-        max_price = max(prices)
-        price_spread = max_price - min_price
-        spread_percentage = (price_spread / avg_price) * 100
-        
-        # Find best exchanges
-        best_buy = min(results.items(), key=lambda x: x[1].get('price', float('inf')) if 'error' not in x[1] else float('inf'))
-        best_sell = max(results.items(), key=lambda x: x[1].get('price', 0) if 'error' not in x[1] else 0)
-        
-        return {
-            'symbol': symbol,
-            'exchanges': results,
-            'analysis': {
-                'average_price': round(avg_price, 2),
-                'min_price': min_price,
-                'max_price': max_price,
-                'price_spread_usd': round(price_spread, 2),
-                'spread_percentage': round(spread_percentage, 4),
-                'best_buy_exchange': best_buy[0],
-                'best_sell_exchange': best_sell[0],
-                'arbitrage_opportunity': round(spread_percentage, 4) > MIN_ARBITRAGE_PROFIT_PCT
-            },
-            'exchanges_count': len([r for r in results.values() if 'error' not in r]),
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    results = {}
+    prices = []
+    
+    for exchange_name, price_data in (await gather_price_data(list(EXCHANGES), symbol)).items():
+        if 'error' not in price_data and price_data.get('price'):
+            results[exchange_name] = price_data
+            prices.append(price_data['price'])
+    
+    if len(prices) < 2:
         return {
             'symbol': symbol,
-            'error': f'Price comparison failed: {str(e)}',
+            'error': 'Not enough exchanges with valid data for comparison',
             'status': 'error'
         }
-
-@mcp.tool()
-def get_exchange_status(random_string: str = "test") -> dict:
-    """
-    Check operational status of reliable exchanges only.
     
-    Returns:
-        Status information for each reliable exchange
-    """
-    status_results = {}
+    # Calculate statistics
+    avg_price = np.mean(prices)
+    min_price = min(prices)
+    max_price = max(prices)
+    price_spread = max_price - min_price
+    spread_percentage = (price_spread / avg_price) * 100
     
-    for exchange_name, exchange in EXCHANGES.items():
+    # Find best exchanges
+    best_buy = min(results.items(), key=lambda x: x[1].get('price', float('inf')) if 'error' not in x[1] else float('inf'))
+    best_sell = max(results.items(), key=lambda x: x[1].get('price', 0) if 'error' not in x[1] else 0)
+    
+    return {
+        'symbol': symbol,
+        'exchanges': results,
+        'analysis': {
+            'average_price': round(avg_price, 2),
+            'min_price': min_price,
+            'max_price': max_price,
+            'price_spread_usd': round(price_spread, 2),
+            'spread_percentage': round(spread_percentage, 4),
+            'best_buy_exchange': best_buy[0],
+            'best_sell_exchange': best_sell[0],
+            'arbitrage_opportunity': round(spread_percentage, 4) > MIN_ARBITRAGE_PROFIT_PCT
+        },
+        'exchanges_count': len([r for r in results.values() if 'error' not in r]),
+        'status': 'success'
+    }
+
+@mcp.tool()
+@tool_errors()
+async def get_exchange_status(random_string: str = "test", force_reload: bool = False) -> dict:
+    """
+    Check operational status of reliable exchanges only.
+    
+    Args:
+        force_reload: Reload every exchange's markets instead of pinging its
+            server time (slower; refreshes total_markets)
+    
+    Returns:
+        Status information for each reliable exchange
+    """
+    async def check_exchange(exchange_name):
+        exchange = EXCHANGES[exchange_name]
+        async_exchange = ASYNC_EXCHANGES[exchange_name]
         start_time = time.time()
         try:
-            # Try to fetch markets to test connectivity
-            markets = exchange.load_markets()
+            # A server time (or status) request proves connectivity at a
+            # fraction of the cost of downloading every market
+            if force_reload:
+                markets = await asyncio.to_thread(cached_load_markets, exchange_name, True)
+            else:
+                if async_exchange.has.get('fetchTime'):
+                    await async_exchange.fetch_time()
+                else:
+                    await async_exchange.fetch_status()
+                markets = _MARKETS_CACHE.get(exchange_name) or exchange.markets
             response_time = time.time() - start_time
             
-            status_results[exchange_name] = {
+            return {
                 'status': 'operational',
                 'response_time_seconds': round(response_time, 3),
-                'total_markets': len(markets),
+                'total_markets': len(markets) if markets else None,
                 'api_version': getattr(exchange, 'version', None),
                 'rate_limit': exchange.rateLimit,
                 'last_check': datetime.now().isoformat()
             }
         except Exception as e:
             response_time = time.time() - start_time
-            status_results[exchange_name] = {
+            return {
                 'status': 'error',
                 'error': str(e),
                 'response_time_seconds': round(response_time, 3),
                 'last_check': datetime.now().isoformat()
             }
     
+    # Check every exchange concurrently
+    statuses = await asyncio.gather(*(check_exchange(exchange_name) for exchange_name in EXCHANGES))
+    status_results = dict(zip(EXCHANGES, statuses))
+    
     # Calculate summary
     operational = sum(1 for status in status_results.values() if status['status'] == 'operational')
     total = len(status_results)
@@ -555,6 +1133,8 @@ def get_exchange_status(random_string: str = "test") -> dict:
     }
 
 @mcp.tool()
+@tool_errors('symbol', 'exchange', 'timeframe')
+@ttl_memoize(OHLCV_RESULT_CACHE_TTL, ttl_for=ohlcv_result_ttl)
 def fetch_ohlcv_data(timeframe: str = "1h", exchange: str = "binance", symbol: str = "BTC/USDT", 
                      since_hours_ago: int = 24, limit: int = 100) -> dict:
     """
@@ -582,82 +1162,72 @@ def fetch_ohlcv_data(timeframe: str = "1h", exchange: str = "binance", symbol: s
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        
-        # Calculate since timestamp
-        since_timestamp = int((datetime.now() - timedelta(hours=since_hours_ago)).timestamp() * 1000)
-        
-        # Fetch OHLCV data
-        ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, since_timestamp, limit)
-        
-        if not ohlcv:
-            return {
-                'symbol': symbol,
-                'exchange': exchange,
-                'error': 'No OHLCV data available',
-                'status': 'error'
-            }
-        
-        # Convert to readable format
-        candles = []
-        for candle in ohlcv:
-            candles.append({
-                'timestamp': candle[0],
-                'datetime': datetime.fromtimestamp(candle[0] / 1000).strftime('%Y-%m-%dT%H:%M:%S'),
-                'open': candle[1],
-                'high': candle[2],
-                'low': candle[3],
-                'close': candle[4],
-                'volume': candle[5]
-            })
-        
-        # Calculate summary statistics
-        if len(candles) >= 2:
-            first_price = candles[0]['open']
-            last_price = candles[-1]['close']
-            price_change = last_price - first_price
-            price_change_pct = (price_change / first_price) * 100
-            
-            high_prices = [c['high'] for c in candles]
-            low_prices = [c['low'] for c in candles]
-            volumes = [c['volume'] for c in candles]
-            
-            summary = {
-                'total_candles': len(candles),
-                'period_start': candles[0]['datetime'],
-                'period_end': candles[-1]['datetime'],
-                'current_price': last_price,
-                'price_change': round(price_change, 2),
-                'price_change_percentage': round(price_change_pct, 2),
-                'highest_price': max(high_prices),
-                'lowest_price': min(low_prices),
-                'average_volume': round(np.mean(volumes), 2),
-                'total_volume': round(sum(volumes), 2)
-            }
-        else:
-            summary = {'total_candles': len(candles)}
-        
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'timeframe': timeframe,
-            'timeframe_description': TIMEFRAMES[timeframe],
-            'candles': candles,
-            'summary': summary,
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    exchange_obj = EXCHANGES[exchange]
+    
+    # Calculate since timestamp
+    since_timestamp = int(time.time() * 1000) - since_hours_ago * 3_600_000
+    
+    # Fetch OHLCV data
+    ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, since_timestamp, limit)
+    
+    if not ohlcv:
         return {
             'symbol': symbol,
             'exchange': exchange,
-            'timeframe': timeframe,
-            'error': str(e),
+            'error': 'No OHLCV data available',
             'status': 'error'
         }
+    
+    # Convert to readable format
+    candles = []
+    for candle in ohlcv:
+        candles.append({
+            'timestamp': candle[0],
+            'datetime': fast_iso(candle[0]),
+            'open': candle[1],
+            'high': candle[2],
+            'low': candle[3],
+            'close': candle[4],
+            'volume': candle[5]
+        })
+    
+    # Calculate summary statistics
+    if len(candles) >= 2:
+        first_price = candles[0]['open']
+        last_price = candles[-1]['close']
+        price_change = last_price - first_price
+        price_change_pct = (price_change / first_price) * 100
+        
+        ohlcv_array = np.asarray(ohlcv, dtype=np.float64)
+        volumes = ohlcv_array[:, 5]
+        
+        summary = {
+            'total_candles': len(candles),
+            'period_start': candles[0]['datetime'],
+            'period_end': candles[-1]['datetime'],
+            'current_price': last_price,
+            'price_change': round(price_change, 2),
+            'price_change_percentage': round(price_change_pct, 2),
+            'highest_price': float(ohlcv_array[:, 2].max()),
+            'lowest_price': float(ohlcv_array[:, 3].min()),
+            'average_volume': round(float(volumes.mean()), 2),
+            'total_volume': round(float(volumes.sum()), 2)
+        }
+    else:
+        summary = {'total_candles': len(candles)}
+    
+    return {
+        'symbol': symbol,
+        'exchange': exchange,
+        'timeframe': timeframe,
+        'timeframe_description': TIMEFRAMES[timeframe],
+        'candles': candles,
+        'summary': summary,
+        'status': 'success'
+    }
 
 @mcp.tool()
+@tool_errors('symbol', 'exchange')
 def fetch_multiple_timeframes(exchange: str = "binance", symbol: str = "BTC/USDT", 
                              timeframes: List[str] = None) -> dict:
     """
@@ -680,71 +1250,63 @@ def fetch_multiple_timeframes(exchange: str = "binance", symbol: str = "BTC/USDT
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        results = {}
-        
-        for timeframe in timeframes:
-            if timeframe not in TIMEFRAMES:
-                continue
+    exchange_obj = EXCHANGES[exchange]
+    results = {}
+    
+    for timeframe in timeframes:
+        if timeframe not in TIMEFRAMES:
+            continue
+            
+        try:
+            # Fetch last 100 candles for each timeframe
+            ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, None, 100)
+            
+            if ohlcv:
+                # Get latest candle info
+                latest = ohlcv[-1]
+                first = ohlcv[0]
+                
+                # Calculate period analysis
+                price_change = latest[4] - first[1]  # close - open
+                price_change_pct = (price_change / first[1]) * 100
                 
-            try:
-                # Fetch last 100 candles for each timeframe
-                ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, None, 100)
+                ohlcv_array = np.asarray(ohlcv, dtype=np.float64)
                 
-                if ohlcv:
-                    # Get latest candle info
-                    latest = ohlcv[-1]
-                    first = ohlcv[0]
-                    
-                    # Calculate period analysis
-                    price_change = latest[4] - first[1]  # close - open
-                    price_change_pct = (price_change / first[1]) * 100
-                    
-                    high_prices = [c[2] for c in ohlcv]
-                    low_prices = [c[3] for c in ohlcv]
-                    volumes = [c[5] for c in ohlcv]
-                    
-                    results[timeframe] = {
-                        'timeframe_description': TIMEFRAMES[timeframe],
-                        'candles_count': len(ohlcv),
-                        'latest_candle': {
-                            'datetime': datetime.fromtimestamp(latest[0] / 1000).strftime('%Y-%m-%dT%H:%M:%S'),
-                            'open': latest[1],
-                            'high': latest[2],
-                            'low': latest[3],
-                            'close': latest[4],
-                            'volume': latest[5]
-                        },
-                        'period_analysis': {
-                            'price_change': round(price_change, 2),
-                            'price_change_percentage': round(price_change_pct, 2),
-                            'highest': max(high_prices),
-                            'lowest': min(low_prices),
-                            'avg_volume': round(np.mean(volumes), 2)
-                        }
+                results[timeframe] = {
+                    'timeframe_description': TIMEFRAMES[timeframe],
+                    'candles_count': len(ohlcv),
+                    'latest_candle': {
+                        'datetime': fast_iso(latest[0]),
+                        'open': latest[1],
+                        'high': latest[2],
+                        'low': latest[3],
+                        'close': latest[4],
+                        'volume': latest[5]
+                    },
+                    'period_analysis': {
+                        'price_change': round(price_change, 2),
+                        'price_change_percentage': round(price_change_pct, 2),
+                        'highest': float(ohlcv_array[:, 2].max()),
+                        'lowest': float(ohlcv_array[:, 3].min()),
+                        'avg_volume': round(float(ohlcv_array[:, 5].mean()), 2)
                     }
-            except Exception as e:
-                continue
-        
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'timeframe_analysis': results,
-            'successful_timeframes': len(results),
-            'status': 'success'
-        }
-        
-    except Exception as e:
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'error': str(e),
-            'status': 'error'
-        }
+                }
+        except Exception as e:
+            continue
+    
+    return {
+        'symbol': symbol,
+        'exchange': exchange,
+        'timeframe_analysis': results,
+        'successful_timeframes': len(results),
+        'status': 'success'
+    }
 
 @mcp.tool()
-def fetch_recent_trades(exchange: str = "binance", symbol: str = "BTC/USDT", limit: int = 50) -> dict:
+@tool_errors('symbol', 'exchange')
+@ttl_memoize(BOOK_RESULT_CACHE_TTL)
+def fetch_recent_trades(exchange: str = "binance", symbol: str = "BTC/USDT", limit: int = 50,
+                        include_trades: bool = True) -> dict:
     """
     Fetch recent trades data for market microstructure analysis.
     
@@ -752,6 +1314,7 @@ def fetch_recent_trades(exchange: str = "binance", symbol: str = "BTC/USDT", lim
         exchange: Exchange name
         symbol: Trading pair symbol
         limit: Number of recent trades to fetch
+        include_trades: Include the formatted trade list (False returns the analysis only)
     
     Returns:
         Recent trades with market sentiment analysis
@@ -762,110 +1325,119 @@ def fetch_recent_trades(exchange: str = "binance", symbol: str = "BTC/USDT", lim
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        trades = exchange_obj.fetch_trades(symbol, None, limit)
-        
-        if not trades:
-            return {
-                'symbol': symbol,
-                'exchange': exchange,
-                'error': 'No trades data available',
-                'status': 'error'
-            }
-        
-        # Convert to readable format
-        formatted_trades = []
-        buy_volume = 0
-        sell_volume = 0
-        total_volume = 0
-        
-        for trade in trades:
-            formatted_trade = {
-                'id': trade.get('id'),
-                'timestamp': trade.get('timestamp'),
-                'datetime': datetime.fromtimestamp(trade['timestamp'] / 1000).strftime('%Y-%m-%dT%H:%M:%S.%f'),
-                'price': trade.get('price'),
-                'amount': trade.get('amount'),
-                'side': trade.get('side'),
-                'cost': trade.get('cost', trade.get('price', 0) * trade.get('amount', 0))
-            }
-            formatted_trades.append(formatted_trade)
-            
-            # Calculate volume by side
-            volume = trade.get('amount', 0)
-            total_volume += volume
-            
-            if trade.get('side') == 'buy':
-                buy_volume += volume
-            else:
-                sell_volume += volume
-        
-        # Calculate market sentiment
-        buy_pressure = (buy_volume / total_volume * 100) if total_volume > 0 else 0
-        sell_pressure = (sell_volume / total_volume * 100) if total_volume > 0 else 0
-        
-        # Determine market sentiment
-        if buy_pressure > 60:
-            sentiment = "bullish"
-        elif sell_pressure > 60:
-            sentiment = "bearish"
-        else:
-            sentiment = "neutral"
-        
-        # Calculate price trend
-        if len(formatted_trades) >= 2:
-            first_price = formatted_trades[0]['price']
-            last_price = formatted_trades[-1]['price']
-            if last_price > first_price:
-                price_trend = "bullish"
-            elif last_price < first_price:
-                price_trend = "bearish"
-            else:
-                price_trend = "neutral"
-            
-            price_volatility = abs(last_price - first_price) / first_price * 100
-        else:
-            price_trend = "neutral"
-            price_volatility = 0
-        
-        # Calculate time span
-        if len(formatted_trades) >= 2:
-            time_span = (formatted_trades[-1]['timestamp'] - formatted_trades[0]['timestamp']) / 1000 / 60  # minutes
-        else:
-            time_span = 0
-        
-        analysis = {
-            'total_trades': len(formatted_trades),
-            'total_volume': round(total_volume, 4),
-            'buy_volume': round(buy_volume, 4),
-            'sell_volume': round(sell_volume, 4),
-            'buy_pressure_pct': round(buy_pressure, 2),
-            'sell_pressure_pct': round(sell_pressure, 2),
-            'market_sentiment': sentiment,
-            'price_trend': price_trend,
-            'price_volatility_pct': round(price_volatility, 4),
-            'latest_price': formatted_trades[-1]['price'] if formatted_trades else 0,
-            'time_span_minutes': round(time_span, 1)
-        }
-        
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'trades': formatted_trades,
-            'analysis': analysis,
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    exchange_obj = EXCHANGES[exchange]
+    trades = exchange_obj.fetch_trades(symbol, None, limit)
+    
+    if not trades:
         return {
             'symbol': symbol,
             'exchange': exchange,
-            'error': str(e),
+            'error': 'No trades data available',
             'status': 'error'
         }
+    
+    # Convert to readable format (skipped entirely when only the analysis is wanted)
+    if include_trades:
+        formatted_trades = [{
+            'id': trade.get('id'),
+            'timestamp': trade.get('timestamp'),
+            'datetime': fast_iso(trade['timestamp'], micros=True),
+            'price': trade.get('price'),
+            'amount': trade.get('amount'),
+            'side': trade.get('side'),
+            'cost': trade.get('cost', trade.get('price', 0) * trade.get('amount', 0))
+        } for trade in trades]
+    
+    # Calculate volume by side
+    amounts = np.fromiter((trade.get('amount', 0) for trade in trades), dtype=np.float64, count=len(trades))
+    is_buy = np.fromiter((trade.get('side') == 'buy' for trade in trades), dtype=bool, count=len(trades))
+    total_volume = float(amounts.sum())
+    buy_volume = float(amounts[is_buy].sum())
+    sell_volume = float(amounts[~is_buy].sum())
+    
+    # Calculate market sentiment
+    buy_pressure = (buy_volume / total_volume * 100) if total_volume > 0 else 0
+    sell_pressure = (sell_volume / total_volume * 100) if total_volume > 0 else 0
+    
+    # Determine market sentiment
+    if buy_pressure > 60:
+        sentiment = "bullish"
+    elif sell_pressure > 60:
+        sentiment = "bearish"
+    else:
+        sentiment = "neutral"
+    
+    # Calculate price trend
+    if len(trades) >= 2:
+        first_price = trades[0].get('price')
+        last_price = trades[-1].get('price')
+        if last_price > first_price:
+            price_trend = "bullish"
+        elif last_price < first_price:
+            price_trend = "bearish"
+        else:
+            price_trend = "neutral"
+        
+        price_volatility = abs(last_price - first_price) / first_price * 100
+    else:
+        price_trend = "neutral"
+        price_volatility = 0
+    
+    # Calculate time span
+    if len(trades) >= 2:
+        time_span = (trades[-1].get('timestamp') - trades[0].get('timestamp')) / 1000 / 60  # minutes
+    else:
+        time_span = 0
+    
+    analysis = {
+        'total_trades': len(trades),
+        'total_volume': round(total_volume, 4),
+        'buy_volume': round(buy_volume, 4),
+        'sell_volume': round(sell_volume, 4),
+        'buy_pressure_pct': round(buy_pressure, 2),
+        'sell_pressure_pct': round(sell_pressure, 2),
+        'market_sentiment': sentiment,
+        'price_trend': price_trend,
+        'price_volatility_pct': round(price_volatility, 4),
+        'latest_price': trades[-1].get('price'),
+        'time_span_minutes': round(time_span, 1)
+    }
+    
+    return {
+        'symbol': symbol,
+        'exchange': exchange,
+        **({'trades': formatted_trades} if include_trades else {}),
+        'analysis': analysis,
+        'status': 'success'
+    }
+
+@functools.lru_cache(maxsize=None)
+def exchange_capabilities(exchange_name):
+    """
+    Static facts about an exchange client: `has` flags, timeframes, fees and rate limit.
+
+    They are fixed per ccxt exchange class, so they are read once per exchange
+    (on first use, keeping client construction lazy).
+    """
+    exchange_obj = EXCHANGES[exchange_name]
+    has = getattr(exchange_obj, 'has', {})
+    fees = getattr(exchange_obj, 'fees', {})
+    return {
+        'has': {
+            'has_fetchOHLCV': has.get('fetchOHLCV', False),
+            'has_fetchTrades': has.get('fetchTrades', False),
+            'has_fetchOrderBook': has.get('fetchOrderBook', False),
+            'has_fetchTicker': has.get('fetchTicker', False),
+            'has_fetchTickers': has.get('fetchTickers', False)
+        },
+        'timeframes': getattr(exchange_obj, 'timeframes', {}),
+        'trading_fees': fees.get('trading', {}),
+        'funding_fees': fees.get('funding', {}),
+        'rate_limit': exchange_obj.rateLimit
+    }
 
 @mcp.tool()
+@tool_errors('exchange')
 def get_exchange_markets_info(exchange: str = "binance") -> dict:
     """
     Get comprehensive markets information for a reliable exchange.
@@ -882,99 +1454,97 @@ def get_exchange_markets_info(exchange: str = "binance") -> dict:
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        markets = exchange_obj.load_markets()
-        
-        # Count market types
-        spot_count = 0
-        futures_count = 0
-        options_count = 0
-        active_count = 0
-        
-        base_currencies = {}
-        quote_currencies = {}
-        
-        for symbol, market in markets.items():
-            if market.get('active', True):
-                active_count += 1
-            
-            # Count market types
-            if market.get('type') == 'spot':
-                spot_count += 1
-            elif market.get('type') in ['future', 'swap']:
-                futures_count += 1
-            elif market.get('type') == 'option':
-                options_count += 1
-            else:
-                spot_count += 1  # Default to spot
-            
-            # Count currencies
-            base = market.get('base', 'UNKNOWN')
-            quote = market.get('quote', 'UNKNOWN')
-            
-            base_currencies[base] = base_currencies.get(base, 0) + 1
-            quote_currencies[quote] = quote_currencies.get(quote, 0) + 1
-        
-        # Get top currencies
-        top_base = dict(sorted(base_currencies.items(), key=lambda x: x[1], reverse=True)[:20])
-        top_quote = dict(sorted(quote_currencies.items(), key=lambda x: x[1], reverse=True)[:10])
-        
-        # Get exchange capabilities
-        has_capabilities = {
-            'has_fetchOHLCV': getattr(exchange_obj, 'has', {}).get('fetchOHLCV', False),
-            'has_fetchTrades': getattr(exchange_obj, 'has', {}).get('fetchTrades', False),
-            'has_fetchOrderBook': getattr(exchange_obj, 'has', {}).get('fetchOrderBook', False),
-            'has_fetchTicker': getattr(exchange_obj, 'has', {}).get('fetchTicker', False),
-            'has_fetchTickers': getattr(exchange_obj, 'has', {}).get('fetchTickers', False)
-        }
-        
-        # Get timeframes
-        timeframes = getattr(exchange_obj, 'timeframes', {})
-        
-        # Get fees structure
-        fees = getattr(exchange_obj, 'fees', {})
-        trading_fees = fees.get('trading', {})
-        funding_fees = fees.get('funding', {})
-        
-        return {
-            'exchange': exchange,
-            'markets_summary': {
-                'total_markets': len(markets),
-                'active_markets': active_count,
-                'inactive_markets': len(markets) - active_count
-            },
-            'market_types': {
-                'spot': spot_count,
-                'futures': futures_count,
-                'options': options_count
-            },
-            'currencies': {
-                'base_currencies': top_base,
-                'quote_currencies': top_quote,
-                'total_base_currencies': len(base_currencies),
-                'total_quote_currencies': len(quote_currencies)
-            },
-            'fees_structure': {
-                'trading': trading_fees,
-                'funding': funding_fees
-            },
-            'exchange_info': {
-                **has_capabilities,
-                'timeframes': timeframes,
-                'rate_limit': exchange_obj.rateLimit
-            },
-            'status': 'success'
-        }
-        
-    except Exception as e:
-        return {
-            'exchange': exchange,
-            'error': str(e),
-            'status': 'error'
-        }
+    markets = cached_load_markets(exchange)
+    
+    cached = _MARKETS_INFO_CACHE.get(exchange)
+    if cached is not None and cached[0] is markets:
+        return cached[1]
+    
+    # Counter tallies in C; most_common() picks the top N with a heap and
+    # keeps first-seen order among equal counts, like a stable sort
+    market_list = list(markets.values())
+    active_count = sum(1 for market in market_list if market.get('active', True))
+    
+    # Count market types (untyped markets count as spot)
+    type_counts = Counter(market.get('type') for market in market_list)
+    futures_count = type_counts['future'] + type_counts['swap']
+    options_count = type_counts['option']
+    spot_count = len(market_list) - futures_count - options_count
+    
+    # Count currencies
+    base_currencies = Counter(market.get('base', 'UNKNOWN') for market in market_list)
+    quote_currencies = Counter(market.get('quote', 'UNKNOWN') for market in market_list)
+    
+    # Get top currencies
+    top_base = dict(base_currencies.most_common(20))
+    top_quote = dict(quote_currencies.most_common(10))
+    
+    # Exchange capabilities, timeframes and fees
+    capabilities = exchange_capabilities(exchange)
+    
+    summary = {
+        'exchange': exchange,
+        'markets_summary': {
+            'total_markets': len(markets),
+            'active_markets': active_count,
+            'inactive_markets': len(markets) - active_count
+        },
+        'market_types': {
+            'spot': spot_count,
+            'futures': futures_count,
+            'options': options_count
+        },
+        'currencies': {
+            'base_currencies': top_base,
+            'quote_currencies': top_quote,
+            'total_base_currencies': len(base_currencies),
+            'total_quote_currencies': len(quote_currencies)
+        },
+        'fees_structure': {
+            'trading': capabilities['trading_fees'],
+            'funding': capabilities['funding_fees']
+        },
+        'exchange_info': {
+            **capabilities['has'],
+            'timeframes': capabilities['timeframes'],
+            'rate_limit': capabilities['rate_limit']
+        },
+        'status': 'success'
+    }
+    _MARKETS_INFO_CACHE[exchange] = (markets, summary)
+    return summary
+
+def quote_ticker_views(exchange, quote_currency, tickers):
+    """
+    Tickers quoted in `quote_currency` ranked by volume, plus the top 5 gainers and losers.
+
+    Computed once per tickers snapshot and quote currency; later calls with
+    another limit only slice the ranking.
+    """
+    key = (exchange, quote_currency)
+    cached = _QUOTE_TICKERS_CACHE.get(key)
+    if cached is not None and cached[0] is tickers:
+        return cached[1:]
+    
+    # Filter by quote currency (spot or settle suffix), keeping tickers with a valid price
+    suffixes = (f'/{quote_currency}', f':{quote_currency}')
+    filtered_tickers = {
+        symbol: ticker for symbol, ticker in tickers.items()
+        if symbol.endswith(suffixes) and ticker.get('last') is not None
+    }
+    
+    # ccxt reports missing values as None
+    by_volume = sorted(filtered_tickers.items(), key=lambda x: x[1].get('quoteVolume') or 0, reverse=True)
+    gainers = dict(heapq.nlargest(5, filtered_tickers.items(),
+                                  key=lambda x: x[1].get('percentage') or 0))
+    losers = dict(heapq.nsmallest(5, filtered_tickers.items(),
+                                  key=lambda x: x[1].get('percentage') or 0))
+    
+    _QUOTE_TICKERS_CACHE.set(key, (tickers, by_volume, gainers, losers))
+    return by_volume, gainers, losers
 
 @mcp.tool()
+@tool_errors('exchange')
 def get_all_tickers(exchange: str = "binance", quote_currency: str = "USDT", limit: int = 50) -> dict:
     """
     Get all tickers for a reliable exchange filtered by quote currency.
@@ -993,79 +1563,85 @@ def get_all_tickers(exchange: str = "binance", quote_currency: str = "USDT", lim
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        tickers = exchange_obj.fetch_tickers()
-        
-        # Filter by quote currency
-        filtered_tickers = {}
-        for symbol, ticker in tickers.items():
-            if symbol.endswith(f'/{quote_currency}') or symbol.endswith(f':{quote_currency}'):
-                if ticker.get('last') is not None:  # Only include tickers with valid price
-                    filtered_tickers[symbol] = ticker
-        
-        # Sort by volume and limit
-        sorted_tickers = dict(sorted(filtered_tickers.items(), 
-                                   key=lambda x: x[1].get('quoteVolume', 0), 
-                                   reverse=True)[:limit])
-        
-        # Calculate market overview
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        
-        for ticker in sorted_tickers.values():
-            change = ticker.get('percentage', 0)
-            if change > 0:
-                positive_count += 1
-            elif change < 0:
-                negative_count += 1
-            else:
-                neutral_count += 1
-        
-        # Determine market sentiment
-        total_count = len(sorted_tickers)
-        if positive_count > negative_count:
-            sentiment = "bullish"
-        elif negative_count > positive_count:
-            sentiment = "bearish"
-        else:
-            sentiment = "neutral"
-        
-        # Get top performers
-        gainers = dict(sorted(filtered_tickers.items(), 
-                            key=lambda x: x[1].get('percentage', 0), 
-                            reverse=True)[:5])
-        
-        losers = dict(sorted(filtered_tickers.items(), 
-                           key=lambda x: x[1].get('percentage', 0))[:5])
-        
-        return {
-            'exchange': exchange,
-            'quote_currency': quote_currency,
-            'tickers': sorted_tickers,
-            'market_overview': {
-                'total_pairs': total_count,
-                'positive_change': positive_count,
-                'negative_change': negative_count,
-                'neutral_change': neutral_count,
-                'market_sentiment': sentiment
-            },
-            'top_performers': {
-                'gainers': gainers,
-                'losers': losers
-            },
-            'status': 'success'
-        }
-        
-    except Exception as e:
-        return {
-            'exchange': exchange,
-            'error': str(e),
-            'status': 'error'
-        }
+    exchange_obj = EXCHANGES[exchange]
+    tickers = _ALL_TICKERS_CACHE.get_or_set(exchange, exchange_obj.fetch_tickers)
+    
+    by_volume, gainers, losers = quote_ticker_views(exchange, quote_currency, tickers)
+    
+    # Top pairs by volume
+    sorted_tickers = dict(by_volume[:limit])
+    
+    # Calculate market overview
+    changes = np.fromiter((ticker.get('percentage') or 0 for ticker in sorted_tickers.values()),
+                          dtype=np.float64, count=len(sorted_tickers))
+    positive_count = int((changes > 0).sum())
+    negative_count = int((changes < 0).sum())
+    neutral_count = len(changes) - positive_count - negative_count
+    
+    # Determine market sentiment
+    total_count = len(sorted_tickers)
+    if positive_count > negative_count:
+        sentiment = "bullish"
+    elif negative_count > positive_count:
+        sentiment = "bearish"
+    else:
+        sentiment = "neutral"
+    
+    return {
+        'exchange': exchange,
+        'quote_currency': quote_currency,
+        'tickers': sorted_tickers,
+        'market_overview': {
+            'total_pairs': total_count,
+            'positive_change': positive_count,
+            'negative_change': negative_count,
+            'neutral_change': neutral_count,
+            'market_sentiment': sentiment
+        },
+        'top_performers': {
+            'gainers': gainers,
+            'losers': losers
+        },
+        'status': 'success'
+    }
+
+@njit(cache=True, error_model='numpy')
+def volume_stats_kernel(volumes, closes):
+    """
+    Numba kernel: volume mean, population std, min and max, plus the
+    volume-close correlation, in one pass (Welford updates; a flat series
+    gives a NaN correlation like np.corrcoef)
+    """
+    mean = m2 = 0.0
+    close_mean = close_m2 = co_moment = 0.0
+    lowest = highest = volumes[0]
+    for i in range(volumes.shape[0]):
+        value = volumes[i]
+        delta = value - mean
+        mean += delta / (i + 1)
+        m2 += delta * (value - mean)
+        close_delta = closes[i] - close_mean
+        close_mean += close_delta / (i + 1)
+        close_m2 += close_delta * (closes[i] - close_mean)
+        co_moment += delta * (closes[i] - close_mean)
+        if value < lowest:
+            lowest = value
+        if value > highest:
+            highest = value
+    correlation = co_moment / (m2 * close_m2) ** 0.5
+    return mean, (m2 / volumes.shape[0]) ** 0.5, lowest, highest, correlation
+
+def warm_kernels():
+    """Compile (or load from Numba's disk cache) every kernel with the array layouts the tools pass"""
+    ohlcv_sample = np.ones((10, 6))
+    book_sample = np.ones(10)
+    liquidity_sums_kernel(book_sample, book_sample)
+    fill_costs_kernel(book_sample, book_sample, book_sample)
+    volume_stats_kernel(ohlcv_sample[:, 5], ohlcv_sample[:, 4])  # Strided column views
 
 @mcp.tool()
+@tool_errors('symbol', 'exchange')
+@ttl_memoize(OHLCV_RESULT_CACHE_TTL, ttl_for=ohlcv_result_ttl)
 def analyze_volume_patterns(exchange: str = "binance", symbol: str = "BTC/USDT", 
                            timeframe: str = "1h", periods: int = 24) -> dict:
     """
@@ -1086,111 +1662,111 @@ def analyze_volume_patterns(exchange: str = "binance", symbol: str = "BTC/USDT",
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, None, periods)
-        
-        if len(ohlcv) < 10:
-            return {
-                'symbol': symbol,
-                'exchange': exchange,
-                'error': 'Not enough data for volume analysis',
-                'status': 'error'
-            }
-        
-        # Extract volume and price data
-        volumes = [candle[5] for candle in ohlcv]
-        closes = [candle[4] for candle in ohlcv]
-        
-        # Calculate volume statistics
-        avg_volume = np.mean(volumes)
-        max_volume = max(volumes)
-        min_volume = min(volumes)
-        volume_std = np.std(volumes)
-        
-        # Calculate volume-price correlation
-        correlation = np.corrcoef(volumes, closes)[0, 1] if len(volumes) > 1 else 0
-        
-        # Detect volume spikes (> 2 standard deviations above mean)
-        volume_spikes = []
-        for i, volume in enumerate(volumes):
-            if volume > avg_volume + (2 * volume_std):
-                candle = ohlcv[i]
-                price_change = ((candle[4] - candle[1]) / candle[1]) * 100 if candle[1] > 0 else 0
-                
-                volume_spikes.append({
-                    'period': i,
-                    'datetime': datetime.fromtimestamp(candle[0] / 1000).strftime('%Y-%m-%dT%H:%M:%S'),
-                    'volume': volume,
-                    'volume_ratio': round(volume / avg_volume, 2),
-                    'price': candle[4],
-                    'price_change': round(price_change, 2)
-                })
-        
-        # Analyze volume trend
-        if len(volumes) >= 2:
-            recent_avg = np.mean(volumes[-5:])  # Last 5 periods
-            earlier_avg = np.mean(volumes[:5])   # First 5 periods
-            volume_trend_ratio = recent_avg / earlier_avg if earlier_avg > 0 else 1
-            
-            if volume_trend_ratio > 1.2:
-                volume_trend = "increasing"
-            elif volume_trend_ratio < 0.8:
-                volume_trend = "decreasing"
-            else:
-                volume_trend = "stable"
-        else:
-            volume_trend = "insufficient_data"
-            volume_trend_ratio = 1
-        
-        # Price-volume divergence analysis
-        price_change_pct = ((closes[-1] - closes[0]) / closes[0]) * 100 if closes[0] > 0 else 0
-        volume_change_pct = ((volumes[-1] - volumes[0]) / volumes[0]) * 100 if volumes[0] > 0 else 0
-        
-        if price_change_pct > 2 and volume_change_pct < -10:
-            divergence_signal = "bearish"  # Price up, volume down
-        elif price_change_pct < -2 and volume_change_pct < -10:
-            divergence_signal = "bullish"  # Price down, volume down (potential reversal)
-        else:
-            divergence_signal = "neutral"
-        
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'timeframe': timeframe,
-            'periods_analyzed': len(volumes),
-            'volume_statistics': {
-                'average_volume': round(avg_volume, 2),
-                'max_volume': round(max_volume, 2),
-                'min_volume': round(min_volume, 2),
-                'volume_volatility': round(volume_std, 2),
-                'volume_range_ratio': round(max_volume / min_volume, 2) if min_volume > 0 else 0
-            },
-            'volume_analysis': {
-                'volume_trend': volume_trend,
-                'volume_price_correlation': round(correlation, 3),
-                'volume_anomalies_count': len(volume_spikes),
-                'recent_vs_earlier_volume': round(volume_trend_ratio, 2)
-            },
-            'volume_spikes': volume_spikes,
-            'price_volume_divergence': {
-                'signal': divergence_signal,
-                'price_change_pct': round(price_change_pct, 2),
-                'volume_change_pct': round(volume_change_pct, 2)
-            },
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    exchange_obj = EXCHANGES[exchange]
+    ohlcv = exchange_obj.fetch_ohlcv(symbol, timeframe, None, periods)
+    
+    if len(ohlcv) < 10:
         return {
             'symbol': symbol,
             'exchange': exchange,
-            'error': str(e),
+            'error': 'Not enough data for volume analysis',
             'status': 'error'
         }
+    
+    # One float64 block; the volume and close columns are views into it
+    ohlcv_array = np.asarray(ohlcv, dtype=np.float64)
+    volumes = ohlcv_array[:, 5]
+    closes = ohlcv_array[:, 4]
+    
+    # Calculate volume statistics and volume-price correlation
+    if NUMBA_AVAILABLE:
+        avg_volume, volume_std, min_volume, max_volume, correlation = volume_stats_kernel(volumes, closes)
+    else:
+        avg_volume = volumes.mean()
+        max_volume = volumes.max()
+        min_volume = volumes.min()
+        volume_std = volumes.std()
+        correlation = np.corrcoef(volumes, closes)[0, 1]
+    
+    # Detect volume spikes (> 2 standard deviations above mean)
+    spike_idx = np.flatnonzero(volumes > avg_volume + (2 * volume_std))
+    spike_opens = ohlcv_array[spike_idx, 1]
+    spike_changes = np.divide(closes[spike_idx] - spike_opens, spike_opens,
+                              out=np.zeros_like(spike_opens), where=spike_opens > 0) * 100
+    
+    spike_ratios = volumes[spike_idx] / avg_volume
+    
+    volume_spikes = []
+    for i, volume_ratio, price_change in zip(spike_idx.tolist(), spike_ratios.round(2).tolist(),
+                                             spike_changes.round(2).tolist()):
+        candle = ohlcv[i]
+        volume_spikes.append({
+            'period': i,
+            'datetime': fast_iso(candle[0]),
+            'volume': candle[5],
+            'volume_ratio': volume_ratio,
+            'price': candle[4],
+            'price_change': price_change
+        })
+    
+    # Analyze volume trend
+    if len(volumes) >= 2:
+        recent_avg = volumes[-5:].mean()  # Last 5 periods
+        earlier_avg = volumes[:5].mean()   # First 5 periods
+        volume_trend_ratio = recent_avg / earlier_avg if earlier_avg > 0 else 1
+        
+        if volume_trend_ratio > 1.2:
+            volume_trend = "increasing"
+        elif volume_trend_ratio < 0.8:
+            volume_trend = "decreasing"
+        else:
+            volume_trend = "stable"
+    else:
+        volume_trend = "insufficient_data"
+        volume_trend_ratio = 1
+    
+    # Price-volume divergence analysis
+    price_change_pct = ((closes[-1] - closes[0]) / closes[0]) * 100 if closes[0] > 0 else 0
+    volume_change_pct = ((volumes[-1] - volumes[0]) / volumes[0]) * 100 if volumes[0] > 0 else 0
+    
+    if price_change_pct > 2 and volume_change_pct < -10:
+        divergence_signal = "bearish"  # Price up, volume down
+    elif price_change_pct < -2 and volume_change_pct < -10:
+        divergence_signal = "bullish"  # Price down, volume down (potential reversal)
+    else:
+        divergence_signal = "neutral"
+    
+    return {
+        'symbol': symbol,
+        'exchange': exchange,
+        'timeframe': timeframe,
+        'periods_analyzed': len(volumes),
+        'volume_statistics': {
+            'average_volume': round(avg_volume, 2),
+            'max_volume': round(max_volume, 2),
+            'min_volume': round(min_volume, 2),
+            'volume_volatility': round(volume_std, 2),
+            'volume_range_ratio': round(max_volume / min_volume, 2) if min_volume > 0 else 0
+        },
+        'volume_analysis': {
+            'volume_trend': volume_trend,
+            'volume_price_correlation': round(correlation, 3),
+            'volume_anomalies_count': len(volume_spikes),
+            'recent_vs_earlier_volume': round(volume_trend_ratio, 2)
+        },
+        'volume_spikes': volume_spikes,
+        'price_volume_divergence': {
+            'signal': divergence_signal,
+            'price_change_pct': round(price_change_pct, 2),
+            'volume_change_pct': round(volume_change_pct, 2)
+        },
+        'status': 'success'
+    }
 
 @mcp.tool()
-def get_cross_exchange_liquidity(symbol: str = "BTC/USDT", exchanges: List[str] = None) -> dict:
+@tool_errors('symbol')
+@ttl_memoize(BOOK_RESULT_CACHE_TTL)
+async def get_cross_exchange_liquidity(symbol: str = "BTC/USDT", exchanges: List[str] = None) -> dict:
     """
     Analyze liquidity across multiple reliable exchanges.
     
@@ -1211,73 +1787,76 @@ def get_cross_exchange_liquidity(symbol: str = "BTC/USDT", exchanges: List[str]
     failed_exchanges = 0
     total_liquidity = 0
     
-    for exchange_name in exchanges:
-        try:
-            exchange_obj = EXCHANGES[exchange_name]
-            
-            # Get ticker for volume
-            ticker = exchange_obj.fetch_ticker(symbol)
+    # Tickers and orderbooks for every exchange are requested concurrently
+    price_results, orderbooks = await asyncio.gather(
+        gather_price_data(exchanges, symbol),
+        asyncio.gather(*(safe_get_orderbook(ASYNC_EXCHANGES[name], symbol, 10) for name in exchanges))
+    )
+    
+    for exchange_name, orderbook in zip(exchanges, orderbooks):
+        price_data = price_results[exchange_name]
+        if 'error' in price_data or 'error' in orderbook:
+            liquidity_data[exchange_name] = {'error': price_data.get('error') or orderbook['error']}
+            failed_exchanges += 1
+            continue
+        
+        bid_px, bid_qty = orderbook['bids_px'], orderbook['bids_qty']
+        ask_px, ask_qty = orderbook['asks_px'], orderbook['asks_qty']
+        
+        if bid_px.shape[0] and ask_px.shape[0]:
+            # Notional (price * volume) is a single dot product per side
+            bid_liquidity = float(bid_px @ bid_qty)
+            ask_liquidity = float(ask_px @ ask_qty)
+            total_exchange_liquidity = bid_liquidity + ask_liquidity
+            best_bid = float(bid_px[0])
+            best_ask = float(ask_px[0])
             
-            # Get orderbook for liquidity
-            orderbook = exchange_obj.fetch_order_book(symbol, 10)
+            liquidity_data[exchange_name] = {
+                'price': price_data['price'],
+                'volume_24h': price_data['volume_24h'],
+                'liquidity_metrics': {
+                    'bid_liquidity_usd': round(bid_liquidity, 2),
+                    'ask_liquidity_usd': round(ask_liquidity, 2),
+                    'total_liquidity_usd': round(total_exchange_liquidity, 2),
+                    'liquidity_ratio': round(bid_liquidity / ask_liquidity, 3) if ask_liquidity > 0 else 0
+                },
+                'spread_analysis': {
+                    'best_bid': best_bid,
+                    'best_ask': best_ask,
+                    'spread_usd': round(best_ask - best_bid, 2),
+                    'spread_percentage': round(((best_ask - best_bid) / best_ask) * 100, 4)
+                },
+                'order_book_depth': {
+                    'bid_levels': bid_px.shape[0],
+                    'ask_levels': ask_px.shape[0],
+                    'total_bid_volume': float(bid_qty.sum()),
+                    'total_ask_volume': float(ask_qty.sum())
+                }
+            }
             
-            if ticker and orderbook:
-                # Calculate liquidity metrics
-                bids = orderbook.get('bids', [])
-                asks = orderbook.get('asks', [])
-                
-                if bids and asks:
-                    bid_liquidity = sum([bid[0] * bid[1] for bid in bids])  # Price * Volume
-                    ask_liquidity = sum([ask[0] * ask[1] for ask in asks])
-                    total_exchange_liquidity = bid_liquidity + ask_liquidity
-                    
-                    liquidity_data[exchange_name] = {
-                        'price': ticker.get('last'),
-                        'volume_24h': ticker.get('baseVolume'),
-                        'liquidity_metrics': {
-                            'bid_liquidity_usd': round(bid_liquidity, 2),
-                            'ask_liquidity_usd': round(ask_liquidity, 2),
-                            'total_liquidity_usd': round(total_exchange_liquidity, 2),
-                            'liquidity_ratio': round(bid_liquidity / ask_liquidity, 3) if ask_liquidity > 0 else 0
-                        },
-                        'spread_analysis': {
-                            'best_bid': bids[0][0],
-                            'best_ask': asks[0][0],
-                            'spread_usd': round(asks[0][0] - bids[0][0], 2),
-                            'spread_percentage': round(((asks[0][0] - bids[0][0]) / asks[0][0]) * 100, 4)
-                        },
-                        'order_book_depth': {
-                            'bid_levels': len(bids),
-                            'ask_levels': len(asks),
-                            'total_bid_volume': sum([bid[1] for bid in bids]),
-                            'total_ask_volume': sum([ask[1] for ask in asks])
-                        }
-                    }
-                    
-                    total_liquidity += total_exchange_liquidity
-                    successful_exchanges += 1
-                else:
-                    liquidity_data[exchange_name] = {'error': 'Empty orderbook'}
-                    failed_exchanges += 1
-            else:
-                liquidity_data[exchange_name] = {'error': 'No ticker or orderbook data'}
-                failed_exchanges += 1
-                
-        except Exception as e:
-            liquidity_data[exchange_name] = {'error': str(e)}
+            total_liquidity += total_exchange_liquidity
+            successful_exchanges += 1
+        else:
+            liquidity_data[exchange_name] = {'error': 'Empty orderbook'}
             failed_exchanges += 1
     
     # Find best exchanges
     valid_exchanges = {k: v for k, v in liquidity_data.items() if 'error' not in v}
     
     if valid_exchanges:
-        best_liquidity = max(valid_exchanges.items(), 
-                           key=lambda x: x[1]['liquidity_metrics']['total_liquidity_usd'])
-        
-        best_spread = min(valid_exchanges.items(), 
-                         key=lambda x: x[1]['spread_analysis']['spread_percentage'])
-        
-        avg_spread = np.mean([v['spread_analysis']['spread_percentage'] for v in valid_exchanges.values()])
+        # Deepest book and tightest spread in one pass (first exchange wins ties)
+        best_liquidity = best_spread = None
+        spreads = []
+        for name, data in valid_exchanges.items():
+            liquidity = data['liquidity_metrics']['total_liquidity_usd']
+            spread = data['spread_analysis']['spread_percentage']
+            spreads.append(spread)
+            if best_liquidity is None or liquidity > best_liquidity[1]:
+                best_liquidity = (name, liquidity)
+            if best_spread is None or spread < best_spread[1]:
+                best_spread = (name, spread)
+        
+        avg_spread = np.mean(spreads)
         
         return {
             'symbol': symbol,
@@ -1307,6 +1886,8 @@ def get_cross_exchange_liquidity(symbol: str = "BTC/USDT", exchanges: List[str]
         }
 
 @mcp.tool()
+@tool_errors('symbol', 'exchange')
+@ttl_memoize(BOOK_RESULT_CACHE_TTL)
 def get_market_depth_analysis(exchange: str = "binance", symbol: str = "BTC/USDT", 
                              depth_levels: int = 50) -> dict:
     """
@@ -1326,156 +1907,153 @@ def get_market_depth_analysis(exchange: str = "binance", symbol: str = "BTC/USDT
             'status': 'error'
         }
     
-    try:
-        exchange_obj = EXCHANGES[exchange]
-        orderbook = exchange_obj.fetch_order_book(symbol, depth_levels)
-        
-        bids = orderbook.get('bids', [])
-        asks = orderbook.get('asks', [])
-        
-        if not bids or not asks:
-            return {
-                'symbol': symbol,
-                'exchange': exchange,
-                'error': 'Empty orderbook',
-                'status': 'error'
-            }
-        
-        # Calculate mid price
-        best_bid = bids[0][0]
-        best_ask = asks[0][0]
-        mid_price = (best_bid + best_ask) / 2
-        
-        # Calculate total volumes
-        total_bid_volume = sum([bid[1] for bid in bids])
-        total_ask_volume = sum([ask[1] for ask in asks])
-        
-        # Order book imbalance
-        imbalance = (total_bid_volume - total_ask_volume) / (total_bid_volume + total_ask_volume)
-        
-        # Analyze depth at different price levels
-        depth_analysis = {}
-        price_levels = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0]  # Percentage levels
-        
-        for level_pct in price_levels:
-            level_price_up = mid_price * (1 + level_pct / 100)
-            level_price_down = mid_price * (1 - level_pct / 100)
-            
-            bid_volume_at_level = sum([bid[1] for bid in bids if bid[0] >= level_price_down])
-            ask_volume_at_level = sum([ask[1] for ask in asks if ask[0] <= level_price_up])
-            
-            total_volume_at_level = bid_volume_at_level + ask_volume_at_level
-            imbalance_at_level = (bid_volume_at_level - ask_volume_at_level) / total_volume_at_level if total_volume_at_level > 0 else 0
-            
-            depth_analysis[f"{level_pct}%"] = {
-                'bid_volume': round(bid_volume_at_level, 4),
-                'ask_volume': round(ask_volume_at_level, 4),
-                'total_volume': round(total_volume_at_level, 4),
-                'imbalance': round(imbalance_at_level, 3)
-            }
-        
-        # Volume weighted average prices
-        bid_vwap = sum([bid[0] * bid[1] for bid in bids]) / total_bid_volume if total_bid_volume > 0 else 0
-        ask_vwap = sum([ask[0] * ask[1] for ask in asks]) / total_ask_volume if total_ask_volume > 0 else 0
-        
-        # Price impact analysis for different order sizes
-        order_sizes = [1, 5, 10, 25, 50]  # BTC amounts
-        price_impact = {}
-        
-        for size in order_sizes:
-            # Calculate buy impact (market buy order)
-            remaining_size = size
-            total_cost = 0
-            for ask in asks:
-                if remaining_size <= 0:
-                    break
-                volume_to_take = min(remaining_size, ask[1])
-                total_cost += volume_to_take * ask[0]
-                remaining_size -= volume_to_take
-            
-            avg_buy_price = total_cost / size if size > 0 else 0
-            buy_impact = ((avg_buy_price - mid_price) / mid_price) * 100 if mid_price > 0 else 0
-            
-            # Calculate sell impact (market sell order)
-            remaining_size = size
-            total_proceeds = 0
-            for bid in bids:
-                if remaining_size <= 0:
-                    break
-                volume_to_take = min(remaining_size, bid[1])
-                total_proceeds += volume_to_take * bid[0]
-                remaining_size -= volume_to_take
-            
-            avg_sell_price = total_proceeds / size if size > 0 else 0
-            sell_impact = ((mid_price - avg_sell_price) / mid_price) * 100 if mid_price > 0 else 0
-            
-            price_impact[f"{size}_BTC"] = {
-                'buy_impact_pct': round(buy_impact, 3),
-                'sell_impact_pct': round(sell_impact, 3),
-                'avg_buy_price': round(avg_buy_price, 2),
-                'avg_sell_price': round(avg_sell_price, 2)
-            }
-        
-        # Market microstructure indicators
-        liquidity_score = total_bid_volume + total_ask_volume
-        
-        if abs(imbalance) > 0.3:
-            market_balance = "bid_heavy" if imbalance > 0 else "ask_heavy"
-        else:
-            market_balance = "balanced"
-        
-        if liquidity_score > 50:
-            depth_quality = "high"
-        elif liquidity_score > 20:
-            depth_quality = "medium"
-        else:
-            depth_quality = "low"
-        
-        return {
-            'symbol': symbol,
-            'exchange': exchange,
-            'mid_price': round(mid_price, 2),
-            'order_book_summary': {
-                'total_bid_volume': round(total_bid_volume, 4),
-                'total_ask_volume': round(total_ask_volume, 4),
-                'order_book_imbalance': round(imbalance, 3),
-                'bid_levels': len(bids),
-                'ask_levels': len(asks)
-            },
-            'depth_by_price_level': depth_analysis,
-            'volume_weighted_levels': {
-                'bid_vwap': round(bid_vwap, 2),
-                'ask_vwap': round(ask_vwap, 2),
-                'vwap_spread': round(ask_vwap - bid_vwap, 2)
-            },
-            'price_impact_analysis': price_impact,
-            'market_microstructure': {
-                'liquidity_score': round(liquidity_score, 2),
-                'market_balance': market_balance,
-                'depth_quality': depth_quality
-            },
-            'status': 'success'
-        }
-        
-    except Exception as e:
+    exchange_obj = EXCHANGES[exchange]
+    orderbook = exchange_obj.fetch_order_book(symbol, depth_levels)
+    
+    bids = orderbook.get('bids', [])
+    asks = orderbook.get('asks', [])
+    
+    if not bids or not asks:
         return {
             'symbol': symbol,
             'exchange': exchange,
-            'error': str(e),
+            'error': 'Empty orderbook',
             'status': 'error'
         }
+    
+    # Calculate mid price
+    best_bid = bids[0][0]
+    best_ask = asks[0][0]
+    mid_price = (best_bid + best_ask) / 2
+    
+    bid_px, bid_qty = book_side_arrays(bids)
+    ask_px, ask_qty = book_side_arrays(asks)
+    
+    # Calculate total volumes
+    total_bid_volume = float(bid_qty.sum())
+    total_ask_volume = float(ask_qty.sum())
+    
+    # Order book imbalance and volume weighted average prices: one guarded
+    # division (0 where a side or the whole book has no volume)
+    numerators = np.array([total_bid_volume - total_ask_volume, bid_px @ bid_qty, ask_px @ ask_qty])
+    denominators = np.array([total_bid_volume + total_ask_volume, total_bid_volume, total_ask_volume])
+    imbalance, bid_vwap, ask_vwap = np.divide(numerators, denominators, out=np.zeros(3),
+                                              where=denominators > 0).tolist()
+    
+    # Analyze depth at different price levels: one (levels x book) mask per
+    # side, reduced against the volumes with a single matrix product
+    price_levels = [0.1, 0.25, 0.5, 1.0, 2.0, 5.0]  # Percentage levels
+    level_fractions = np.array(price_levels) / 100
+    level_prices_up = mid_price * (1 + level_fractions)
+    level_prices_down = mid_price * (1 - level_fractions)
+    
+    bid_volumes_at_level = (bid_px >= level_prices_down[:, None]) @ bid_qty
+    ask_volumes_at_level = (ask_px <= level_prices_up[:, None]) @ ask_qty
+    
+    total_volumes_at_level = bid_volumes_at_level + ask_volumes_at_level
+    imbalances_at_level = np.divide(bid_volumes_at_level - ask_volumes_at_level, total_volumes_at_level,
+                                    out=np.zeros_like(total_volumes_at_level), where=total_volumes_at_level > 0)
+    
+    # Rounded as whole arrays rather than number by number
+    depth_analysis = {
+        f"{level_pct}%": {
+            'bid_volume': bid_volume,
+            'ask_volume': ask_volume,
+            'total_volume': total_volume,
+            'imbalance': level_imbalance
+        }
+        for level_pct, bid_volume, ask_volume, total_volume, level_imbalance in zip(
+            price_levels,
+            bid_volumes_at_level.round(4).tolist(),
+            ask_volumes_at_level.round(4).tolist(),
+            total_volumes_at_level.round(4).tolist(),
+            imbalances_at_level.round(3).tolist()
+        )
+    }
+    
+    # Price impact analysis for different order sizes
+    order_sizes = [1, 5, 10, 25, 50]  # BTC amounts
+    
+    # Walk both sides for every size at once: market buys take the asks,
+    # market sells hit the bids
+    size_array = np.array(order_sizes, dtype=np.float64)
+    fill_costs = fill_costs_kernel if NUMBA_AVAILABLE else market_fill_costs
+    avg_buy_prices = fill_costs(ask_px, ask_qty, size_array) / size_array
+    avg_sell_prices = fill_costs(bid_px, bid_qty, size_array) / size_array
+    
+    if mid_price > 0:
+        buy_impacts = ((avg_buy_prices - mid_price) / mid_price) * 100
+        sell_impacts = ((mid_price - avg_sell_prices) / mid_price) * 100
+    else:
+        buy_impacts = sell_impacts = np.zeros_like(size_array)
+    
+    price_impact = {
+        f"{size}_BTC": {
+            'buy_impact_pct': buy_impact,
+            'sell_impact_pct': sell_impact,
+            'avg_buy_price': avg_buy_price,
+            'avg_sell_price': avg_sell_price
+        }
+        for size, buy_impact, sell_impact, avg_buy_price, avg_sell_price in zip(
+            order_sizes,
+            buy_impacts.round(3).tolist(),
+            sell_impacts.round(3).tolist(),
+            avg_buy_prices.round(2).tolist(),
+            avg_sell_prices.round(2).tolist()
+        )
+    }
+    
+    # Market microstructure indicators
+    liquidity_score = total_bid_volume + total_ask_volume
+    
+    if abs(imbalance) > 0.3:
+        market_balance = "bid_heavy" if imbalance > 0 else "ask_heavy"
+    else:
+        market_balance = "balanced"
+    
+    if liquidity_score > 50:
+        depth_quality = "high"
+    elif liquidity_score > 20:
+        depth_quality = "medium"
+    else:
+        depth_quality = "low"
+    
+    return {
+        'symbol': symbol,
+        'exchange': exchange,
+        'mid_price': round(mid_price, 2),
+        'order_book_summary': {
+            'total_bid_volume': round(total_bid_volume, 4),
+            'total_ask_volume': round(total_ask_volume, 4),
+            'order_book_imbalance': round(imbalance, 3),
+            'bid_levels': len(bids),
+            'ask_levels': len(asks)
+        },
+        'depth_by_price_level': depth_analysis,
+        'volume_weighted_levels': {
+            'bid_vwap': round(bid_vwap, 2),
+            'ask_vwap': round(ask_vwap, 2),
+            'vwap_spread': round(ask_vwap - bid_vwap, 2)
+        },
+        'price_impact_analysis': price_impact,
+        'market_microstructure': {
+            'liquidity_score': round(liquidity_score, 2),
+            'market_balance': market_balance,
+            'depth_quality': depth_quality
+        },
+        'status': 'success'
+    }
 
 # Add health check endpoint
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request):
     """Health check endpoint for the optimized server"""
-    from starlette.responses import JSONResponse
-    return JSONResponse({
+    return ORJSONResponse({
         "status": "healthy",
         "server": "crypto-exchange-ccxt-ultra",
         "exchanges": list(EXCHANGES.keys()),
         "total_exchanges": len(EXCHANGES),
-        "total_tools": 16,
+        "total_tools": len(await mcp.get_tools()),
         "timestamp": datetime.now().isoformat()
     })
 
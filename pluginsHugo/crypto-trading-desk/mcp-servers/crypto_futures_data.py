@@ -4,7 +4,7 @@ Crypto Futures Data MCP Server
 
 Provides perpetual futures market data using CCXT (no API keys required).
 
-10 Tools:
+11 Tools:
 1. get_funding_rate - Current perpetual funding rate
 2. get_funding_rate_history - Historical funding rates
 3. get_open_interest - Current Open Interest
@@ -15,33 +15,55 @@ Provides perpetual futures market data using CCXT (no API keys required).
 8. compare_funding_rates - Compare funding across exchanges
 9. analyze_funding_trend - Analyze funding rate trend
 10. detect_funding_arbitrage - Detect funding rate arbitrage opportunities
+11. detect_funding_arbitrage_batch - Scan many symbols for funding arbitrage
 
 Supported Exchanges (no API keys):
 - Binance, Bybit, OKX, Bitget, MEXC
 """
 
-import ccxt
+import asyncio
+import ssl
+import aiohttp
+import certifi
+import ccxt.async_support as ccxt_async
+from contextlib import asynccontextmanager
 from fastmcp import FastMCP
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-import statistics
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime
+import functools
 import logging
+import time
+from operator import itemgetter
 
+import numpy as np
+
+from _njit import njit, NUMBA_AVAILABLE
+from _orjson import json_loads, tool_serializer
+from _tool_errors import tool_errors
+from _ttl_cache import TTLCache
 from validators import validate_symbol, validate_exchange, validate_positive_int
 
 logger = logging.getLogger(__name__)
 
-# Initialize MCP server
-mcp = FastMCP("crypto-futures-data")
-
-# Reliable exchanges with public futures data
+# Reliable exchanges with public futures data. Async clients, so tools that
+# query several exchanges (or several endpoints) run the requests concurrently
+# on the server's event loop instead of blocking it one call at a time
 RELIABLE_FUTURES_EXCHANGES = {
-    'binance': ccxt.binance(),
-    'bybit': ccxt.bybit(),
-    'okx': ccxt.okx(),
-    'bitget': ccxt.bitget(),
-    'mexc': ccxt.mexc()
+    'binance': ccxt_async.binance(),
+    'bybit': ccxt_async.bybit(),
+    'okx': ccxt_async.okx(),
+    'bitget': ccxt_async.bitget(),
+    'mexc': ccxt_async.mexc()
 }
+_SUPPORTED_EXCHANGES = frozenset(RELIABLE_FUTURES_EXCHANGES)
+_SUPPORTED_SORTED = sorted(RELIABLE_FUTURES_EXCHANGES)
+
+# Perpetual funding settles every 8 hours; per-funding rate -> annualized %
+FUNDINGS_PER_DAY = 3
+ANNUALIZATION_FACTOR = FUNDINGS_PER_DAY * 365 * 100
+DAILY_PERCENT_FACTOR = FUNDINGS_PER_DAY * 100  # per-funding rate -> daily %
+
+MS_PER_HOUR = 3_600_000  # Exchange timestamps are epoch milliseconds
 
 # Funding rate thresholds (annualized %)
 FUNDING_NEUTRAL_THRESHOLD = 5        # |annual rate| < 5% = neutral
@@ -71,20 +93,205 @@ FUNDING_VOL_MODERATE = 0.0002       # Funding rate stdev > 0.0002 = moderate vol
 
 # Arbitrage thresholds
 MIN_ARBITRAGE_SPREAD_ANNUAL = 10    # Minimum annual % for arbitrage opportunity
+ARBITRAGE_BATCH_MAX_SYMBOLS = 50    # Max symbols per batch arbitrage scan
 
 # Scoring adjustments
 SCORE_FUNDING_EXTREME = 15
 SCORE_LS_RATIO = 10
 SCORE_TAKER_PRESSURE = 10
 
+# Liquidation estimates: common leverages and the fee/maintenance buffer.
+# LONG liquidation = price * (1 - 1/leverage - fees),
+# SHORT liquidation = price * (1 + 1/leverage + fees)
+LIQUIDATION_LEVERAGES = (5, 10, 20, 50, 100)
+LIQUIDATION_FEE_BUFFER = 0.005
+
+_LEVERAGE_LABELS = [f"{lev}x" for lev in LIQUIDATION_LEVERAGES]
+_INVERSE_LEVERAGES = 1 / np.array(LIQUIDATION_LEVERAGES, dtype=np.float64)
+_LONG_LIQUIDATION_FACTORS = 1 - _INVERSE_LEVERAGES - LIQUIDATION_FEE_BUFFER
+_SHORT_LIQUIDATION_FACTORS = 1 + _INVERSE_LEVERAGES + LIQUIDATION_FEE_BUFFER
+
+# Raw exchange responses are reused for this long (seconds), keyed on
+# (exchange, symbol). Funding settles every 8h; OI and prices move faster.
+FUNDING_CACHE_TTL = 300
+OPEN_INTEREST_CACHE_TTL = 30
+TICKER_CACHE_TTL = 5
+
+_FUNDING_CACHE = TTLCache(ttl=FUNDING_CACHE_TTL)
+_OPEN_INTEREST_CACHE = TTLCache(ttl=OPEN_INTEREST_CACHE_TTL)
+_TICKER_CACHE = TTLCache(ttl=TICKER_CACHE_TTL)
+
+# Fetches in flight, keyed on (method, exchange, symbol): concurrent misses
+# for the same data (e.g. a batch arbitrage scan next to a comparison) wait
+# on one request instead of each sending their own
+_PENDING_FETCHES: Dict[Tuple[str, str, str], asyncio.Future] = {}
+
+# Funding rates pushed over WebSocket (ccxt.pro watch_funding_rate) on the
+# exchanges that stream them: the first request for a market starts a stream
+# that keeps its _FUNDING_CACHE entry current, so later requests (e.g. every
+# arbitrage scan) are served from memory. Other exchanges poll over REST.
+FUNDING_STREAM_EXCHANGES = ('okx', 'mexc')
+FUNDING_STREAM_IDLE_TIMEOUT = 300  # Seconds without reads before a stream is stopped
+_FUNDING_STREAMS: Dict[Tuple[str, str], Dict[str, Any]] = {}  # (exchange, symbol) -> stream state
+_PRO_EXCHANGES: Dict[str, Any] = {}  # WebSocket clients, created on the first stream
+
+# Client-side request pacing per API. ccxt's throttler spaces requests but
+# does not react to rate-limit responses; these buckets halve their rate for
+# a while after a 429/418 so the server backs off before it gets banned
+RATE_LIMIT_BURST = 10              # Requests allowed back-to-back
+RATE_LIMIT_PENALTY_SECONDS = 60    # Slowdown after a rate-limit response
+BINANCE_DATA_RATE_PER_MINUTE = 200  # futures/data endpoints: 1000 per 5 min per IP
+
+
+class TokenBucket:
+    """
+    Token bucket pacing the requests sent to one API.
+
+    Holds up to `burst` tokens, refilled at `rate_per_minute`; each request
+    takes one, waiting for the refill when the bucket is empty. `penalize()`
+    empties it and halves the refill rate for RATE_LIMIT_PENALTY_SECONDS.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = RATE_LIMIT_BURST):
+        self.rate_per_minute = rate_per_minute
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.penalized_until = 0.0
+
+    def _refill_rate(self, now: float) -> float:
+        """Tokens added per second."""
+        rate = self.rate_per_minute / 60
+        return rate / 2 if now < self.penalized_until else rate
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            now = time.monotonic()
+            rate = self._refill_rate(now)
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / rate)
+
+    def penalize(self) -> None:
+        """Back off after the API answered with a rate-limit error."""
+        self.tokens = 0.0
+        self.penalized_until = time.monotonic() + RATE_LIMIT_PENALTY_SECONDS
+
+
+# One bucket per exchange at ccxt's own pace (rateLimit = ms between requests)
+_EXCHANGE_LIMITERS = {
+    name: TokenBucket(60_000 / exchange.rateLimit) for name, exchange in RELIABLE_FUTURES_EXCHANGES.items()
+}
+_BINANCE_DATA_LIMITER = TokenBucket(BINANCE_DATA_RATE_PER_MINUTE)
+
+# Keep-alive session for the Binance futures data endpoints (fapi), which
+# ccxt does not wrap; 429s, 5xx and dropped connections are retried with
+# exponential backoff. Opened on first use so it binds to the server's loop.
+BINANCE_POOL_SIZE = 20
+BINANCE_REQUEST_TIMEOUT = 10  # seconds
+BINANCE_RETRIES = 3
+BINANCE_RETRY_BACKOFF = 0.3   # seconds, doubled on each retry
+BINANCE_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+BINANCE_RATE_LIMIT_STATUSES = frozenset({418, 429})  # 418 = IP banned after ignoring 429s
+_BINANCE_SESSION = None
+
+
+def _binance_session() -> aiohttp.ClientSession:
+    """Shared aiohttp session for the Binance futures data endpoints."""
+    global _BINANCE_SESSION
+    if _BINANCE_SESSION is None or _BINANCE_SESSION.closed:
+        connector = aiohttp.TCPConnector(
+            limit=BINANCE_POOL_SIZE,
+            ssl=ssl.create_default_context(cafile=certifi.where())  # Same CA bundle as ccxt
+        )
+        _BINANCE_SESSION = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=BINANCE_REQUEST_TIMEOUT)
+        )
+    return _BINANCE_SESSION
+
+
+async def _binance_get(url: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+    """
+    GET a Binance futures data endpoint.
+
+    Returns:
+        (HTTP status, parsed JSON body or None when the status is not 200)
+    """
+    for attempt in range(BINANCE_RETRIES + 1):
+        last_attempt = attempt == BINANCE_RETRIES
+        await _BINANCE_DATA_LIMITER.acquire()
+        try:
+            async with _binance_session().get(url, params=params) as resp:
+                if resp.status in BINANCE_RATE_LIMIT_STATUSES:
+                    _BINANCE_DATA_LIMITER.penalize()
+                if resp.status not in BINANCE_RETRY_STATUSES or last_attempt:
+                    body = json_loads(await resp.read()) if resp.status == 200 else None
+                    return resp.status, body
+        except aiohttp.ClientConnectionError:
+            if last_attempt:
+                raise
+        await asyncio.sleep(BINANCE_RETRY_BACKOFF * 2 ** attempt)
+
+
+async def preload_markets():
+    """
+    Load every exchange's markets up front.
+
+    ccxt loads markets lazily on the first call per exchange (a large
+    exchangeInfo download); doing it at startup keeps that off the first
+    tool request. Failures are logged and left to the lazy path.
+    """
+    results = await asyncio.gather(
+        *(exchange.load_markets() for exchange in RELIABLE_FUTURES_EXCHANGES.values()),
+        return_exceptions=True
+    )
+    for name, result in zip(RELIABLE_FUTURES_EXCHANGES, results):
+        if isinstance(result, Exception):
+            logger.warning("Preloading %s markets failed: %s", name, result)
+
+
+async def close_all():
+    """Stop the funding streams; close the exchange clients and the Binance session."""
+    for stream in list(_FUNDING_STREAMS.values()):
+        stream['task'].cancel()
+    await asyncio.gather(
+        *(exchange.close() for exchange in [*RELIABLE_FUTURES_EXCHANGES.values(), *_PRO_EXCHANGES.values()]),
+        return_exceptions=True
+    )
+    if _BINANCE_SESSION is not None:
+        await _BINANCE_SESSION.close()
+
+
+@asynccontextmanager
+async def futures_lifespan(server):
+    """Preload exchange markets in the background; close every connection pool on shutdown."""
+    if NUMBA_AVAILABLE:
+        await asyncio.to_thread(warm_kernels)  # JIT cost at startup, not on the first request
+    preload = asyncio.create_task(preload_markets())
+    try:
+        yield
+    finally:
+        preload.cancel()
+        await close_all()
+
+
+# Initialize MCP server
+mcp = FastMCP("crypto-futures-data", lifespan=futures_lifespan, tool_serializer=tool_serializer)
+
 
 def _get_exchange(exchange_name: str):
     """Get exchange instance."""
     if exchange_name not in RELIABLE_FUTURES_EXCHANGES:
-        raise ValueError(f"Unsupported exchange: {exchange_name}. Supported: {sorted(RELIABLE_FUTURES_EXCHANGES.keys())}")
+        raise ValueError(f"Unsupported exchange: {exchange_name}. Supported: {_SUPPORTED_SORTED}")
     return RELIABLE_FUTURES_EXCHANGES[exchange_name]
 
 
+@functools.lru_cache(maxsize=256)
 def _format_symbol(symbol: str) -> str:
     """
     Format symbol for perpetual futures.
@@ -98,8 +305,142 @@ def _format_symbol(symbol: str) -> str:
     return f"{symbol}/USDT:USDT"
 
 
+async def _exchange_call(exchange_name: str, method: str, *args, **kwargs) -> Any:
+    """Call a ccxt method once the exchange's rate limiter allows it."""
+    exchange = _get_exchange(exchange_name)
+    limiter = _EXCHANGE_LIMITERS[exchange_name]
+    await limiter.acquire()
+    try:
+        return await getattr(exchange, method)(*args, **kwargs)
+    except (ccxt_async.RateLimitExceeded, ccxt_async.DDoSProtection):
+        limiter.penalize()
+        raise
+
+
+async def _cached_fetch(cache: TTLCache, method: str, exchange_name: str, formatted_symbol: str) -> Dict[str, Any]:
+    """
+    Call an exchange fetch method, reusing its response while `cache` holds
+    it and sharing one request between concurrent callers on a miss.
+    """
+    key = (exchange_name, formatted_symbol)
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    pending_key = (method, exchange_name, formatted_symbol)
+    pending = _PENDING_FETCHES.get(pending_key)
+    if pending is None:
+        async def fetch():
+            response = await _exchange_call(exchange_name, method, formatted_symbol)
+            cache.set(key, response)
+            return response
+
+        pending = asyncio.ensure_future(fetch())
+        _PENDING_FETCHES[pending_key] = pending
+        pending.add_done_callback(lambda _: _PENDING_FETCHES.pop(pending_key, None))
+    # Shielded so one caller giving up does not cancel the others' request
+    return await asyncio.shield(pending)
+
+
+def _pro_exchange(exchange_name: str):
+    """WebSocket client for an exchange; keeps ccxt.pro's own rate limit."""
+    exchange = _PRO_EXCHANGES.get(exchange_name)
+    if exchange is None:
+        import ccxt.pro as ccxt_pro  # Only loaded once a funding rate is streamed
+        exchange = _PRO_EXCHANGES[exchange_name] = getattr(ccxt_pro, exchange_name)()
+    return exchange
+
+
+async def _maintain_funding_stream(exchange_name: str, formatted_symbol: str):
+    """Keep a market's _FUNDING_CACHE entry current until nobody reads it."""
+    key = (exchange_name, formatted_symbol)
+    stream = _FUNDING_STREAMS[key]
+    exchange = _pro_exchange(exchange_name)
+    try:
+        while time.monotonic() - stream['last_read'] < FUNDING_STREAM_IDLE_TIMEOUT:
+            _FUNDING_CACHE.set(key, await exchange.watch_funding_rate(formatted_symbol))
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.warning("Funding rate stream %s %s stopped: %s", exchange_name, formatted_symbol, e)
+    finally:
+        if _FUNDING_STREAMS.get(key) is stream:
+            del _FUNDING_STREAMS[key]
+
+
+def _watch_funding_rate(exchange_name: str, formatted_symbol: str):
+    """Start (or keep alive) the funding stream of a market on exchanges that push one."""
+    if exchange_name not in FUNDING_STREAM_EXCHANGES:
+        return
+    key = (exchange_name, formatted_symbol)
+    now = time.monotonic()
+    stream = _FUNDING_STREAMS.get(key)
+    if stream is None:
+        stream = _FUNDING_STREAMS[key] = {'last_read': now}
+        stream['task'] = asyncio.create_task(_maintain_funding_stream(exchange_name, formatted_symbol))
+    else:
+        stream['last_read'] = now
+
+
+async def _fetch_funding_rate(exchange_name: str, formatted_symbol: str) -> Dict[str, Any]:
+    """
+    Fetch the current funding rate (cached for FUNDING_CACHE_TTL, and kept
+    current by a WebSocket stream on FUNDING_STREAM_EXCHANGES).
+    """
+    _watch_funding_rate(exchange_name, formatted_symbol)
+    return await _cached_fetch(_FUNDING_CACHE, 'fetch_funding_rate', exchange_name, formatted_symbol)
+
+
+async def _fetch_open_interest(exchange_name: str, formatted_symbol: str) -> Dict[str, Any]:
+    """Fetch the current open interest (cached for OPEN_INTEREST_CACHE_TTL)."""
+    return await _cached_fetch(_OPEN_INTEREST_CACHE, 'fetch_open_interest', exchange_name, formatted_symbol)
+
+
+async def _fetch_ticker(exchange_name: str, formatted_symbol: str) -> Dict[str, Any]:
+    """Fetch the perpetual ticker (cached for TICKER_CACHE_TTL)."""
+    return await _cached_fetch(_TICKER_CACHE, 'fetch_ticker', exchange_name, formatted_symbol)
+
+
+async def _funding_rate_report(exchange: str, formatted_symbol: str) -> Dict[str, Any]:
+    """Funding rate analysis for a validated exchange and formatted symbol."""
+    funding_rate = await _fetch_funding_rate(exchange, formatted_symbol)
+
+    # Annualized funding rate
+    rate = funding_rate['fundingRate']
+    annual_rate = rate * ANNUALIZATION_FACTOR
+
+    # Next funding time
+    next_funding = datetime.fromtimestamp(funding_rate['fundingTimestamp'] / 1000)
+
+    # Analysis
+    if abs(annual_rate) < FUNDING_NEUTRAL_THRESHOLD:
+        bias = "NEUTRAL"
+        interpretation = "Neutral funding rate, balanced market"
+    elif annual_rate > FUNDING_NEUTRAL_THRESHOLD:
+        bias = "BULLISH_EXTREME"
+        interpretation = "Very positive funding rate - Longs paying Shorts - Possible correction"
+    else:
+        bias = "BEARISH_EXTREME"
+        interpretation = "Very negative funding rate - Shorts paying Longs - Possible bounce"
+
+    return {
+        "success": True,
+        "exchange": exchange,
+        "symbol": formatted_symbol,
+        "funding_rate": rate,
+        "funding_rate_percentage": rate * 100,
+        "annual_rate_percentage": round(annual_rate, 2),
+        "next_funding_time": next_funding.isoformat(),
+        "time_until_funding": str(next_funding - datetime.now()),
+        "market_bias": bias,
+        "interpretation": interpretation,
+        "raw_data": funding_rate
+    }
+
+
 @mcp.tool()
-def get_funding_rate(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def get_funding_rate(
     symbol: str = "BTC",
     exchange: str = "binance"
 ) -> Dict[str, Any]:
@@ -113,63 +454,65 @@ def get_funding_rate(
     Returns:
         Current funding rate, next funding time, and analysis
     """
-    try:
-        symbol = validate_symbol(symbol)
-        exchange = validate_exchange(exchange, supported=set(RELIABLE_FUTURES_EXCHANGES.keys()))
+    symbol = validate_symbol(symbol)
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
 
-        ex = _get_exchange(exchange)
-        formatted_symbol = _format_symbol(symbol)
+    return await _funding_rate_report(exchange, _format_symbol(symbol))
 
-        funding_rate = ex.fetch_funding_rate(formatted_symbol)
 
-        # Annualized funding rate
-        rate = funding_rate['fundingRate']
-        annual_rate = rate * 3 * 365 * 100  # 3 times per day
-
-        # Next funding time
-        next_funding = datetime.fromtimestamp(funding_rate['fundingTimestamp'] / 1000)
-
-        # Analysis
-        if abs(annual_rate) < FUNDING_NEUTRAL_THRESHOLD:
-            bias = "NEUTRAL"
-            interpretation = "Neutral funding rate, balanced market"
-        elif annual_rate > FUNDING_NEUTRAL_THRESHOLD:
-            bias = "BULLISH_EXTREME"
-            interpretation = "Very positive funding rate - Longs paying Shorts - Possible correction"
-        else:
-            bias = "BEARISH_EXTREME"
-            interpretation = "Very negative funding rate - Shorts paying Longs - Possible bounce"
-
-        return {
-            "success": True,
-            "exchange": exchange,
-            "symbol": formatted_symbol,
-            "funding_rate": rate,
-            "funding_rate_percentage": rate * 100,
-            "annual_rate_percentage": round(annual_rate, 2),
-            "next_funding_time": next_funding.isoformat(),
-            "time_until_funding": str(next_funding - datetime.now()),
-            "market_bias": bias,
-            "interpretation": interpretation,
-            "raw_data": funding_rate
-        }
+async def _funding_history_report(exchange: str, formatted_symbol: str, hours: int,
+                                  include_history: bool) -> Dict[str, Any]:
+    """Funding rate history statistics for a validated exchange and formatted symbol."""
+    since = int(time.time() * 1000) - hours * MS_PER_HOUR
+    history = await _exchange_call(exchange, 'fetch_funding_rate_history', formatted_symbol, since=since)
 
-    except Exception as e:
-        logger.exception("get_funding_rate failed")
+    if not history:
         return {
             "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
+            "error": "No funding rate history available",
+            "error_type": "NoDataError",
             "exchange": exchange,
-            "symbol": symbol
+            "symbol": formatted_symbol
         }
 
+    rates = np.fromiter((h['fundingRate'] for h in history), dtype=np.float64, count=len(history))
+
+    avg_rate = float(rates.mean())
+    max_rate = float(rates.max())
+    min_rate = float(rates.min())
+
+    # Trend (last 8 vs first 8 funding rates)
+    if len(rates) >= 16:
+        recent_avg = rates[-8:].mean()
+        older_avg = rates[:8].mean()
+        trend = "INCREASING" if recent_avg > older_avg else "DECREASING"
+    else:
+        trend = "INSUFFICIENT_DATA"
+
+    return {
+        "success": True,
+        "exchange": exchange,
+        "symbol": formatted_symbol,
+        "period_hours": hours,
+        "total_fundings": len(rates),
+        "average_rate": avg_rate,
+        "average_rate_percentage": avg_rate * 100,
+        "max_rate": max_rate,
+        "min_rate": min_rate,
+        "current_rate": float(rates[-1]),
+        "trend": trend,
+        "annual_rate_avg": round(avg_rate * ANNUALIZATION_FACTOR, 2),
+        **({"history": history[-20:]} if include_history else {})
+    }
+
 
 @mcp.tool()
-def get_funding_rate_history(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def get_funding_rate_history(
     symbol: str = "BTC",
     exchange: str = "binance",
-    hours: int = 24
+    hours: int = 24,
+    include_history: bool = False
 ) -> Dict[str, Any]:
     """
     Get historical funding rates.
@@ -178,73 +521,53 @@ def get_funding_rate_history(
         symbol: Symbol (BTC, ETH, etc.)
         exchange: Exchange
         hours: Hours of history (default 24)
+        include_history: Include the last 20 raw funding entries (default False)
 
     Returns:
         Historical funding rates with statistics
     """
-    try:
-        symbol = validate_symbol(symbol)
-        exchange = validate_exchange(exchange, supported=set(RELIABLE_FUTURES_EXCHANGES.keys()))
-        hours = validate_positive_int(hours, "hours", max_value=720)
-
-        ex = _get_exchange(exchange)
-        formatted_symbol = _format_symbol(symbol)
-
-        since = int((datetime.now() - timedelta(hours=hours)).timestamp() * 1000)
-        history = ex.fetch_funding_rate_history(formatted_symbol, since=since)
-
-        if not history:
-            return {
-                "success": False,
-                "error": "No funding rate history available",
-                "error_type": "NoDataError",
-                "exchange": exchange,
-                "symbol": formatted_symbol
-            }
-
-        rates = [h['fundingRate'] for h in history]
-
-        avg_rate = statistics.mean(rates)
-        max_rate = max(rates)
-        min_rate = min(rates)
-
-        # Trend (last 8 vs first 8 funding rates)
-        if len(rates) >= 16:
-            recent_avg = statistics.mean(rates[-8:])
-            older_avg = statistics.mean(rates[:8])
-            trend = "INCREASING" if recent_avg > older_avg else "DECREASING"
-        else:
-            trend = "INSUFFICIENT_DATA"
+    symbol = validate_symbol(symbol)
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
+    hours = validate_positive_int(hours, "hours", max_value=720)
 
-        return {
-            "success": True,
-            "exchange": exchange,
-            "symbol": formatted_symbol,
-            "period_hours": hours,
-            "total_fundings": len(rates),
-            "average_rate": avg_rate,
-            "average_rate_percentage": avg_rate * 100,
-            "max_rate": max_rate,
-            "min_rate": min_rate,
-            "current_rate": rates[-1],
-            "trend": trend,
-            "annual_rate_avg": round(avg_rate * 3 * 365 * 100, 2),
-            "history": history[-20:]
-        }
+    return await _funding_history_report(exchange, _format_symbol(symbol), hours, include_history)
 
-    except Exception as e:
-        logger.exception("get_funding_rate_history failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
-        }
+
+async def _open_interest_report(exchange: str, formatted_symbol: str) -> Dict[str, Any]:
+    """Open interest analysis for a validated exchange and formatted symbol."""
+    oi = await _fetch_open_interest(exchange, formatted_symbol)
+
+    ticker = await _fetch_ticker(exchange, formatted_symbol)
+    current_price = ticker['last']
+
+    oi_value = oi['openInterestAmount']
+    oi_contracts = oi['openInterestValue']
+
+    oi_btc_equivalent = oi_value / current_price if current_price else 0
+
+    interpretation = []
+    if oi_btc_equivalent > 100000:
+        interpretation.append("Very high OI - High liquidity and participation")
+    elif oi_btc_equivalent < 50000:
+        interpretation.append("Low OI - Low futures participation")
+
+    return {
+        "success": True,
+        "exchange": exchange,
+        "symbol": formatted_symbol,
+        "open_interest_usd": oi_value,
+        "open_interest_contracts": oi_contracts,
+        "open_interest_btc_equivalent": round(oi_btc_equivalent, 2),
+        "current_price": current_price,
+        "timestamp": oi['timestamp'],
+        "interpretation": " | ".join(interpretation) if interpretation else "Normal OI",
+        "raw_data": oi
+    }
 
 
 @mcp.tool()
-def get_open_interest(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def get_open_interest(
     symbol: str = "BTC",
     exchange: str = "binance"
 ) -> Dict[str, Any]:
@@ -261,55 +584,90 @@ def get_open_interest(
     Returns:
         Current Open Interest and trend analysis
     """
-    try:
-        symbol = validate_symbol(symbol)
-        exchange = validate_exchange(exchange, supported=set(RELIABLE_FUTURES_EXCHANGES.keys()))
-
-        ex = _get_exchange(exchange)
-        formatted_symbol = _format_symbol(symbol)
-
-        oi = ex.fetch_open_interest(formatted_symbol)
-
-        ticker = ex.fetch_ticker(formatted_symbol)
-        current_price = ticker['last']
-
-        oi_value = oi['openInterestAmount']
-        oi_contracts = oi['openInterestValue']
-
-        oi_btc_equivalent = oi_value / current_price if current_price else 0
-
-        interpretation = []
-        if oi_btc_equivalent > 100000:
-            interpretation.append("Very high OI - High liquidity and participation")
-        elif oi_btc_equivalent < 50000:
-            interpretation.append("Low OI - Low futures participation")
-
+    symbol = validate_symbol(symbol)
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
+
+    return await _open_interest_report(exchange, _format_symbol(symbol))
+
+
+async def _long_short_ratio_report(symbol: str, period: str) -> Dict[str, Any]:
+    """Binance top-trader and global long/short ratios for a validated symbol."""
+    base_symbol = symbol.replace("/", "").replace(":USDT", "")
+
+    # Top Trader Long/Short Ratio (Positions)
+    url_top = "https://fapi.binance.com/futures/data/topLongShortPositionRatio"
+    params_top = {
+        "symbol": f"{base_symbol}USDT",
+        "period": period,
+        "limit": 1
+    }
+
+    # Global Long/Short Ratio (Accounts)
+    url_global = "https://fapi.binance.com/futures/data/globalLongShortAccountRatio"
+    params_global = {
+        "symbol": f"{base_symbol}USDT",
+        "period": period,
+        "limit": 1
+    }
+
+    # Both ratios are independent requests; issue them together
+    (status_top, body_top), (status_global, body_global) = await asyncio.gather(
+        _binance_get(url_top, params_top),
+        _binance_get(url_global, params_global)
+    )
+
+    if status_top != 200 or status_global != 200:
         return {
-            "success": True,
-            "exchange": exchange,
-            "symbol": formatted_symbol,
-            "open_interest_usd": oi_value,
-            "open_interest_contracts": oi_contracts,
-            "open_interest_btc_equivalent": round(oi_btc_equivalent, 2),
-            "current_price": current_price,
-            "timestamp": oi['timestamp'],
-            "interpretation": " | ".join(interpretation) if interpretation else "Normal OI",
-            "raw_data": oi
+            "success": False,
+            "error": "Error fetching Long/Short ratio from Binance",
+            "error_type": "APIError",
+            "status_top": status_top,
+            "status_global": status_global
         }
 
-    except Exception as e:
-        logger.exception("get_open_interest failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
+    data_top = body_top[0] if body_top else {}
+    data_global = body_global[0] if body_global else {}
+
+    top_ratio = float(data_top.get('longShortRatio', 0))
+    global_ratio = float(data_global.get('longShortRatio', 0))
+
+    # Analysis
+    if top_ratio > LS_EXTREMELY_BULLISH:
+        sentiment_top = "EXTREMELY_BULLISH"
+        interpretation_top = "Top traders very long - Possible reversal"
+    elif top_ratio > LS_BULLISH:
+        sentiment_top = "BULLISH"
+        interpretation_top = "Top traders moderately long"
+    elif top_ratio < LS_EXTREMELY_BEARISH:
+        sentiment_top = "EXTREMELY_BEARISH"
+        interpretation_top = "Top traders very short - Possible reversal"
+    elif top_ratio < LS_BEARISH:
+        sentiment_top = "BEARISH"
+        interpretation_top = "Top traders moderately short"
+    else:
+        sentiment_top = "NEUTRAL"
+        interpretation_top = "Top traders balanced"
+
+    return {
+        "success": True,
+        "exchange": "binance",
+        "symbol": f"{base_symbol}USDT",
+        "period": period,
+        "top_trader_long_short_ratio": top_ratio,
+        "global_long_short_ratio": global_ratio,
+        "top_trader_sentiment": sentiment_top,
+        "interpretation": interpretation_top,
+        "divergence": abs(top_ratio - global_ratio) > 0.3,
+        "raw_data": {
+            "top_traders": data_top,
+            "global": data_global
         }
+    }
 
 
 @mcp.tool()
-def get_long_short_ratio(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def get_long_short_ratio(
     symbol: str = "BTC",
     exchange: str = "binance",
     period: str = "5m"
@@ -335,92 +693,72 @@ def get_long_short_ratio(
             "exchange": exchange
         }
 
-    try:
-        symbol = validate_symbol(symbol)
-        import requests
+    symbol = validate_symbol(symbol)
 
-        base_symbol = symbol.replace("/", "").replace(":USDT", "")
+    return await _long_short_ratio_report(symbol, period)
 
-        # Top Trader Long/Short Ratio (Positions)
-        url_top = "https://fapi.binance.com/futures/data/topLongShortPositionRatio"
-        params_top = {
-            "symbol": f"{base_symbol}USDT",
-            "period": period,
-            "limit": 1
-        }
 
-        # Global Long/Short Ratio (Accounts)
-        url_global = "https://fapi.binance.com/futures/data/globalLongShortAccountRatio"
-        params_global = {
-            "symbol": f"{base_symbol}USDT",
-            "period": period,
-            "limit": 1
-        }
+async def _taker_ratio_report(symbol: str, period: str) -> Dict[str, Any]:
+    """Binance taker buy/sell volume ratio for a validated symbol."""
+    base_symbol = symbol.replace("/", "").replace(":USDT", "")
 
-        resp_top = requests.get(url_top, params=params_top, timeout=10)
-        resp_global = requests.get(url_global, params=params_global, timeout=10)
-
-        if resp_top.status_code != 200 or resp_global.status_code != 200:
-            return {
-                "success": False,
-                "error": "Error fetching Long/Short ratio from Binance",
-                "error_type": "APIError",
-                "status_top": resp_top.status_code,
-                "status_global": resp_global.status_code
-            }
-
-        data_top = resp_top.json()[0] if resp_top.json() else {}
-        data_global = resp_global.json()[0] if resp_global.json() else {}
-
-        top_ratio = float(data_top.get('longShortRatio', 0))
-        global_ratio = float(data_global.get('longShortRatio', 0))
-
-        # Analysis
-        if top_ratio > LS_EXTREMELY_BULLISH:
-            sentiment_top = "EXTREMELY_BULLISH"
-            interpretation_top = "Top traders very long - Possible reversal"
-        elif top_ratio > LS_BULLISH:
-            sentiment_top = "BULLISH"
-            interpretation_top = "Top traders moderately long"
-        elif top_ratio < LS_EXTREMELY_BEARISH:
-            sentiment_top = "EXTREMELY_BEARISH"
-            interpretation_top = "Top traders very short - Possible reversal"
-        elif top_ratio < LS_BEARISH:
-            sentiment_top = "BEARISH"
-            interpretation_top = "Top traders moderately short"
-        else:
-            sentiment_top = "NEUTRAL"
-            interpretation_top = "Top traders balanced"
+    url = "https://fapi.binance.com/futures/data/takerlongshortRatio"
+    params = {
+        "symbol": f"{base_symbol}USDT",
+        "period": period,
+        "limit": 1
+    }
 
-        return {
-            "success": True,
-            "exchange": "binance",
-            "symbol": f"{base_symbol}USDT",
-            "period": period,
-            "top_trader_long_short_ratio": top_ratio,
-            "global_long_short_ratio": global_ratio,
-            "top_trader_sentiment": sentiment_top,
-            "interpretation": interpretation_top,
-            "divergence": abs(top_ratio - global_ratio) > 0.3,
-            "raw_data": {
-                "top_traders": data_top,
-                "global": data_global
-            }
-        }
+    status, body = await _binance_get(url, params)
 
-    except Exception as e:
-        logger.exception("get_long_short_ratio failed")
+    if status != 200:
         return {
             "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
+            "error": f"Error fetching taker ratio: {status}",
+            "error_type": "APIError",
+            "exchange": "binance"
         }
 
+    data = body[0] if body else {}
+
+    buy_sell_ratio = float(data.get('buySellRatio', 0))
+    buy_vol = float(data.get('buyVol', 0))
+    sell_vol = float(data.get('sellVol', 0))
+
+    # Pressure analysis
+    if buy_sell_ratio > TAKER_STRONG_BUY:
+        pressure = "STRONG_BUY_PRESSURE"
+        interpretation = "Strong buy pressure - Takers buying aggressively"
+    elif buy_sell_ratio > TAKER_MODERATE_BUY:
+        pressure = "MODERATE_BUY_PRESSURE"
+        interpretation = "Moderate buy pressure"
+    elif buy_sell_ratio < TAKER_STRONG_SELL:
+        pressure = "STRONG_SELL_PRESSURE"
+        interpretation = "Strong sell pressure - Takers selling aggressively"
+    elif buy_sell_ratio < TAKER_MODERATE_SELL:
+        pressure = "MODERATE_SELL_PRESSURE"
+        interpretation = "Moderate sell pressure"
+    else:
+        pressure = "BALANCED"
+        interpretation = "Balanced pressure between buyers and sellers"
+
+    return {
+        "success": True,
+        "exchange": "binance",
+        "symbol": f"{base_symbol}USDT",
+        "period": period,
+        "buy_sell_ratio": buy_sell_ratio,
+        "taker_buy_volume": buy_vol,
+        "taker_sell_volume": sell_vol,
+        "market_pressure": pressure,
+        "interpretation": interpretation,
+        "raw_data": data
+    }
+
 
 @mcp.tool()
-def get_taker_buy_sell_ratio(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def get_taker_buy_sell_ratio(
     symbol: str = "BTC",
     exchange: str = "binance",
     period: str = "5m"
@@ -449,78 +787,53 @@ def get_taker_buy_sell_ratio(
             "exchange": exchange
         }
 
-    try:
-        symbol = validate_symbol(symbol)
-        import requests
+    symbol = validate_symbol(symbol)
 
-        base_symbol = symbol.replace("/", "").replace(":USDT", "")
+    return await _taker_ratio_report(symbol, period)
 
-        url = "https://fapi.binance.com/futures/data/takerlongshortRatio"
-        params = {
-            "symbol": f"{base_symbol}USDT",
-            "period": period,
-            "limit": 1
-        }
 
-        resp = requests.get(url, params=params, timeout=10)
-
-        if resp.status_code != 200:
-            return {
-                "success": False,
-                "error": f"Error fetching taker ratio: {resp.status_code}",
-                "error_type": "APIError",
-                "exchange": exchange
-            }
-
-        data = resp.json()[0] if resp.json() else {}
-
-        buy_sell_ratio = float(data.get('buySellRatio', 0))
-        buy_vol = float(data.get('buyVol', 0))
-        sell_vol = float(data.get('sellVol', 0))
-
-        # Pressure analysis
-        if buy_sell_ratio > TAKER_STRONG_BUY:
-            pressure = "STRONG_BUY_PRESSURE"
-            interpretation = "Strong buy pressure - Takers buying aggressively"
-        elif buy_sell_ratio > TAKER_MODERATE_BUY:
-            pressure = "MODERATE_BUY_PRESSURE"
-            interpretation = "Moderate buy pressure"
-        elif buy_sell_ratio < TAKER_STRONG_SELL:
-            pressure = "STRONG_SELL_PRESSURE"
-            interpretation = "Strong sell pressure - Takers selling aggressively"
-        elif buy_sell_ratio < TAKER_MODERATE_SELL:
-            pressure = "MODERATE_SELL_PRESSURE"
-            interpretation = "Moderate sell pressure"
-        else:
-            pressure = "BALANCED"
-            interpretation = "Balanced pressure between buyers and sellers"
+async def _liquidation_report(exchange: str, formatted_symbol: str, current_price: Optional[float]) -> Dict[str, Any]:
+    """Liquidation levels for a validated exchange and formatted symbol."""
+    if current_price is None:
+        ticker = await _fetch_ticker(exchange, formatted_symbol)
+        current_price = ticker['last']
 
-        return {
-            "success": True,
-            "exchange": "binance",
-            "symbol": f"{base_symbol}USDT",
-            "period": period,
-            "buy_sell_ratio": buy_sell_ratio,
-            "taker_buy_volume": buy_vol,
-            "taker_sell_volume": sell_vol,
-            "market_pressure": pressure,
-            "interpretation": interpretation,
-            "raw_data": data
+    # Round with Python's round(): np.round scales by 100 first and can
+    # land on the other side of a tie, moving a level by a cent
+    long_liqs = (current_price * _LONG_LIQUIDATION_FACTORS).tolist()
+    short_liqs = (current_price * _SHORT_LIQUIDATION_FACTORS).tolist()
+
+    liquidation_levels = {
+        "longs": {label: round(liq, 2) for label, liq in zip(_LEVERAGE_LABELS, long_liqs)},
+        "shorts": {label: round(liq, 2) for label, liq in zip(_LEVERAGE_LABELS, short_liqs)}
+    }
+
+    # Critical zones (where most liquidity accumulates)
+    critical_zones = {
+        "long_liquidations": {
+            "10x_zone": f"${round(liquidation_levels['longs']['10x'], 0)} (10x leverage)",
+            "20x_zone": f"${round(liquidation_levels['longs']['20x'], 0)} (20x leverage)"
+        },
+        "short_liquidations": {
+            "10x_zone": f"${round(liquidation_levels['shorts']['10x'], 0)} (10x leverage)",
+            "20x_zone": f"${round(liquidation_levels['shorts']['20x'], 0)} (20x leverage)"
         }
+    }
 
-    except Exception as e:
-        logger.exception("get_taker_buy_sell_ratio failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    return {
+        "success": True,
+        "exchange": exchange,
+        "symbol": formatted_symbol,
+        "current_price": current_price,
+        "liquidation_levels": liquidation_levels,
+        "critical_zones": critical_zones,
+        "interpretation": "Liquidation zones are price magnets - High probability of hunting"
+    }
 
 
 @mcp.tool()
-def calculate_liquidation_levels(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def calculate_liquidation_levels(
     symbol: str = "BTC",
     exchange: str = "binance",
     current_price: Optional[float] = None
@@ -536,71 +849,40 @@ def calculate_liquidation_levels(
     Returns:
         Liquidation levels for longs and shorts at different leverages
     """
-    try:
-        symbol = validate_symbol(symbol)
-        exchange = validate_exchange(exchange, supported=set(RELIABLE_FUTURES_EXCHANGES.keys()))
-
-        ex = _get_exchange(exchange)
-        formatted_symbol = _format_symbol(symbol)
+    symbol = validate_symbol(symbol)
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
 
-        if current_price is None:
-            ticker = ex.fetch_ticker(formatted_symbol)
-            current_price = ticker['last']
+    return await _liquidation_report(exchange, _format_symbol(symbol), current_price)
 
-        # Common leverages
-        leverages = [5, 10, 20, 50, 100]
 
-        liquidation_levels = {
-            "longs": {},
-            "shorts": {}
-        }
+async def _report_or_none(report, *args) -> Optional[Dict[str, Any]]:
+    """
+    Run a report helper for a composite tool.
 
-        for lev in leverages:
-            # LONG liquidation: price * (1 - 1/leverage - fees)
-            long_liq = current_price * (1 - (1/lev) - 0.005)
-            liquidation_levels["longs"][f"{lev}x"] = round(long_liq, 2)
-
-            # SHORT liquidation: price * (1 + 1/leverage + fees)
-            short_liq = current_price * (1 + (1/lev) + 0.005)
-            liquidation_levels["shorts"][f"{lev}x"] = round(short_liq, 2)
-
-        # Critical zones (where most liquidity accumulates)
-        critical_zones = {
-            "long_liquidations": {
-                "10x_zone": f"${round(liquidation_levels['longs']['10x'], 0)} (10x leverage)",
-                "20x_zone": f"${round(liquidation_levels['longs']['20x'], 0)} (20x leverage)"
-            },
-            "short_liquidations": {
-                "10x_zone": f"${round(liquidation_levels['shorts']['10x'], 0)} (10x leverage)",
-                "20x_zone": f"${round(liquidation_levels['shorts']['20x'], 0)} (20x leverage)"
-            }
-        }
+    Failed reports (exceptions or success=False responses) are logged and
+    return None, so one unavailable data source does not fail the whole tool.
+    """
+    try:
+        result = await report(*args)
+    except Exception:
+        logger.exception("%s failed", report.__name__)
+        return None
+    return result if result.get('success') else None
 
-        return {
-            "success": True,
-            "exchange": exchange,
-            "symbol": formatted_symbol,
-            "current_price": current_price,
-            "liquidation_levels": liquidation_levels,
-            "critical_zones": critical_zones,
-            "interpretation": "Liquidation zones are price magnets - High probability of hunting"
-        }
 
-    except Exception as e:
-        logger.exception("calculate_liquidation_levels failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
-        }
+def _without_raw_data(report: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Copy of a report without its raw exchange response."""
+    if report is None:
+        return None
+    return {key: value for key, value in report.items() if key != 'raw_data'}
 
 
 @mcp.tool()
-def get_perpetual_stats(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def get_perpetual_stats(
     symbol: str = "BTC",
-    exchange: str = "binance"
+    exchange: str = "binance",
+    include_raw: bool = False
 ) -> Dict[str, Any]:
     """
     Get complete perpetual statistics (funding rate, OI, ratios, liquidations).
@@ -610,105 +892,177 @@ def get_perpetual_stats(
     Args:
         symbol: Symbol (BTC, ETH, etc.)
         exchange: Exchange
+        include_raw: Keep each section's raw exchange response (default False)
 
     Returns:
         Complete perpetual analysis with scoring
     """
-    try:
-        symbol = validate_symbol(symbol)
-        exchange = validate_exchange(exchange, supported=set(RELIABLE_FUTURES_EXCHANGES.keys()))
-
-        funding = get_funding_rate(symbol, exchange)
-        oi = get_open_interest(symbol, exchange)
-
-        ls_ratio = None
-        if exchange == "binance":
-            ls_ratio = get_long_short_ratio(symbol, exchange)
-
-        taker_ratio = None
-        if exchange == "binance":
-            taker_ratio = get_taker_buy_sell_ratio(symbol, exchange)
-
-        current_price = oi.get('current_price') if oi.get('success') else None
-        liq_levels = calculate_liquidation_levels(symbol, exchange, current_price)
-
-        # Signal scoring (0-100)
-        score = 50  # Neutral
-        signals = []
-
-        # Funding rate analysis
-        if funding.get('success'):
-            annual_rate = funding['annual_rate_percentage']
-            if abs(annual_rate) > FUNDING_EXTREME_THRESHOLD:
-                if annual_rate > FUNDING_EXTREME_THRESHOLD:
-                    score -= SCORE_FUNDING_EXTREME
-                    signals.append("Extremely high funding - Correction risk")
-                else:
-                    score += SCORE_FUNDING_EXTREME
-                    signals.append("Extremely low funding - Possible bounce")
-
-        # Long/Short ratio analysis
-        if ls_ratio and ls_ratio.get('success'):
-            ratio = ls_ratio['top_trader_long_short_ratio']
-            if ratio > LS_EXTREMELY_BULLISH:
-                score -= SCORE_LS_RATIO
-                signals.append("Top traders very long - Crowded trade")
-            elif ratio < LS_EXTREMELY_BEARISH:
-                score += SCORE_LS_RATIO
-                signals.append("Top traders very short - Contrarian setup")
-
-        # Taker pressure analysis
-        if taker_ratio and taker_ratio.get('success'):
-            pressure = taker_ratio['market_pressure']
-            if pressure == "STRONG_BUY_PRESSURE":
-                score += SCORE_TAKER_PRESSURE
-                signals.append("Strong buy pressure")
-            elif pressure == "STRONG_SELL_PRESSURE":
-                score -= SCORE_TAKER_PRESSURE
-                signals.append("Strong sell pressure")
-
-        # Overall signal
-        if score >= 70:
-            overall_signal = "STRONG_BUY"
-        elif score >= 55:
-            overall_signal = "BUY"
-        elif score <= 30:
-            overall_signal = "STRONG_SELL"
-        elif score <= 45:
-            overall_signal = "SELL"
-        else:
-            overall_signal = "NEUTRAL"
+    symbol = validate_symbol(symbol)
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
+
+    formatted_symbol = _format_symbol(symbol)
+
+    async def open_interest_and_liquidations():
+        # Liquidation levels reuse the price fetched alongside open interest
+        oi = await _report_or_none(_open_interest_report, exchange, formatted_symbol)
+        current_price = oi['current_price'] if oi else None
+        return oi, await _report_or_none(_liquidation_report, exchange, formatted_symbol, current_price)
+
+    async def binance_only(report):
+        return await _report_or_none(report, symbol, "5m") if exchange == "binance" else None
+
+    # The sub-requests are independent, so they all run concurrently
+    funding, (oi, liq_levels), ls_ratio, taker_ratio = await asyncio.gather(
+        _report_or_none(_funding_rate_report, exchange, formatted_symbol),
+        open_interest_and_liquidations(),
+        binance_only(_long_short_ratio_report),
+        binance_only(_taker_ratio_report)
+    )
+
+    if not include_raw:
+        funding, oi, ls_ratio, taker_ratio = (
+            _without_raw_data(report) for report in (funding, oi, ls_ratio, taker_ratio)
+        )
+
+    # Signal scoring (0-100)
+    score = 50  # Neutral
+    signals = []
+
+    # Funding rate analysis
+    if funding:
+        annual_rate = funding['annual_rate_percentage']
+        if abs(annual_rate) > FUNDING_EXTREME_THRESHOLD:
+            if annual_rate > FUNDING_EXTREME_THRESHOLD:
+                score -= SCORE_FUNDING_EXTREME
+                signals.append("Extremely high funding - Correction risk")
+            else:
+                score += SCORE_FUNDING_EXTREME
+                signals.append("Extremely low funding - Possible bounce")
+
+    # Long/Short ratio analysis
+    if ls_ratio:
+        ratio = ls_ratio['top_trader_long_short_ratio']
+        if ratio > LS_EXTREMELY_BULLISH:
+            score -= SCORE_LS_RATIO
+            signals.append("Top traders very long - Crowded trade")
+        elif ratio < LS_EXTREMELY_BEARISH:
+            score += SCORE_LS_RATIO
+            signals.append("Top traders very short - Contrarian setup")
+
+    # Taker pressure analysis
+    if taker_ratio:
+        pressure = taker_ratio['market_pressure']
+        if pressure == "STRONG_BUY_PRESSURE":
+            score += SCORE_TAKER_PRESSURE
+            signals.append("Strong buy pressure")
+        elif pressure == "STRONG_SELL_PRESSURE":
+            score -= SCORE_TAKER_PRESSURE
+            signals.append("Strong sell pressure")
+
+    # Overall signal
+    if score >= 70:
+        overall_signal = "STRONG_BUY"
+    elif score >= 55:
+        overall_signal = "BUY"
+    elif score <= 30:
+        overall_signal = "STRONG_SELL"
+    elif score <= 45:
+        overall_signal = "SELL"
+    else:
+        overall_signal = "NEUTRAL"
+
+    return {
+        "success": True,
+        "exchange": exchange,
+        "symbol": symbol,
+        "timestamp": datetime.now().isoformat(),
+        "score": score,
+        "overall_signal": overall_signal,
+        "signals": signals,
+        "funding_rate_data": funding,
+        "open_interest_data": oi,
+        "long_short_ratio_data": ls_ratio,
+        "taker_ratio_data": taker_ratio,
+        "liquidation_levels": liq_levels
+    }
+
+
+async def _exchange_funding_report(exchange: str, formatted_symbol: str) -> Dict[str, Any]:
+    """Funding rate analysis for a caller-supplied exchange name."""
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
+    return await _funding_rate_report(exchange, formatted_symbol)
+
+
+async def _funding_comparison(symbol: str, exchanges: Optional[List[str]],
+                              include_detail: bool = False) -> Dict[str, Any]:
+    """
+    Funding rates of a validated symbol across exchanges, sorted, with the
+    spread. Each exchange's full funding report is included only on request.
+    """
+    if exchanges is None:
+        exchanges = list(RELIABLE_FUTURES_EXCHANGES.keys())
 
-        return {
-            "success": True,
-            "exchange": exchange,
-            "symbol": symbol,
-            "timestamp": datetime.now().isoformat(),
-            "score": score,
-            "overall_signal": overall_signal,
-            "signals": signals,
-            "funding_rate_data": funding if funding.get('success') else None,
-            "open_interest_data": oi if oi.get('success') else None,
-            "long_short_ratio_data": ls_ratio if ls_ratio and ls_ratio.get('success') else None,
-            "taker_ratio_data": taker_ratio if taker_ratio and taker_ratio.get('success') else None,
-            "liquidation_levels": liq_levels if liq_levels.get('success') else None
-        }
+    formatted_symbol = _format_symbol(symbol)
 
-    except Exception as e:
-        logger.exception("get_perpetual_stats failed")
+    # One request per exchange, all in flight at once, so the comparison
+    # takes as long as the slowest exchange rather than the sum
+    fundings = await asyncio.gather(
+        *(_report_or_none(_exchange_funding_report, exchange, formatted_symbol) for exchange in exchanges)
+    )
+
+    results = {}
+    rates = []
+
+    for exchange, funding in zip(exchanges, fundings):
+        if funding:
+            if include_detail:
+                results[exchange] = funding
+            rates.append({
+                'exchange': exchange,
+                'rate': funding['funding_rate'],
+                'annual_rate': funding['annual_rate_percentage']
+            })
+
+    if not rates:
         return {
             "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
+            "error": "Could not fetch funding rates from any exchange",
+            "error_type": "NoDataError"
         }
 
+    # all_rates is returned sorted anyway, so one in-place sort also yields
+    # both extremes (stable: ties keep exchange order)
+    rates.sort(key=itemgetter('rate'))
+
+    lowest = rates[0]
+    highest = rates[-1]
+    spread = highest['rate'] - lowest['rate']
+    spread_annual = spread * ANNUALIZATION_FACTOR
+
+    arbitrage_opportunity = spread_annual > MIN_ARBITRAGE_SPREAD_ANNUAL
+
+    return {
+        "success": True,
+        "symbol": symbol,
+        "timestamp": datetime.now().isoformat(),
+        "exchanges_compared": len(rates),
+        "lowest_funding": lowest,
+        "highest_funding": highest,
+        "spread": spread,
+        "spread_annual_percentage": round(spread_annual, 2),
+        "arbitrage_opportunity": arbitrage_opportunity,
+        "arbitrage_strategy": "Long on exchange with lowest funding, Short on exchange with highest funding" if arbitrage_opportunity else None,
+        "all_rates": rates,
+        **({"detailed_data": results} if include_detail else {})
+    }
+
 
 @mcp.tool()
-def compare_funding_rates(
+@tool_errors('symbol', envelope='success')
+async def compare_funding_rates(
     symbol: str = "BTC",
-    exchanges: List[str] = None
+    exchanges: List[str] = None,
+    include_detail: bool = False
 ) -> Dict[str, Any]:
     """
     Compare funding rates across multiple exchanges.
@@ -716,75 +1070,98 @@ def compare_funding_rates(
     Args:
         symbol: Symbol (BTC, ETH, etc.)
         exchanges: List of exchanges (default: all supported)
+        include_detail: Include each exchange's full funding report (default: False)
 
     Returns:
         Funding rate comparison with arbitrage detection
     """
-    if exchanges is None:
-        exchanges = list(RELIABLE_FUTURES_EXCHANGES.keys())
+    symbol = validate_symbol(symbol)
 
-    try:
-        symbol = validate_symbol(symbol)
-
-        results = {}
-        rates = []
-
-        for exchange in exchanges:
-            try:
-                funding = get_funding_rate(symbol, exchange)
-                if funding.get('success'):
-                    results[exchange] = funding
-                    rates.append({
-                        'exchange': exchange,
-                        'rate': funding['funding_rate'],
-                        'annual_rate': funding['annual_rate_percentage']
-                    })
-            except Exception:
-                continue
+    return await _funding_comparison(symbol, exchanges, include_detail)
+
+
+@njit(cache=True)
+def _funding_window_kernel(rates: np.ndarray):
+    """
+    Numba kernel: means of the last 4 and the 4 before them, and the sample
+    stdev of those 8 rates, in one pass (Welford's algorithm).
+    """
+    start = rates.shape[0] - 8
+    older_sum = 0.0
+    recent_sum = 0.0
+    mean = 0.0
+    sq_dev = 0.0
+    for i in range(8):
+        rate = rates[start + i]
+        if i < 4:
+            older_sum += rate
+        else:
+            recent_sum += rate
+        delta = rate - mean
+        mean += delta / (i + 1)
+        sq_dev += delta * (rate - mean)
+    return recent_sum / 4, older_sum / 4, np.sqrt(sq_dev / 7)
 
-        if not rates:
-            return {
-                "success": False,
-                "error": "Could not fetch funding rates from any exchange",
-                "error_type": "NoDataError"
-            }
 
-        rates_sorted = sorted(rates, key=lambda x: x['rate'])
+def _funding_window(rates: np.ndarray) -> Tuple[float, float, float]:
+    """Helper: (recent 4 mean, older 4 mean, stdev of the last 8) funding rates."""
+    if NUMBA_AVAILABLE:
+        recent_4, older_4, volatility = _funding_window_kernel(rates)
+        return float(recent_4), float(older_4), float(volatility)
+    window = rates[-8:]
+    return float(window[4:].mean()), float(window[:4].mean()), float(window.std(ddof=1))
 
-        lowest = rates_sorted[0]
-        highest = rates_sorted[-1]
-        spread = highest['rate'] - lowest['rate']
-        spread_annual = spread * 3 * 365 * 100
 
-        arbitrage_opportunity = spread_annual > MIN_ARBITRAGE_SPREAD_ANNUAL
+@njit(cache=True)
+def _funding_extremes_kernel(rates: np.ndarray):
+    """
+    Numba kernel: per row of a (symbol x exchange) rate matrix, the column of
+    the first lowest and the last highest rate, skipping NaN (-1 if all NaN).
+    """
+    n_rows, n_cols = rates.shape
+    low_idx = np.full(n_rows, -1, dtype=np.int64)
+    high_idx = np.full(n_rows, -1, dtype=np.int64)
+    for i in range(n_rows):
+        low = 0.0
+        high = 0.0
+        for j in range(n_cols):
+            rate = rates[i, j]
+            if np.isnan(rate):
+                continue
+            if low_idx[i] < 0 or rate < low:
+                low = rate
+                low_idx[i] = j
+            if high_idx[i] < 0 or rate >= high:
+                high = rate
+                high_idx[i] = j
+    return low_idx, high_idx
 
-        return {
-            "success": True,
-            "symbol": symbol,
-            "timestamp": datetime.now().isoformat(),
-            "exchanges_compared": len(rates),
-            "lowest_funding": lowest,
-            "highest_funding": highest,
-            "spread": spread,
-            "spread_annual_percentage": round(spread_annual, 2),
-            "arbitrage_opportunity": arbitrage_opportunity,
-            "arbitrage_strategy": "Long on exchange with lowest funding, Short on exchange with highest funding" if arbitrage_opportunity else None,
-            "all_rates": rates_sorted,
-            "detailed_data": results
-        }
 
-    except Exception as e:
-        logger.exception("compare_funding_rates failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+def _funding_extremes(rates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Helper: columns of the lowest and highest rate per row (-1 for rows
+    without any rate). Ties pick the first lowest and the last highest
+    exchange, as compare_funding_rates' stable sort does.
+    """
+    if NUMBA_AVAILABLE:
+        return _funding_extremes_kernel(rates)
+    fetched = ~np.isnan(rates).all(axis=1)
+    low_idx = np.full(rates.shape[0], -1, dtype=np.int64)
+    high_idx = np.full(rates.shape[0], -1, dtype=np.int64)
+    low_idx[fetched] = np.nanargmin(rates[fetched], axis=1)
+    high_idx[fetched] = rates.shape[1] - 1 - np.nanargmax(rates[fetched, ::-1], axis=1)
+    return low_idx, high_idx
+
+
+def warm_kernels():
+    """Compile (or load from Numba's disk cache) the kernels with the array layouts the tools pass"""
+    _funding_window_kernel(np.ones(8))
+    _funding_extremes_kernel(np.ones((1, len(RELIABLE_FUTURES_EXCHANGES))))
 
 
 @mcp.tool()
-def analyze_funding_trend(
+@tool_errors('exchange', 'symbol', envelope='success')
+async def analyze_funding_trend(
     symbol: str = "BTC",
     exchange: str = "binance",
     hours: int = 48
@@ -800,81 +1177,146 @@ def analyze_funding_trend(
     Returns:
         Trend analysis with next funding prediction
     """
-    try:
-        symbol = validate_symbol(symbol)
-        exchange = validate_exchange(exchange, supported=set(RELIABLE_FUTURES_EXCHANGES.keys()))
-        hours = validate_positive_int(hours, "hours", max_value=720)
-
-        history = get_funding_rate_history(symbol, exchange, hours)
-
-        if not history.get('success'):
-            return history
-
-        rates = [h['fundingRate'] for h in history['history']]
-
-        if len(rates) >= 8:
-            recent_4 = statistics.mean(rates[-4:])
-            older_4 = statistics.mean(rates[-8:-4])
-
-            change_pct = ((recent_4 - older_4) / abs(older_4)) * 100 if older_4 != 0 else 0
-
-            if change_pct > TREND_RAPID_INCREASE_PCT:
-                trend = "RAPIDLY_INCREASING"
-                interpretation = "Funding rising rapidly - Market overheating"
-            elif change_pct > TREND_INCREASE_PCT:
-                trend = "INCREASING"
-                interpretation = "Funding increasing - Longs dominating"
-            elif change_pct < TREND_RAPID_DECREASE_PCT:
-                trend = "RAPIDLY_DECREASING"
-                interpretation = "Funding dropping rapidly - Capitulation"
-            elif change_pct < TREND_DECREASE_PCT:
-                trend = "DECREASING"
-                interpretation = "Funding decreasing - Shorts dominating"
-            else:
-                trend = "STABLE"
-                interpretation = "Stable funding - Balanced market"
-        else:
-            trend = "INSUFFICIENT_DATA"
-            interpretation = "Not enough data for trend analysis"
-            change_pct = 0
-
-        # Funding volatility
-        if len(rates) >= 8:
-            volatility = statistics.stdev(rates[-8:])
-            vol_label = "HIGH" if volatility > FUNDING_VOL_HIGH else "MODERATE" if volatility > FUNDING_VOL_MODERATE else "LOW"
+    symbol = validate_symbol(symbol)
+    exchange = validate_exchange(exchange, supported=_SUPPORTED_EXCHANGES)
+    hours = validate_positive_int(hours, "hours", max_value=720)
+
+    history = await _funding_history_report(exchange, _format_symbol(symbol), hours, include_history=True)
+
+    if not history.get('success'):
+        return history
+
+    rates = np.fromiter((h['fundingRate'] for h in history['history']), dtype=np.float64,
+                        count=len(history['history']))
+
+    if len(rates) >= 8:
+        recent_4, older_4, volatility = _funding_window(rates)
+
+        change_pct = ((recent_4 - older_4) / abs(older_4)) * 100 if older_4 != 0 else 0
+
+        if change_pct > TREND_RAPID_INCREASE_PCT:
+            trend = "RAPIDLY_INCREASING"
+            interpretation = "Funding rising rapidly - Market overheating"
+        elif change_pct > TREND_INCREASE_PCT:
+            trend = "INCREASING"
+            interpretation = "Funding increasing - Longs dominating"
+        elif change_pct < TREND_RAPID_DECREASE_PCT:
+            trend = "RAPIDLY_DECREASING"
+            interpretation = "Funding dropping rapidly - Capitulation"
+        elif change_pct < TREND_DECREASE_PCT:
+            trend = "DECREASING"
+            interpretation = "Funding decreasing - Shorts dominating"
         else:
-            volatility = 0
-            vol_label = "UNKNOWN"
-
+            trend = "STABLE"
+            interpretation = "Stable funding - Balanced market"
+    else:
+        trend = "INSUFFICIENT_DATA"
+        interpretation = "Not enough data for trend analysis"
+        change_pct = 0
+
+    # Funding volatility
+    if len(rates) >= 8:
+        vol_label = "HIGH" if volatility > FUNDING_VOL_HIGH else "MODERATE" if volatility > FUNDING_VOL_MODERATE else "LOW"
+    else:
+        volatility = 0
+        vol_label = "UNKNOWN"
+
+    return {
+        "success": True,
+        "exchange": exchange,
+        "symbol": symbol,
+        "period_hours": hours,
+        "trend": trend,
+        "change_percentage": round(change_pct, 2),
+        "interpretation": interpretation,
+        "volatility": volatility,
+        "volatility_label": vol_label,
+        "current_rate": float(rates[-1]),
+        "average_rate": history['average_rate'],
+        "max_rate": history['max_rate'],
+        "min_rate": history['min_rate']
+    }
+
+
+# Fixed parts of an arbitrage report, built once. The tuples go into every
+# response as-is (immutable, so no caller can alter the next response); the
+# strategy fields are copied next to the per-call ones.
+_ARBITRAGE_STRATEGY_STATIC = {
+    "action": "FUNDING_RATE_ARBITRAGE",
+    "hedge_ratio": "1:1 (delta neutral)",
+    "risk": "Exchange risk, liquidation risk, funding convergence"
+}
+_ARBITRAGE_CLOSING_STEPS = (
+    "4. Keep positions balanced (delta neutral)",
+    "5. Close when spread decreases or is no longer profitable"
+)
+_ARBITRAGE_WARNINGS = (
+    "Requires collateral on both exchanges",
+    "Liquidation risk if price moves significantly",
+    "Funding rates can converge quickly",
+    "Trading fees may reduce profit"
+)
+
+
+def _arbitrage_opportunity(symbol: str, spread_annual: float, long_exchange: str, long_rate: float,
+                           short_exchange: str, short_rate: float) -> Dict[str, Any]:
+    """Arbitrage report for a symbol whose funding spread clears the threshold."""
+    # Estimated profit (assuming 8 hours per funding, 3 times per day)
+    profit_per_funding = short_rate - long_rate
+    daily_profit_pct = profit_per_funding * DAILY_PERCENT_FACTOR
+
+    return {
+        "success": True,
+        "symbol": symbol,
+        "arbitrage_opportunity": True,
+        "spread_annual_percentage": spread_annual,
+        "estimated_daily_profit_percentage": round(daily_profit_pct, 4),
+        "strategy": {
+            **_ARBITRAGE_STRATEGY_STATIC,
+            "long_exchange": long_exchange,
+            "long_funding_rate": long_rate,
+            "short_exchange": short_exchange,
+            "short_funding_rate": short_rate
+        },
+        "execution_steps": (
+            f"1. Deposit collateral on {long_exchange} and {short_exchange}",
+            f"2. Open LONG on {long_exchange} (funding rate: {long_rate:.6f})",
+            f"3. Open SHORT on {short_exchange} (funding rate: {short_rate:.6f})",
+            *_ARBITRAGE_CLOSING_STEPS
+        ),
+        "warnings": _ARBITRAGE_WARNINGS
+    }
+
+
+async def _arbitrage_report(symbol: str, min_spread_annual: float) -> Dict[str, Any]:
+    """Funding arbitrage analysis for a validated symbol."""
+    comparison = await _funding_comparison(symbol, None)
+
+    if not comparison.get('success'):
+        return comparison
+
+    spread_annual = comparison['spread_annual_percentage']
+
+    if spread_annual < min_spread_annual:
         return {
             "success": True,
-            "exchange": exchange,
             "symbol": symbol,
-            "period_hours": hours,
-            "trend": trend,
-            "change_percentage": round(change_pct, 2),
-            "interpretation": interpretation,
-            "volatility": volatility,
-            "volatility_label": vol_label,
-            "current_rate": rates[-1],
-            "average_rate": history['average_rate'],
-            "max_rate": history['max_rate'],
-            "min_rate": history['min_rate']
+            "arbitrage_opportunity": False,
+            "spread_annual_percentage": spread_annual,
+            "min_required_spread": min_spread_annual,
+            "message": f"Current spread ({spread_annual:.2f}%) below minimum required ({min_spread_annual}%)"
         }
 
-    except Exception as e:
-        logger.exception("analyze_funding_trend failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "exchange": exchange,
-            "symbol": symbol
-        }
+    lowest = comparison['lowest_funding']
+    highest = comparison['highest_funding']
+
+    return _arbitrage_opportunity(symbol, spread_annual, lowest['exchange'], lowest['rate'],
+                                  highest['exchange'], highest['rate'])
 
 
 @mcp.tool()
-def detect_funding_arbitrage(
+@tool_errors('symbol', envelope='success')
+async def detect_funding_arbitrage(
     symbol: str = "BTC",
     min_spread_annual: float = 10.0
 ) -> Dict[str, Any]:
@@ -890,71 +1332,94 @@ def detect_funding_arbitrage(
     Returns:
         Arbitrage opportunities with spread and recommended strategy
     """
-    try:
-        symbol = validate_symbol(symbol)
+    symbol = validate_symbol(symbol)
 
-        comparison = compare_funding_rates(symbol)
+    return await _arbitrage_report(symbol, min_spread_annual)
 
-        if not comparison.get('success'):
-            return comparison
 
-        spread_annual = comparison['spread_annual_percentage']
+async def _funding_rate_value(exchange: str, formatted_symbol: str) -> float:
+    """Current funding rate of a market, or NaN if it could not be fetched."""
+    try:
+        return float((await _fetch_funding_rate(exchange, formatted_symbol))['fundingRate'])
+    except Exception:
+        logger.exception("Funding rate %s %s failed", exchange, formatted_symbol)
+        return np.nan
 
-        if spread_annual < min_spread_annual:
-            return {
-                "success": True,
-                "symbol": symbol,
-                "arbitrage_opportunity": False,
-                "spread_annual_percentage": spread_annual,
-                "min_required_spread": min_spread_annual,
-                "message": f"Current spread ({spread_annual:.2f}%) below minimum required ({min_spread_annual}%)"
-            }
 
-        lowest = comparison['lowest_funding']
-        highest = comparison['highest_funding']
+@mcp.tool()
+@tool_errors('symbols', envelope='success')
+async def detect_funding_arbitrage_batch(
+    symbols: List[str],
+    min_spread_annual: float = 10.0
+) -> Dict[str, Any]:
+    """
+    Scan several symbols for funding rate arbitrage in one call.
 
-        # Estimated profit (assuming 8 hours per funding, 3 times per day)
-        profit_per_funding = comparison['spread']
-        daily_profit_pct = profit_per_funding * 3 * 100
+    Every (symbol, exchange) funding request is in flight at once, paced by
+    the per-exchange rate limiters, so a scan takes about as long as its
+    slowest exchange rather than one detect_funding_arbitrage per symbol.
+    Spreads are computed on the (symbol x exchange) rate matrix at once;
+    full reports are built only for the symbols that clear the threshold.
 
-        return {
-            "success": True,
-            "symbol": symbol,
-            "arbitrage_opportunity": True,
-            "spread_annual_percentage": spread_annual,
-            "estimated_daily_profit_percentage": round(daily_profit_pct, 4),
-            "strategy": {
-                "action": "FUNDING_RATE_ARBITRAGE",
-                "long_exchange": lowest['exchange'],
-                "long_funding_rate": lowest['rate'],
-                "short_exchange": highest['exchange'],
-                "short_funding_rate": highest['rate'],
-                "hedge_ratio": "1:1 (delta neutral)",
-                "risk": "Exchange risk, liquidation risk, funding convergence"
-            },
-            "execution_steps": [
-                f"1. Deposit collateral on {lowest['exchange']} and {highest['exchange']}",
-                f"2. Open LONG on {lowest['exchange']} (funding rate: {lowest['rate']:.6f})",
-                f"3. Open SHORT on {highest['exchange']} (funding rate: {highest['rate']:.6f})",
-                "4. Keep positions balanced (delta neutral)",
-                "5. Close when spread decreases or is no longer profitable"
-            ],
-            "warnings": [
-                "Requires collateral on both exchanges",
-                "Liquidation risk if price moves significantly",
-                "Funding rates can converge quickly",
-                "Trading fees may reduce profit"
-            ]
-        }
+    Args:
+        symbols: Symbols to scan (BTC, ETH, etc.), at most 50
+        min_spread_annual: Minimum annualized spread to consider arbitrage (%)
 
-    except Exception as e:
-        logger.exception("detect_funding_arbitrage failed")
-        return {
-            "success": False,
-            "error": str(e),
-            "error_type": type(e).__name__,
-            "symbol": symbol
-        }
+    Returns:
+        Opportunities sorted by annualized spread (highest first), the
+        symbols below the threshold, and per-symbol errors
+    """
+    if not isinstance(symbols, list) or not symbols:
+        raise ValueError("symbols must be a non-empty list")
+    if len(symbols) > ARBITRAGE_BATCH_MAX_SYMBOLS:
+        raise ValueError(f"symbols cannot contain more than {ARBITRAGE_BATCH_MAX_SYMBOLS} entries")
+    symbols = list(dict.fromkeys(validate_symbol(symbol) for symbol in symbols))
+
+    exchanges = list(RELIABLE_FUTURES_EXCHANGES.keys())
+    values = await asyncio.gather(
+        *(_funding_rate_value(exchange, _format_symbol(symbol)) for symbol in symbols for exchange in exchanges)
+    )
+    rates = np.array(values, dtype=np.float64).reshape(len(symbols), len(exchanges))
+
+    low_idx, high_idx = _funding_extremes(rates)
+    missing = low_idx < 0  # No exchange returned a rate
+    fetched = np.flatnonzero(~missing)
+    low_idx = low_idx[fetched]
+    high_idx = high_idx[fetched]
+    low_rates = rates[fetched, low_idx]
+    high_rates = rates[fetched, high_idx]
+    # Rounded with Python's round(), like detect_funding_arbitrage, so both
+    # tools agree on the threshold (np.round can differ on ties)
+    spreads = (high_rates - low_rates) * ANNUALIZATION_FACTOR
+    spread_annual = np.array([round(spread, 2) for spread in spreads.tolist()])
+    is_opportunity = spread_annual >= min_spread_annual
+
+    opportunities = [
+        _arbitrage_opportunity(symbols[fetched[i]], float(spread_annual[i]),
+                               exchanges[low_idx[i]], float(low_rates[i]),
+                               exchanges[high_idx[i]], float(high_rates[i]))
+        for i in np.flatnonzero(is_opportunity)
+    ]
+    below_threshold = [
+        {'symbol': symbols[fetched[i]], 'spread_annual_percentage': float(spread_annual[i])}
+        for i in np.flatnonzero(~is_opportunity)
+    ]
+    errors = {
+        symbols[i]: "Could not fetch funding rates from any exchange"
+        for i in np.flatnonzero(missing)
+    }
+
+    opportunities.sort(key=itemgetter('spread_annual_percentage'), reverse=True)
+
+    return {
+        "success": True,
+        "symbols_scanned": len(symbols),
+        "min_required_spread": min_spread_annual,
+        "opportunities_found": len(opportunities),
+        "opportunities": opportunities,
+        "below_threshold": below_threshold,
+        "errors": errors if errors else None
+    }
 
 
 if __name__ == "__main__":
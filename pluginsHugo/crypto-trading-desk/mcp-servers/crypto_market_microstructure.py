@@ -62,6 +62,14 @@ def _get_exchange(exchange_name: str):
     return EXCHANGES.get(exchange_name, EXCHANGES['binance'])
 
 
+def _book_columns(levels: List[list]) -> tuple:
+    """Helper: (prices, volumes) float64 arrays of one orderbook side."""
+    book = np.asarray(levels, dtype=np.float64)
+    if book.size == 0:
+        return np.empty(0), np.empty(0)
+    return book[:, 0], book[:, 1]
+
+
 @mcp.tool()
 def analyze_orderbook_depth(
     symbol: str = "BTC",
@@ -96,11 +104,13 @@ def analyze_orderbook_depth(
         best_ask = asks[0][0] if asks else 0
         mid_price = (best_bid + best_ask) / 2
 
-        # Total liquidity
-        total_bid_volume = sum(bid[1] for bid in bids)
-        total_ask_volume = sum(ask[1] for ask in asks)
-        total_bid_value = sum(bid[0] * bid[1] for bid in bids)
-        total_ask_value = sum(ask[0] * ask[1] for ask in asks)
+        # Total liquidity (value = price . volume, one dot product per side)
+        bid_prices, bid_volumes = _book_columns(bids)
+        ask_prices, ask_volumes = _book_columns(asks)
+        total_bid_volume = float(bid_volumes.sum())
+        total_ask_volume = float(ask_volumes.sum())
+        total_bid_value = float(bid_prices @ bid_volumes)
+        total_ask_value = float(ask_prices @ ask_volumes)
 
         # Liquidity ratio
         liquidity_ratio = total_bid_volume / total_ask_volume if total_ask_volume > 0 else 0
@@ -110,8 +120,8 @@ def analyze_orderbook_depth(
         spread_percentage = (spread_absolute / mid_price) * 100 if mid_price > 0 else 0
 
         # Liquidity concentration (% in top 10 levels)
-        top10_bid_volume = sum(bid[1] for bid in bids[:10])
-        top10_ask_volume = sum(ask[1] for ask in asks[:10])
+        top10_bid_volume = float(bid_volumes[:10].sum())
+        top10_ask_volume = float(ask_volumes[:10].sum())
         bid_concentration = (top10_bid_volume / total_bid_volume) * 100 if total_bid_volume > 0 else 0
         ask_concentration = (top10_ask_volume / total_ask_volume) * 100 if total_ask_volume > 0 else 0
 
@@ -228,10 +238,12 @@ def detect_orderbook_imbalance(
         # Calculate volume at different levels
         levels = [5, 10, 20]
         imbalances = {}
+        _, bid_volumes = _book_columns(bids)
+        _, ask_volumes = _book_columns(asks)
 
         for level in levels:
-            bid_vol = sum(b[1] for b in bids[:level])
-            ask_vol = sum(a[1] for a in asks[:level])
+            bid_vol = float(bid_volumes[:level].sum())
+            ask_vol = float(ask_volumes[:level].sum())
             imbalance = bid_vol / ask_vol if ask_vol > 0 else 10
             imbalances[f"level_{level}"] = round(imbalance, 2)
 